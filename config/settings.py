@@ -168,7 +168,57 @@ BATCH_CONFIG = {
     'batch_size': int(os.getenv('BATCH_SIZE', '20')),
     'delay_minutes': int(os.getenv('BATCH_DELAY_MINUTES', '1')),
     'progress_file': PROGRESS_DIR / 'batch_progress.json',
-    'last_run_file': PROGRESS_DIR / 'last_run.json'  # NEW: Track last run times
+    'last_run_file': PROGRESS_DIR / 'last_run.json',  # NEW: Track last run times
+    
+    # Per-file size/mtime of SCRAPED_DIR, so unchanged files are not re-parsed
+    # (JSON dedupe backend; the SQLite store tracks imported files itself)
+    'manifest_file': PROGRESS_DIR / 'scraped_manifest.json',
+    
+    # Per-file URL digests (one DigestSet file per scraped file)
+    'file_digest_dir': PROGRESS_DIR / 'scraped_digests',
+    
+    # Union of the manifest's URL digests, memory-mapped at startup
+    'digest_file': PROGRESS_DIR / 'scraped_digests.bin'
+}
+
+
+# ============================================================================
+# SCRAPED DATA STORAGE
+# ============================================================================
+
+SCRAPED_STORAGE_CONFIG = {
+    # 'partitioned' = append new items to per-scraper, per-month .jsonl.gz files
+    # 'json'        = legacy timestamped JSON file in data/scraped per run
+    'format': os.getenv('SCRAPED_STORAGE_FORMAT', 'partitioned').lower(),
+    
+    'partitions_dir': DATA_DIR / 'partitions',
+}
+
+
+# ============================================================================
+# DEDUPE STORE CONFIGURATION
+# ============================================================================
+
+DEDUPE_CONFIG = {
+    # 'sqlite' = one indexed SQLite database for all trackers
+    # 'json'   = legacy per-tracker JSON files loaded into memory
+    'backend': os.getenv('DEDUPE_BACKEND', 'sqlite').lower(),
+    
+    'db_file': STORAGE_DIR / 'dedupe.sqlite3',
+    
+    # Seconds to wait on a locked database before giving up
+    'busy_timeout': int(os.getenv('DEDUPE_BUSY_TIMEOUT', '30')),
+    
+    # Legacy tracker files imported once into the store (source -> files).
+    # BatchProcessor imports its own progress files under canonical URL keys.
+    'legacy_files': {
+        'usatoday': [SCRAPED_DIR / 'usatoday_sent_urls.json', SCRAPED_DIR / 'usatoday_sent_urls.journal'],
+        'breachsense': [SCRAPED_DIR / 'breachsense_sent_urls.json'],
+        'breach_monitoring': [SCRAPED_DIR / 'breach_monitoring_sent_urls.json'],
+        'ransomware': [SCRAPED_DIR / 'ransomware_sent_urls.json'],
+        'slfla': [SCRAPED_DIR / 'slfla_sent_urls.json'],
+        'classaction': [DATA_DIR / 'classaction_tracking.json'],
+    },
 }
 
 
@@ -226,6 +276,14 @@ SCRAPER_CONFIG = {
     'request_delay': int(os.getenv('REQUEST_DELAY', '1')),
     'max_retries': int(os.getenv('MAX_RETRIES', '3')),
     'timeout': int(os.getenv('REQUEST_TIMEOUT', '30')),
+    
+    # AsyncBaseScraper: requests in flight at once, overall and per host
+    'max_concurrent_requests': int(os.getenv('MAX_CONCURRENT_REQUESTS', '10')),
+    'per_host_concurrency': int(os.getenv('PER_HOST_CONCURRENCY', '2')),
+    
+    # Scrapers get their own requests.Session on one process-wide connection pool
+    'share_pool': os.getenv('SHARE_HTTP_POOL', 'true').lower() == 'true',
+    'pool_maxsize': int(os.getenv('HTTP_POOL_MAXSIZE', '20')),
     'user_agent': os.getenv('USER_AGENT', 
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     ),
@@ -235,6 +293,65 @@ SCRAPER_CONFIG = {
 }
 
 
+# ============================================================================
+# URL CANONICALIZATION
+# ============================================================================
+
+URL_CANONICAL_CONFIG = {
+    # Query parameters that never identify content (prefix match when ending in '*')
+    'tracking_params': [
+        'utm_*', 'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+        '_ga', '_gl', 'igshid', 'ref', 'ref_src', 'share', 'via', 's_cid', 'cmpid',
+    ],
+    
+    # Per-domain overrides (matched on the host without 'www.', subdomains included):
+    #   keep_params   - only these query parameters identify content (None = all non-tracking)
+    #   keep_fragment - the #fragment identifies content (single-page tables)
+    'domain_rules': {
+        'data.usatoday.com': {'keep_params': [], 'keep_fragment': True},
+        'youtube.com': {'keep_params': ['v']},
+        'theatlantic.com': {'keep_params': []},
+        'reginfo.gov': {'keep_params': ['pubId', 'RIN']},
+    },
+}
+
+
+# ============================================================================
+# ORCHESTRATOR CONFIGURATION
+# ============================================================================
+
+ORCHESTRATOR_CONFIG = {
+    # Scrapers run at the same time by run_all_scrapers (1 = one after another)
+    'max_workers': int(os.getenv('SCRAPER_MAX_WORKERS', '4')),
+    
+    # Scrapers allowed to hit the same domain at once
+    'per_domain_limit': int(os.getenv('SCRAPER_PER_DOMAIN_LIMIT', '1')),
+}
+
+
+# ============================================================================
+# SCRAPER BUDGETS
+# ============================================================================
+# Every scraper gets these defaults, so the daily job fits its cron window
+# as sources are added; a registry entry's 'budget' dict ('max_seconds',
+# 'max_requests', 'max_bytes') overrides them, 0 or None means unlimited
+
+BUDGET_CONFIG = {
+    'defaults': {
+        'max_seconds': float(os.getenv('SCRAPER_MAX_SECONDS', '900')),
+        'max_requests': int(os.getenv('SCRAPER_MAX_REQUESTS', '1000')),
+        'max_bytes': int(os.getenv('SCRAPER_MAX_BYTES', str(200 * 1024 * 1024))),
+    },
+    
+    # Wall-clock window for a whole run_all_scrapers pass (0 = none); no
+    # scraper's time budget extends past it
+    'run_window_seconds': float(os.getenv('SCRAPER_RUN_WINDOW_SECONDS', '5400')),
+    
+    # Seconds an isolated scraper may overrun its time budget before it is killed
+    'overrun_seconds': float(os.getenv('SCRAPER_BUDGET_OVERRUN_SECONDS', '120')),
+}
+
+
 # ============================================================================
 # SCRAPER REGISTRY
 # ============================================================================
@@ -411,7 +528,9 @@ BREACHSENSE_REGISTRY = {
             'class': 'BreachsenseScraper',
             'module': 'scrapers.legal_resources.breachsense',
             'enabled': True,
-            'description': 'Data breach monitoring'
+            'description': 'Data breach monitoring',
+            # Selenium scraper: a hung Chrome is killed with its process group
+            'isolated': True
         }
     }
 }
@@ -424,11 +543,216 @@ USATODAY_REGISTRY = {
             'class': 'USATodayBreachesScraper',
             'module': 'scrapers.legal_resources.usatoday_breaches',
             'enabled': True,
-            'description': 'Healthcare data breaches'
+            'description': 'Healthcare data breaches',
+            # Selenium scraper: a hung Chrome is killed with its process group.
+            # USATODAY_ISOLATED=false runs it in-process on the warm DriverPool
+            # instead, without the hard deadline or memory ceiling
+            'isolated': os.getenv('USATODAY_ISOLATED', 'true').lower() == 'true',
+            'timeout_seconds': 1800,
+            'memory_limit_mb': 3072,
+            'budget': {'max_seconds': 1200, 'max_requests': 50}
         }
     }
 }
 
+# ============================================================================
+# PAGE SNAPSHOT CONFIGURATION
+# ============================================================================
+
+SNAPSHOT_CONFIG = {
+    # 'off', 'record' (save every page_source) or 'replay' (parse saved pages, no browser)
+    'mode': os.getenv('SNAPSHOT_MODE', 'off'),
+    
+    # Root directory for recordings: <dir>/<scraper_key>/<timestamp>/
+    'dir': Path(os.getenv('SNAPSHOT_DIR', str(DATA_DIR / 'snapshots'))),
+    
+    # Recording run to replay (empty: latest recording for the scraper)
+    'replay_dir': os.getenv('SNAPSHOT_REPLAY_DIR', ''),
+}
+
+
+# ============================================================================
+# SELENIUM DRIVER CONFIGURATION
+# ============================================================================
+
+DRIVER_CONFIG = {
+    # 'lean' loads pages eagerly and blocks heavy/third-party requests,
+    # 'full' loads everything like a normal browser
+    'profile': os.getenv('DRIVER_PROFILE', 'lean'),
+    
+    # Lean profile: return once the DOM is ready instead of waiting for subresources
+    'page_load_strategy': 'eager',
+    'block_images': True,
+    
+    # Resource types blocked through Network.setBlockedURLs
+    'blocked_resource_patterns': [
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+        '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+        '*.mp4', '*.webm', '*.m3u8', '*.mp3',
+    ],
+    
+    # Ad, analytics and tracking hosts blocked outright
+    'blocked_domains': [
+        'doubleclick.net',
+        'googlesyndication.com',
+        'googletagmanager.com',
+        'googletagservices.com',
+        'google-analytics.com',
+        'amazon-adsystem.com',
+        'adnxs.com',
+        'criteo.com',
+        'taboola.com',
+        'outbrain.com',
+        'scorecardresearch.com',
+        'chartbeat.com',
+        'chartbeat.net',
+        'moatads.com',
+        'facebook.net',
+        'hotjar.com',
+        'newrelic.com',
+        'nr-data.net',
+        'optimizely.com',
+        'permutive.com',
+        'tiqcdn.com',
+    ],
+    
+    # Domains never blocked, even if listed above (comma-separated in env)
+    'allowed_domains': [
+        domain.strip()
+        for domain in os.getenv('DRIVER_ALLOWED_DOMAINS', 'usatoday.com,gannett-cdn.com').split(',')
+        if domain.strip()
+    ],
+}
+
+
+# Warm browsers shared between Selenium scrapers within one process
+DRIVER_POOL_CONFIG = {
+    'enabled': os.getenv('DRIVER_POOL_ENABLED', 'true').lower() == 'true',
+    
+    # Maximum number of live browsers
+    'size': int(os.getenv('DRIVER_POOL_SIZE', '2')),
+    
+    # Leases per browser before it is quit and replaced
+    'max_uses': int(os.getenv('DRIVER_POOL_MAX_USES', '20')),
+    
+    # Seconds to wait for a free browser
+    'acquire_timeout': int(os.getenv('DRIVER_POOL_ACQUIRE_TIMEOUT', '300')),
+}
+
+
+# ============================================================================
+# ISOLATED SCRAPER EXECUTION
+# ============================================================================
+# Registry entries with 'isolated': True (the browser-driven scrapers by
+# default) run in their own process group; 'timeout_seconds' and
+# 'memory_limit_mb' override the defaults below.
+# An isolated scraper gets no pooling across runs: each run is a fresh
+# process, so its DriverPool and HTTP connections start cold.
+
+ISOLATION_CONFIG = {
+    'enabled': os.getenv('SCRAPER_ISOLATION_ENABLED', 'true').lower() == 'true',
+    
+    # Wall-clock deadline per scraper (seconds)
+    'timeout_seconds': float(os.getenv('SCRAPER_TIMEOUT_SECONDS', '1800')),
+    
+    # Resident memory ceiling for the scraper and its browsers (MB, 0 = none)
+    'memory_limit_mb': int(os.getenv('SCRAPER_MEMORY_LIMIT_MB', '3072')),
+    
+    # Seconds between deadline/memory checks
+    'poll_interval': float(os.getenv('SCRAPER_ISOLATION_POLL_INTERVAL', '0.5')),
+    
+    # Seconds processes get to exit after SIGTERM before SIGKILL
+    'kill_grace_seconds': float(os.getenv('SCRAPER_KILL_GRACE_SECONDS', '10')),
+}
+
+
+# ============================================================================
+# USA TODAY SCRAPER CONFIGURATION
+# ============================================================================
+
+USATODAY_CONFIG = {
+    # How table rows are read: 'lxml' parses one page_source transfer with
+    # lxml XPath, 'script' pulls the whole grid in one execute_script call,
+    # 'elements' reads every cell through WebDriver (also the fallback)
+    'extraction_mode': os.getenv('USATODAY_EXTRACTION_MODE', 'lxml'),
+    
+    # Pagination waits (seconds): wait on real page signals instead of sleeping
+    'load_timeout': float(os.getenv('USATODAY_LOAD_TIMEOUT', '20')),
+    'page_change_timeout': float(os.getenv('USATODAY_PAGE_CHANGE_TIMEOUT', '10')),
+    'settle_timeout': float(os.getenv('USATODAY_SETTLE_TIMEOUT', '3')),
+    'poll_interval': float(os.getenv('USATODAY_POLL_INTERVAL', '0.1')),
+    
+    # Data source: 'auto' tries the backing data feed over HTTP and falls
+    # back to Selenium, 'feed' / 'selenium' pick one (feed still falls back)
+    'backend': os.getenv('USATODAY_BACKEND', 'auto'),
+    
+    # Dataset URL behind the table (discovered from the page when empty)
+    'feed_url': os.getenv('USATODAY_FEED_URL', ''),
+    'feed_timeout': int(os.getenv('USATODAY_FEED_TIMEOUT', '30')),
+    
+    # How ISO feed dates are re-rendered so breach hashes match the table text:
+    # 'ap' (the table's "Jan. 5, 2026" style), a strftime format, or empty
+    'feed_date_format': os.getenv('USATODAY_FEED_DATE_FORMAT', 'ap'),
+    
+    # Share of already-sent breach hashes the feed must reproduce before it is
+    # trusted; below this the feed's values differ from the table's and
+    # Selenium runs instead
+    'feed_min_hash_match': float(os.getenv('USATODAY_FEED_MIN_HASH_MATCH', '0.5')),
+    
+    # Chrome profile for the Selenium backend (see DRIVER_CONFIG)
+    'driver_profile': os.getenv('USATODAY_DRIVER_PROFILE', DRIVER_CONFIG['profile']),
+    
+    # Sharded mode: browsers reading page ranges in parallel (1 = sequential).
+    # Keep DRIVER_POOL_SIZE at least this large.
+    'shard_workers': int(os.getenv('USATODAY_SHARD_WORKERS', '1')),
+    
+    # URL for jumping straight to a page, e.g. '{base_url}?page={page}'
+    # (empty: reach page k by clicking 'Next')
+    'page_url_template': os.getenv('USATODAY_PAGE_URL_TEMPLATE', ''),
+    
+    # Full-history backfill: local breach store and resumable page cursor
+    'store_file': STORAGE_DIR / 'usatoday_breaches.jsonl',
+    'backfill_checkpoint_file': PROGRESS_DIR / 'usatoday_backfill.json',
+    # Failed attempts in a row before the backfill gives up (each completed page resets it)
+    'backfill_max_retries': int(os.getenv('USATODAY_BACKFILL_MAX_RETRIES', '3')),
+    
+    # Change feed: last-known version of each breach, diffed every run
+    'change_feed_enabled': os.getenv('USATODAY_CHANGE_FEED', 'true').lower() == 'true',
+    'change_feed_file': STORAGE_DIR / 'usatoday_records.json',
+    
+    # Sent-breach tracker: journal entries before folding into the snapshot
+    'tracker_compact_every': int(os.getenv('USATODAY_TRACKER_COMPACT_EVERY', '500')),
+    
+    # Incremental mode: stop paging once a page only holds already-sent
+    # breaches or rows older than the days_back cutoff
+    'incremental': os.getenv('USATODAY_INCREMENTAL', 'true').lower() == 'true',
+    
+    # Elements whose text identifies the current page (first match wins)
+    'page_indicator_selectors': [
+        "[aria-current='page']",
+        ".pagination .active",
+        ".pagination .current",
+        ".page-info",
+    ],
+}
+
+# Near-duplicate breach detection (revised counts, respelled company names)
+NEAR_DUPLICATE_CONFIG = {
+    'enabled': os.getenv('NEAR_DUPLICATES_ENABLED', 'true').lower() == 'true',
+    
+    # Minimum Jaccard similarity of company-name character n-grams
+    'threshold': float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.7')),
+    
+    # MinHash signature length and LSH bands (num_perm / bands rows per band)
+    'num_perm': 64,
+    'bands': 16,
+    'shingle_size': 3,
+    
+    # Records are only compared within the same state and breach-date bucket
+    # (plus the neighbouring buckets)
+    'date_bucket_days': int(os.getenv('NEAR_DUPLICATE_DATE_BUCKET_DAYS', '30')),
+}
+
 # =============================================================================
 # NEW BREACH MONITORING REGISTRY
 # =============================================================================
@@ -526,6 +850,32 @@ RANSOMWARE_REGISTRY = {
 }
 
 
+# ============================================================================
+# SCHEDULER CONFIGURATION
+# ============================================================================
+# main_scheduler.py runs several registries in one process (shared HTTP
+# session, browser pool, dedupe state and SMTP connection), still sending
+# one digest email per registry
+
+SCHEDULER_CONFIG = {
+    # Registries run when none are named on the command line
+    'default_registries': [
+        name.strip() for name in
+        os.getenv('SCHEDULER_REGISTRIES', 'mass_arb,generic,breachsense,ransomware,usatoday').split(',')
+        if name.strip()
+    ],
+    
+    # Orchestrator-driven registries and their digest subjects ('usatoday' is
+    # run by main_usatoday_breaches.run_usatoday_breaches)
+    'registries': {
+        'mass_arb': {'registry': SCRAPER_REGISTRY, 'email_subject': 'Daily Mass Arbitration Links'},
+        'generic': {'registry': GENERIC_SCRAPERS_REGISTRY, 'email_subject': 'Daily Generic Links'},
+        'breachsense': {'registry': BREACHSENSE_REGISTRY, 'email_subject': 'Daily Breachsense Links'},
+        'ransomware': {'registry': RANSOMWARE_REGISTRY, 'email_subject': 'Daily Ransomware Links'},
+    },
+}
+
+
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -6,16 +6,23 @@ and last-run time tracking for date filtering.
 """
 
 import json
-import os
 import time
-import hashlib
-import glob
 from datetime import datetime, timezone
-from typing import List, Dict, Set, Optional
-from pathlib import Path
+from typing import List, Dict, Optional
 
-from config.settings import BATCH_CONFIG, SCRAPED_DIR, PROGRESS_DIR, SCRAPER_REGISTRY
+from config.settings import BATCH_CONFIG, PROGRESS_DIR, SCRAPER_REGISTRY
+from core.dedupe_store import get_dedupe_store, is_sqlite_backend
+from core.partitioned_store import PartitionedStore
+from core.scraped_manifest import ScrapedManifest
 from core.notifier import EmailNotifier
+from utils.digest_set import DigestSet
+from utils.file_utils import update_json
+from utils.url_utils import canonical_key
+
+
+# Dedupe store sources used by the batch processor (canonical URL keys)
+SEEN_SOURCE = 'url_seen'
+SENT_SOURCE = 'url_sent'
 
 
 class BatchProcessor:
@@ -41,11 +48,13 @@ class BatchProcessor:
         self.notifier = EmailNotifier()
         
         # Data storage
-        self.existing_urls = set()
         self.sent_urls = set()
-        self.url_hashes = set()
+        self.url_digests = DigestSet()  # 64-bit digests of every scraped and sent URL's canonical key
         self.last_run_times = {}  # NEW: Track last run time per scraper
         
+        # Shared SQLite dedupe store (None = legacy in-memory sets)
+        self.dedupe_store = get_dedupe_store() if is_sqlite_backend() else None
+        
         # Load existing data
         self.load_existing_data()
         self.load_last_run_times()  # NEW: Load last run times
@@ -54,35 +63,23 @@ class BatchProcessor:
 
     def load_existing_data(self):
         """Load all existing URLs from JSON files and progress files."""
+        if self.dedupe_store is not None:
+            self._import_into_store()
+            return
+        
         try:
-            # Load from all scraped data files
-            data_files = list(SCRAPED_DIR.glob("*.json"))
+            # URL digests from the scraped data files; the manifest only
+            # re-parses files that are new or changed since the last run
+            manifest = ScrapedManifest()
+            manifest_stats = manifest.refresh()
+            self.url_digests = manifest.digest_set()
             
-            for file_path in data_files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Handle different JSON structures
-                    if isinstance(data, list):
-                        for item in data:
-                            self._add_url_to_cache(item)
-                    elif isinstance(data, dict):
-                        # Check for 'data' key or other common structures
-                        if 'data' in data:
-                            for item in data['data']:
-                                self._add_url_to_cache(item)
-                        elif 'urls' in data:
-                            for item in data['urls']:
-                                self._add_url_to_cache(item)
-                        else:
-                            # Treat dict itself as an item with URL
-                            self._add_url_to_cache(data)
-                            
-                except json.JSONDecodeError as e:
-                    print(f"[WARNING] Could not parse {file_path.name}: {e}")
-                except Exception as e:
-                    print(f"[WARNING] Error loading {file_path.name}: {e}")
+            # Items stored in the partitioned store (new runs and compacted legacy files)
+            for partition_keys in PartitionedStore().iter_key_digests():
+                self.url_digests.update_digests(partition_keys)
+                partition_keys.close()
+            print(f"[BATCH PROCESSOR] Manifest: parsed {manifest_stats['parsed']} files, "
+                  f"reused {manifest_stats['unchanged']}, dropped {manifest_stats['removed']}")
             
             # Load from progress file
             if self.progress_file.exists():
@@ -92,18 +89,41 @@ class BatchProcessor:
                         sent_urls = progress.get('sent_urls', [])
                         for url in sent_urls:
                             self.sent_urls.add(url)
-                            url_hash = hashlib.md5(url.encode()).hexdigest()
-                            self.url_hashes.add(url_hash)
+                            self.url_digests.add(canonical_key(url))
                 except Exception as e:
                     print(f"[WARNING] Could not load progress file: {e}")
             
-            print(f"[BATCH PROCESSOR] Loaded {len(self.existing_urls)} existing URLs")
             print(f"[BATCH PROCESSOR] Loaded {len(self.sent_urls)} previously sent URLs")
-            print(f"[BATCH PROCESSOR] Loaded {len(self.url_hashes)} URL hashes")
+            print(f"[BATCH PROCESSOR] Loaded {len(self.url_digests)} URL digests")
             
         except Exception as e:
             print(f"[ERROR] Failed to load existing data: {e}")
 
+    def _import_into_store(self):
+        """
+        Bring the dedupe store up to date with the scraped data files.
+        
+        Only files that are new or changed since the last import are parsed,
+        so startup no longer reads every file that has accumulated.
+        """
+        manifest_stats = ScrapedManifest(store=self.dedupe_store, source=SEEN_SOURCE).refresh()
+        print(f"[BATCH PROCESSOR] Manifest: parsed {manifest_stats['parsed']} files, "
+              f"reused {manifest_stats['unchanged']}, dropped {manifest_stats['removed']}")
+        
+        imported = 0
+        for file_path in (self.progress_file, PROGRESS_DIR / 'sent_urls.json'):
+            imported += self.dedupe_store.import_file(SENT_SOURCE, file_path, key_func=canonical_key)
+        
+        print(f"[BATCH PROCESSOR] Imported {imported} new sent URLs into dedupe store")
+        print(f"[BATCH PROCESSOR] Dedupe store: {self.dedupe_store.count(SEEN_SOURCE)} existing URLs, "
+              f"{self.dedupe_store.count(SENT_SOURCE)} previously sent URLs")
+
+    def flush_dedupe_store(self):
+        """Commit URLs buffered during this run to the dedupe store."""
+        if self.dedupe_store is not None:
+            added = self.dedupe_store.flush()
+            print(f"[BATCH PROCESSOR] Committed {added} new URLs to dedupe store")
+
     def load_last_run_times(self):
         """Load last run times for each scraper (NEW)."""
         try:
@@ -125,11 +145,27 @@ class BatchProcessor:
             print(f"[WARNING] Could not load last run times: {e}")
             self.last_run_times = {}
 
-    def save_last_run_times(self):
-        """Save last run times for each scraper (NEW)."""
+    def save_last_run_times(self, replace: bool = False):
+        """
+        Save last run times for each scraper (NEW).
+        
+        Other runners may have updated the file since it was loaded, so the
+        on-disk entries are merged in under a file lock (the newer 'last_run'
+        wins per scraper) and the file is replaced atomically.
+        
+        Args:
+            replace (bool): Overwrite the file instead of merging (used by reset)
+        """
+        def merge(on_disk):
+            merged = {} if replace else dict(on_disk or {})
+            for scraper_key, info in self.last_run_times.items():
+                current = merged.get(scraper_key) or {}
+                if (info.get('last_run') or '') >= (current.get('last_run') or ''):
+                    merged[scraper_key] = info
+            return merged
+        
         try:
-            with open(self.last_run_file, 'w', encoding='utf-8') as f:
-                json.dump(self.last_run_times, f, indent=2, ensure_ascii=False)
+            self.last_run_times = update_json(self.last_run_file, merge, default={})
             
             print(f"[BATCH PROCESSOR] Last run times saved to {self.last_run_file.name}")
             
@@ -201,14 +237,19 @@ class BatchProcessor:
         elif isinstance(item, str):
             url = item
         
-        if url:
-            self.existing_urls.add(url)
-            url_hash = hashlib.md5(url.encode()).hexdigest()
-            self.url_hashes.add(url_hash)
+        key = canonical_key(url) if url else None
+        
+        if key:
+            if self.dedupe_store is not None:
+                self.dedupe_store.add(SEEN_SOURCE, key)
+                return
+            
+            self.url_digests.add(key)
 
     def is_duplicate(self, url: str) -> bool:
         """
-        Check if URL is a duplicate using multiple methods.
+        Check if URL is a duplicate by its canonical key, so query-string,
+        trailing-slash and fragment variants of a URL count as the same.
         
         Args:
             url (str): URL to check
@@ -216,16 +257,15 @@ class BatchProcessor:
         Returns:
             bool: True if duplicate, False otherwise
         """
-        # Direct URL comparison
-        if url in self.existing_urls:
-            return True
+        key = canonical_key(url)
+        if not key:
+            return False
         
-        # Hash comparison for better duplicate detection
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        if url_hash in self.url_hashes:
-            return True
+        if self.dedupe_store is not None:
+            return (self.dedupe_store.contains(SEEN_SOURCE, key)
+                    or self.dedupe_store.contains(SENT_SOURCE, key))
         
-        return False
+        return key in self.url_digests
 
     def is_already_sent(self, url: str) -> bool:
         """
@@ -237,6 +277,8 @@ class BatchProcessor:
         Returns:
             bool: True if already sent, False otherwise
         """
+        if self.dedupe_store is not None:
+            return self.dedupe_store.contains(SENT_SOURCE, canonical_key(url))
         return url in self.sent_urls
 
     def filter_unique_urls(self, new_links: List[Dict]) -> List[Dict]:
@@ -277,9 +319,7 @@ class BatchProcessor:
             
             # It's a new unique URL
             unique_links.append(link)
-            self.existing_urls.add(url)
-            url_hash = hashlib.md5(url.encode()).hexdigest()
-            self.url_hashes.add(url_hash)
+            self._add_url_to_cache(url)
         
         if duplicates_found > 0:
             print(f"[BATCH PROCESSOR] Filtered out {duplicates_found} duplicate URLs")
@@ -307,19 +347,35 @@ class BatchProcessor:
         # Fallback
         return f"{scraper_name} Scrapped Link"
 
-    def save_progress(self):
-        """Save current progress to file."""
-        try:
-            progress = {
+    def save_progress(self, replace: bool = False):
+        """
+        Save current progress to file.
+        
+        Sent URLs recorded by other runners since the file was loaded are
+        merged in under a file lock, and the file is replaced atomically.
+        
+        Args:
+            replace (bool): Overwrite the sent URLs instead of merging (used by reset)
+        """
+        if self.dedupe_store is not None:
+            # Sent URLs live in the dedupe store; commit them in one transaction
+            self.dedupe_store.flush()
+            print("[BATCH PROCESSOR] Progress committed to dedupe store")
+            return
+        
+        def merge(on_disk):
+            if not replace:
+                self.sent_urls.update((on_disk or {}).get('sent_urls', []))
+            return {
                 'last_updated': datetime.now().isoformat(),
                 'sent_urls': list(self.sent_urls),
                 'total_sent': len(self.sent_urls),
                 'batch_size': self.batch_size,
                 'delay_minutes': self.delay_seconds // 60
             }
-            
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress, f, indent=2, ensure_ascii=False)
+        
+        try:
+            update_json(self.progress_file, merge, default={})
             
             print(f"[BATCH PROCESSOR] Progress saved to {self.progress_file.name}")
             
@@ -425,6 +481,8 @@ class BatchProcessor:
                 # Mark URLs as sent
                 for url in batch_urls:
                     self.sent_urls.add(url)
+                    if self.dedupe_store is not None:
+                        self.dedupe_store.add(SENT_SOURCE, canonical_key(url))
                 
                 # Save progress
                 self.save_progress()
@@ -464,10 +522,17 @@ class BatchProcessor:
         Returns:
             Dict: Statistics dictionary
         """
+        if self.dedupe_store is not None:
+            total_existing = self.dedupe_store.count(SEEN_SOURCE)
+            total_sent = self.dedupe_store.count(SENT_SOURCE)
+        else:
+            total_existing = len(self.url_digests)
+            total_sent = len(self.sent_urls)
+        
         return {
-            'total_existing_urls': len(self.existing_urls),
-            'total_sent_urls': len(self.sent_urls),
-            'total_url_hashes': len(self.url_hashes),
+            'total_existing_urls': total_existing,
+            'total_sent_urls': total_sent,
+            'total_url_hashes': len(self.url_digests),
             'batch_size': self.batch_size,
             'delay_minutes': self.delay_seconds // 60,
             'total_scrapers_tracked': len(self.last_run_times),
@@ -477,13 +542,15 @@ class BatchProcessor:
     def reset_progress(self):
         """Reset all progress (use with caution)."""
         self.sent_urls.clear()
-        self.save_progress()
+        if self.dedupe_store is not None:
+            self.dedupe_store.clear(SENT_SOURCE)
+        self.save_progress(replace=True)
         print("[BATCH PROCESSOR] Progress reset - all URLs will be sent again")
 
     def reset_last_run_times(self):
         """Reset all last run times (use with caution) (NEW)."""
         self.last_run_times.clear()
-        self.save_last_run_times()
+        self.save_last_run_times(replace=True)
         print("[BATCH PROCESSOR] Last run times reset - all scrapers will process full history")
 
     def print_stats(self):
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Local Breach Store
+Append-only JSON Lines copy of the USA Today healthcare breach database,
+keyed by breach_hash.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+from config.settings import USATODAY_CONFIG
+
+
+class BreachStore:
+    """
+    Local store of breach records.
+    Records are appended once per breach_hash and never rewritten.
+    """
+    
+    def __init__(self, store_file: Optional[Path] = None):
+        """
+        Initialize the store.
+        
+        Args:
+            store_file (Path): JSON Lines file (default from USATODAY_CONFIG)
+        """
+        self.store_file = Path(store_file or USATODAY_CONFIG['store_file'])
+        self._hashes: Optional[Set[str]] = None
+    
+    @property
+    def hashes(self) -> Set[str]:
+        """breach_hash values already in the store (loaded on first use)."""
+        if self._hashes is None:
+            self._hashes = {record.get('breach_hash') for record in self.iter_records()}
+            self._hashes.discard(None)
+        return self._hashes
+    
+    def iter_records(self) -> Iterator[Dict]:
+        """
+        Stream stored records one line at a time.
+        
+        Yields:
+            dict: Breach record
+        """
+        if not self.store_file.exists():
+            return
+        
+        with open(self.store_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append can leave one partial trailing line
+                    continue
+    
+    def add_many(self, records: List[Dict]) -> int:
+        """
+        Append records whose breach_hash is not stored yet.
+        
+        Args:
+            records (List[Dict]): Breach dictionaries
+            
+        Returns:
+            int: Number of records written
+        """
+        new_records = []
+        for record in records:
+            breach_hash = record.get('breach_hash')
+            if breach_hash and breach_hash not in self.hashes:
+                self.hashes.add(breach_hash)
+                new_records.append(record)
+        
+        if not new_records:
+            return 0
+        
+        self.store_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.store_file, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in new_records))
+            f.flush()
+        
+        return len(new_records)
+    
+    def __len__(self) -> int:
+        return len(self.hashes)
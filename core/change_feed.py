@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Breach Change Feed
+Keeps the last-known version of every USA Today breach record and diffs
+each run against it, so only added, changed and removed entries are
+processed and emailed.
+"""
+
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config.settings import USATODAY_CONFIG
+from utils.file_utils import atomic_write_json, file_lock, load_json, update_json
+
+
+SNAPSHOT_VERSION = 1
+
+# Columns that identify a breach and never change for it
+IDENTITY_FIELDS = ('company', 'state', 'breach_date')
+
+# Columns USA Today revises after first publishing a breach
+MUTABLE_FIELDS = ('company_type', 'people_affected', 'breach_type', 'breach_source')
+
+# Scraper stop reasons meaning the whole table was read (see USATodayBreachesScraper)
+COMPLETE_STOP_REASONS = frozenset(['feed_complete', 'no_more_pages'])
+
+
+def _normalize(value) -> str:
+    return ' '.join(str(value or '').lower().split())
+
+
+def identity_key(record: Dict) -> str:
+    """Stable key of a breach: hash of company, state and breach date only."""
+    unique_string = '|'.join(_normalize(record.get(field)) for field in IDENTITY_FIELDS)
+    return hashlib.md5(unique_string.encode()).hexdigest()
+
+
+def content_hash(record: Dict) -> str:
+    """Hash of the mutable columns, to detect revisions cheaply."""
+    content = '|'.join(str(record.get(field) or '').strip() for field in MUTABLE_FIELDS)
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+def revision_key(record: Dict) -> str:
+    """
+    Tracker identifier of one revision of a breach: identity_key plus
+    content_hash, so a change to any mutable column is a new revision even
+    when breach_hash (company, state, date, people affected) stays the same.
+    """
+    return f"rev:{identity_key(record)}:{content_hash(record)}"
+
+
+class ChangeFeed:
+    """
+    Last-known snapshot of breach records keyed by identity_key.
+
+    diff() compares a run against the snapshot with set operations on the
+    keys and a hash comparison per common key; apply() stores the run as
+    the new snapshot once its changes have been reported.
+    """
+
+    def __init__(self, snapshot_file: Optional[Path] = None):
+        """
+        Initialize the change feed.
+
+        Args:
+            snapshot_file (Path): Snapshot JSON file (default from USATODAY_CONFIG)
+        """
+        self.snapshot_file = Path(snapshot_file or USATODAY_CONFIG['change_feed_file'])
+        self.records: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self):
+        """Load the snapshot (missing or outdated files start empty)."""
+        data = load_json(self.snapshot_file, default={}) or {}
+        if data.get('version') == SNAPSHOT_VERSION:
+            self.records = data.get('records', {})
+        else:
+            self.records = {}
+
+    def save(self):
+        """Write the snapshot atomically under the file lock."""
+        with file_lock(self.snapshot_file):
+            atomic_write_json({
+                'version': SNAPSHOT_VERSION,
+                'updated_at': datetime.now().isoformat(),
+                'records': self.records
+            }, self.snapshot_file, indent=None)
+
+    @staticmethod
+    def snapshot_entry(record: Dict) -> Dict:
+        """What the snapshot keeps per breach."""
+        entry = {field: record.get(field, '') for field in IDENTITY_FIELDS + MUTABLE_FIELDS}
+        entry['date'] = record.get('date', '')
+        entry['breach_hash'] = record.get('breach_hash', '')
+        entry['content_hash'] = content_hash(record)
+        return entry
+
+    def diff(self, records: List[Dict], complete: bool = False) -> Dict:
+        """
+        Compare a run's records with the snapshot.
+
+        Removed entries are only looked for when the run read the whole
+        table (an incremental, budget-limited or failed run stops early and
+        has not seen the rest), and then only inside the breach-date range
+        the run kept, since days_back drops older rows.
+
+        Args:
+            records: Breach dictionaries from the scraper
+            complete: The scrapers walked the whole table (see COMPLETE_STOP_REASONS)
+
+        Returns:
+            dict: 'added' (records), 'changed' (records with a 'changes' dict of
+                  field -> {'old', 'new'} and a 'revision_key'), 'removed' (snapshot entries) and
+                  'unchanged' (count)
+        """
+        current = {identity_key(record): record for record in records}
+        current_keys = set(current)
+        known_keys = set(self.records)
+
+        added = [current[key] for key in current_keys - known_keys]
+
+        changed = []
+        unchanged = 0
+        for key in current_keys & known_keys:
+            record = current[key]
+            previous = self.records[key]
+            if content_hash(record) == previous.get('content_hash'):
+                unchanged += 1
+                continue
+
+            record['changes'] = {
+                field: {'old': previous.get(field, ''), 'new': record.get(field, '')}
+                for field in MUTABLE_FIELDS
+                if str(record.get(field) or '').strip() != str(previous.get(field) or '').strip()
+            }
+            record['previous_breach_hash'] = previous.get('breach_hash', '')
+            record['revision_key'] = revision_key(record)
+            changed.append(record)
+
+        removed = []
+        dates = sorted(record.get('date', '') for record in records if self._is_iso_date(record.get('date')))
+        if complete and dates:
+            first, last = dates[0], dates[-1]
+            removed = [
+                dict(self.records[key], identity=key)
+                for key in known_keys - current_keys
+                if first <= self.records[key].get('date', '') <= last
+            ]
+
+        # Keep output in scrape order
+        order = {key: index for index, key in enumerate(current)}
+        added.sort(key=lambda record: order[identity_key(record)])
+        changed.sort(key=lambda record: order[identity_key(record)])
+
+        return {'added': added, 'changed': changed, 'removed': removed, 'unchanged': unchanged}
+
+    def apply(self, records: List[Dict], removed: List[Dict] = None):
+        """
+        Store a run as the new snapshot.
+
+        The snapshot on disk is re-read under the file lock and the run's
+        changes are merged into it, so entries written by another runner
+        since load() are kept.
+
+        Args:
+            records: Breach dictionaries from the run (upserted)
+            removed: Entries reported as removed by diff() (deleted)
+        """
+        upserts = {identity_key(record): self.snapshot_entry(record) for record in records}
+        removed_keys = {entry.get('identity') for entry in removed or []}
+
+        def merge(on_disk):
+            on_disk = on_disk if isinstance(on_disk, dict) else {}
+            snapshot = dict(on_disk.get('records', {})) if on_disk.get('version') == SNAPSHOT_VERSION else {}
+            for key in removed_keys:
+                snapshot.pop(key, None)
+            snapshot.update(upserts)
+            return {
+                'version': SNAPSHOT_VERSION,
+                'updated_at': datetime.now().isoformat(),
+                'records': snapshot
+            }
+
+        self.records = update_json(self.snapshot_file, merge, default={}, indent=None)['records']
+
+    @staticmethod
+    def _is_iso_date(value) -> bool:
+        try:
+            datetime.strptime(str(value), '%Y-%m-%d')
+            return True
+        except ValueError:
+            return False
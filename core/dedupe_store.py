@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Dedupe Store
+Single SQLite database holding every "already seen / already sent" key,
+indexed by (source, key), replacing the per-tracker JSON files.
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from config.settings import DEDUPE_CONFIG
+from utils.json_stream import iter_json_keys, record_key
+
+
+# SQLite limits the number of bound parameters per statement
+QUERY_CHUNK_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dedupe_keys (
+    source TEXT NOT NULL,
+    key TEXT NOT NULL,
+    added_at TEXT NOT NULL,
+    PRIMARY KEY (source, key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS imported_files (
+    source TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    keys_added INTEGER NOT NULL,
+    imported_at TEXT NOT NULL,
+    PRIMARY KEY (source, path)
+);
+"""
+
+
+class SourceView:
+    """
+    Read-only, set-like view of one source's keys.
+
+    Lets code that expects a set of known keys (``key in known``) query the
+    database directly instead of loading everything into memory.
+    """
+
+    def __init__(self, store: 'DedupeStore', source: str):
+        self.store = store
+        self.source = source
+
+    def __contains__(self, key) -> bool:
+        return self.store.contains(self.source, key)
+
+    def __len__(self) -> int:
+        return self.store.count(self.source)
+
+    def __iter__(self):
+        return self.store.iter_keys(self.source)
+
+
+class DedupeStore:
+    """
+    Embedded SQLite store of dedupe keys.
+
+    Writes are buffered with add() and committed together by flush(), so a
+    run costs one transaction instead of one file rewrite per item. The
+    database runs in WAL mode so other processes can read while a run writes.
+    """
+
+    def __init__(self, db_path=None):
+        """
+        Open (or create) the store.
+
+        Args:
+            db_path: Database file (default from DEDUPE_CONFIG)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = Path(db_path or DEDUPE_CONFIG['db_file'])
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._pending: Dict[str, set] = {}
+
+        self.conn = sqlite3.connect(str(self.db_path), timeout=DEDUPE_CONFIG['busy_timeout'],
+                                    check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def contains(self, source: str, key: str) -> bool:
+        """Check whether a key is known for a source (pending writes included)."""
+        with self._lock:
+            if key in self._pending.get(source, ()):
+                return True
+            row = self.conn.execute(
+                'SELECT 1 FROM dedupe_keys WHERE source = ? AND key = ?', (source, key)
+            ).fetchone()
+            return row is not None
+
+    def filter_new(self, source: str, keys: Iterable[str]) -> List[str]:
+        """
+        Return the keys that are not yet known, in input order.
+
+        Args:
+            source (str): Source name
+            keys: Keys to check
+
+        Returns:
+            List[str]: Unknown keys (duplicates within the input collapsed)
+        """
+        keys = list(dict.fromkeys(key for key in keys if key))
+        known = set()
+
+        with self._lock:
+            known.update(key for key in keys if key in self._pending.get(source, ()))
+            for start in range(0, len(keys), QUERY_CHUNK_SIZE):
+                chunk = keys[start:start + QUERY_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f'SELECT key FROM dedupe_keys WHERE source = ? AND key IN ({placeholders})',
+                    [source] + chunk
+                )
+                known.update(row[0] for row in rows)
+
+        return [key for key in keys if key not in known]
+
+    def count(self, source: str) -> int:
+        """Number of keys stored for a source (pending writes included)."""
+        with self._lock:
+            self.flush()
+            return self.conn.execute(
+                'SELECT COUNT(*) FROM dedupe_keys WHERE source = ?', (source,)
+            ).fetchone()[0]
+
+    def iter_keys(self, source: str):
+        """Iterate over a source's keys."""
+        with self._lock:
+            self.flush()
+            keys = [row[0] for row in self.conn.execute(
+                'SELECT key FROM dedupe_keys WHERE source = ?', (source,)
+            )]
+        return iter(keys)
+
+    def view(self, source: str) -> SourceView:
+        """Set-like view of a source's keys."""
+        return SourceView(self, source)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Key counts per source."""
+        with self._lock:
+            self.flush()
+            return dict(self.conn.execute(
+                'SELECT source, COUNT(*) FROM dedupe_keys GROUP BY source ORDER BY source'
+            ).fetchall())
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, source: str, key: str):
+        """Buffer a key; it is written on the next flush()."""
+        if not key:
+            return
+        with self._lock:
+            self._pending.setdefault(source, set()).add(key)
+
+    def add_many(self, source: str, keys: Iterable[str]) -> int:
+        """
+        Add keys and commit them immediately.
+
+        Returns:
+            int: Number of keys that were new
+        """
+        with self._lock:
+            self._pending.setdefault(source, set()).update(key for key in keys if key)
+            return self.flush()
+
+    def flush(self) -> int:
+        """
+        Commit all buffered keys in a single transaction.
+
+        Returns:
+            int: Number of keys that were new
+        """
+        with self._lock:
+            if not any(self._pending.values()):
+                return 0
+
+            now = datetime.now().isoformat()
+            rows = [(source, key, now) for source, keys in self._pending.items() for key in keys]
+            before = self.conn.total_changes
+            with self.conn:
+                self.conn.executemany(
+                    'INSERT OR IGNORE INTO dedupe_keys (source, key, added_at) VALUES (?, ?, ?)', rows
+                )
+            self._pending.clear()
+            return self.conn.total_changes - before
+
+    def clear(self, source: str):
+        """Delete every key of a source (use with caution)."""
+        with self._lock:
+            self._pending.pop(source, None)
+            with self.conn:
+                self.conn.execute('DELETE FROM dedupe_keys WHERE source = ?', (source,))
+
+    # ------------------------------------------------------------------
+    # Legacy JSON import
+    # ------------------------------------------------------------------
+
+    def import_file(self, source: str, filepath, force: bool = False, key_func=None) -> int:
+        """
+        Import keys from a legacy JSON file, a partition (.jsonl.gz) or a
+        line-per-key journal.
+
+        Files are remembered per source by size and modification time, so an
+        unchanged file is only parsed once.
+
+        Args:
+            source (str): Source the keys belong to
+            filepath: File to import
+            force (bool): Re-import even if the file looks unchanged
+            key_func (callable): Maps each raw key to the stored key (optional)
+
+        Returns:
+            int: Number of new keys added
+        """
+        filepath = Path(filepath)
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return 0
+
+        with self._lock:
+            if not force and not self.needs_import(source, filepath):
+                return 0
+
+            try:
+                if filepath.suffix == '.json':
+                    keys = list(iter_json_keys(filepath))
+                elif filepath.name.endswith('.jsonl.gz'):
+                    with gzip.open(filepath, 'rt', encoding='utf-8') as f:
+                        keys = [record_key(json.loads(line)) for line in f if line.strip()]
+                else:
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        keys = [line.strip() for line in f if line.endswith('\n') and line.strip()]
+            except (OSError, ValueError, EOFError) as e:
+                self.logger.warning(f"Could not import {filepath.name}: {e}")
+                return 0
+
+            if key_func is not None:
+                keys = [key_func(key) for key in keys]
+            self._pending.setdefault(source, set()).update(key for key in keys if key)
+            added = self.flush()
+
+            with self.conn:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO imported_files '
+                    '(source, path, size, mtime, keys_added, imported_at) VALUES (?, ?, ?, ?, ?, ?)',
+                    (source, str(filepath), stat.st_size, stat.st_mtime, added, datetime.now().isoformat())
+                )
+            return added
+
+    def needs_import(self, source: str, filepath) -> bool:
+        """
+        Check whether a file is new or changed since it was imported for a source.
+
+        Returns:
+            bool: False for an unchanged or missing file
+        """
+        filepath = Path(filepath)
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return False
+
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT size, mtime FROM imported_files WHERE source = ? AND path = ?',
+                (source, str(filepath))
+            ).fetchone()
+        return not (row and row[0] == stat.st_size and row[1] == stat.st_mtime)
+
+    def prune_imported_files(self, source: str) -> int:
+        """
+        Forget imported files that no longer exist (their keys are kept).
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            paths = [row[0] for row in self.conn.execute(
+                'SELECT path FROM imported_files WHERE source = ?', (source,)
+            )]
+            missing = [(source, path) for path in paths if not Path(path).exists()]
+            if missing:
+                with self.conn:
+                    self.conn.executemany(
+                        'DELETE FROM imported_files WHERE source = ? AND path = ?', missing
+                    )
+            return len(missing)
+
+    def import_legacy(self) -> int:
+        """
+        Import the tracker files listed in DEDUPE_CONFIG['legacy_files'].
+
+        Returns:
+            int: Number of new keys added
+        """
+        total = 0
+        for source, paths in DEDUPE_CONFIG['legacy_files'].items():
+            for filepath in paths:
+                added = self.import_file(source, filepath)
+                if added:
+                    print(f"[DEDUPE STORE] Imported {added} keys for '{source}' from {Path(filepath).name}")
+                total += added
+        return total
+
+    def close(self):
+        """Flush pending keys and close the connection."""
+        with self._lock:
+            if self.conn is None:
+                return
+            self.flush()
+            self.conn.close()
+            self.conn = None
+
+
+# Process-wide store shared by the trackers, batch processor and orchestrator
+_store: Optional[DedupeStore] = None
+_store_lock = threading.Lock()
+
+
+def is_sqlite_backend() -> bool:
+    """True when dedupe state should go through the SQLite store."""
+    return DEDUPE_CONFIG['backend'] == 'sqlite'
+
+
+def get_dedupe_store() -> DedupeStore:
+    """
+    Get the process-wide store, opening it (and importing the legacy JSON
+    tracker files once) on first use.
+
+    Returns:
+        DedupeStore: Shared store
+    """
+    global _store
+    with _store_lock:
+        if _store is None or _store.conn is None:
+            _store = DedupeStore()
+            _store.import_legacy()
+        return _store
+
+
+def close_dedupe_store():
+    """Flush and close the shared store (registered with atexit)."""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+            _store = None
+
+
+atexit.register(close_dedupe_store)
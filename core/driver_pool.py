@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+WebDriver Pool
+Keeps a few headless Chrome browsers warm and shares them between
+Selenium-based scrapers, so each run does not pay Chrome's cold start.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from config.settings import DRIVER_CONFIG, DRIVER_POOL_CONFIG
+from utils.driver_utils import create_chrome_driver, apply_resource_blocking
+
+
+class DriverPool:
+    """
+    Pool of reusable WebDriver instances.
+    
+    Drivers are handed out with a fresh context (cookies and storage cleared)
+    and are recycled after max_uses leases or as soon as they look unhealthy.
+    """
+    
+    def __init__(self, size: int = None, max_uses: int = None, profile: str = None, factory=None):
+        """
+        Initialize the pool.
+        
+        Args:
+            size (int): Maximum number of live browsers
+            max_uses (int): Leases per browser before it is replaced
+            profile (str): Driver profile passed to the factory
+            factory (callable): Creates a driver, called as factory(profile=profile)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.size = size or DRIVER_POOL_CONFIG['size']
+        self.max_uses = max_uses or DRIVER_POOL_CONFIG['max_uses']
+        self.acquire_timeout = DRIVER_POOL_CONFIG['acquire_timeout']
+        self.profile = profile
+        self.factory = factory or create_chrome_driver
+        
+        self._idle = []
+        self._uses: Dict[int, int] = {}
+        self._live = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        
+        # Counters for get_stats()
+        self.created = 0
+        self.recycled = 0
+        self.leases = 0
+    
+    # ========================================================================
+    # LEASING
+    # ========================================================================
+    
+    def acquire(self, timeout: float = None):
+        """
+        Take a driver from the pool, starting a new browser if needed.
+        
+        Args:
+            timeout (float): Seconds to wait for a free driver
+            
+        Returns:
+            WebDriver: Driver with a clean context
+            
+        Raises:
+            TimeoutError: If no driver became available in time
+        """
+        timeout = timeout if timeout is not None else self.acquire_timeout
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Driver pool is shut down")
+                
+                driver = self._idle.pop() if self._idle else None
+                
+                if driver is None and self._live < self.size:
+                    # Reserve a slot; the browser is started outside the lock
+                    self._live += 1
+                    create = True
+                elif driver is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No WebDriver available after {timeout}s")
+                    self._condition.wait(remaining)
+                    continue
+                else:
+                    create = False
+            
+            if create:
+                try:
+                    driver = self._create_driver()
+                except Exception:
+                    with self._condition:
+                        self._live -= 1
+                        self._condition.notify()
+                    raise
+            elif not self._prepare(driver):
+                self._discard(driver)
+                continue
+            
+            with self._condition:
+                self.leases += 1
+            return driver
+    
+    def release(self, driver, healthy: bool = True):
+        """
+        Return a driver to the pool.
+        
+        Args:
+            driver: Driver obtained from acquire()
+            healthy (bool): False if the caller saw the browser misbehave
+        """
+        if driver is None:
+            return
+        
+        with self._condition:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+            keep = healthy and not self._closed and uses < self.max_uses
+            if keep:
+                self._idle.append(driver)
+                self._condition.notify()
+        
+        if not keep:
+            self._discard(driver)
+    
+    @contextmanager
+    def lease(self, timeout: float = None):
+        """Context manager around acquire()/release()."""
+        driver = self.acquire(timeout)
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = self.is_healthy(driver)
+            raise
+        finally:
+            self.release(driver, healthy)
+    
+    # ========================================================================
+    # DRIVER LIFECYCLE
+    # ========================================================================
+    
+    def _create_driver(self):
+        """Start a new browser."""
+        start = time.perf_counter()
+        driver = self.factory(profile=self.profile)
+        with self._condition:
+            self._uses[id(driver)] = 0
+            self.created += 1
+        self.logger.info(f"Started pooled WebDriver in {time.perf_counter() - start:.2f}s")
+        return driver
+    
+    def _discard(self, driver):
+        """Quit a browser and free its slot."""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.debug(f"Error quitting WebDriver: {e}")
+        
+        with self._condition:
+            self._uses.pop(id(driver), None)
+            self._live -= 1
+            self.recycled += 1
+            self._condition.notify()
+    
+    def _prepare(self, driver) -> bool:
+        """Check a reused driver and give it a fresh context."""
+        if not self.is_healthy(driver):
+            self.logger.warning("Pooled WebDriver is unhealthy, replacing it")
+            return False
+        
+        try:
+            self.reset_context(driver)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not reset WebDriver context, replacing it: {e}")
+            return False
+    
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        """True if the browser still answers commands."""
+        try:
+            return driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+    
+    def reset_context(self, driver):
+        """Clear cookies, storage and cache left behind by the previous lease."""
+        try:
+            driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+        except Exception:
+            pass  # about:blank and other opaque origins have no storage
+        
+        driver.delete_all_cookies()
+        
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': '*', 'storageTypes': 'all'})
+        except Exception:
+            pass  # non-Chrome drivers
+        
+        driver.get('about:blank')
+        
+        # Blocking rules live on the DevTools session; make sure they survive
+        if (self.profile or DRIVER_CONFIG['profile']) == 'lean':
+            apply_resource_blocking(driver)
+    
+    def shutdown(self):
+        """Quit every idle browser and refuse new leases."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        
+        for driver in idle:
+            self._discard(driver)
+        
+        if idle:
+            self.logger.info(f"Driver pool shut down ({len(idle)} browsers closed)")
+    
+    def get_stats(self) -> Dict:
+        """
+        Get pool statistics.
+        
+        Returns:
+            dict: Statistics
+        """
+        with self._condition:
+            return {
+                'size': self.size,
+                'max_uses': self.max_uses,
+                'live': self._live,
+                'idle': len(self._idle),
+                'created': self.created,
+                'recycled': self.recycled,
+                'leases': self.leases,
+            }
+
+
+# ============================================================================
+# SHARED POOLS
+# ============================================================================
+
+_pools: Dict[Optional[str], DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(profile: str = None) -> DriverPool:
+    """
+    Get the process-wide pool for a driver profile, creating it on first use.
+    
+    Args:
+        profile (str): Driver profile ('lean' or 'full')
+        
+    Returns:
+        DriverPool: Shared pool
+    """
+    with _pools_lock:
+        pool = _pools.get(profile)
+        if pool is None or pool._closed:
+            pool = DriverPool(profile=profile)
+            _pools[profile] = pool
+        return pool
+
+
+def shutdown_driver_pools():
+    """Quit all pooled browsers (registered with atexit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_driver_pools)
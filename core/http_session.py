@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Connection Pool
+Every scraper gets its own requests.Session, so headers and cookies set by
+one scraper never reach another, but all of them are mounted on a single
+process-wide HTTPAdapter. Keep-alive connections (and their TLS
+handshakes) are therefore still reused across scrapers, threads and
+registries instead of being rebuilt per scraper.
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import SCRAPER_CONFIG
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter mounted on many sessions at once.
+
+    Session.close() closes every mounted adapter, so close() leaves the
+    pool open here; close_http_pool() tears it down once per process.
+    """
+
+    def close(self):
+        pass
+
+    def close_pool(self):
+        super().close()
+
+
+_adapter: Optional[SharedHTTPAdapter] = None
+_adapter_lock = threading.Lock()
+
+
+def get_http_adapter() -> SharedHTTPAdapter:
+    """
+    Get the process-wide connection pool, creating it on first use.
+
+    Returns:
+        SharedHTTPAdapter: Shared adapter (see close_http_pool)
+    """
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            # Enough pooled connections per host for concurrent scrapers
+            _adapter = SharedHTTPAdapter(pool_maxsize=SCRAPER_CONFIG['pool_maxsize'])
+        return _adapter
+
+
+def new_http_session(pool_maxsize: Optional[int] = None) -> requests.Session:
+    """
+    Create a session for one scraper.
+
+    The session has its own headers and cookies. It uses the shared
+    connection pool unless SCRAPER_CONFIG['share_pool'] is off, in which
+    case it gets a private HTTPAdapter.
+
+    Args:
+        pool_maxsize (int): Connections for a private pool (default: SCRAPER_CONFIG['pool_maxsize'])
+
+    Returns:
+        requests.Session: New session (close it when done; the shared pool stays open)
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': SCRAPER_CONFIG['user_agent']})
+
+    if SCRAPER_CONFIG['share_pool']:
+        adapter = get_http_adapter()
+    else:
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize or SCRAPER_CONFIG['pool_maxsize'])
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def close_http_pool():
+    """Close the shared pool's connections (registered with atexit)."""
+    global _adapter
+    with _adapter_lock:
+        if _adapter is not None:
+            _adapter.close_pool()
+            _adapter = None
+
+
+atexit.register(close_http_pool)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Isolated Scraper Runner
+Runs a scraper in its own process (and process group) with a wall-clock
+deadline and a memory ceiling, so a hung browser or a leaking scraper
+cannot stall or bloat the rest of the run.
+
+The child starts a new session, so Chrome and chromedriver end up in its
+process group. Whatever is left of that group when the scraper finishes,
+times out or crashes is killed, which also reaps browsers orphaned by a
+missed driver.quit(). Results come back as a JSON-serialized dict.
+
+Nothing is pooled across isolated runs: every run spawns a new process,
+so the DriverPool (core.driver_pool) and the shared HTTP connections are
+created cold inside it and torn down with it. Isolate scrapers that need
+the hard deadline more than warm browsers.
+"""
+
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import subprocess
+import time
+from typing import Dict, Optional
+
+from config.settings import ISOLATION_CONFIG
+from core.scraper_budget import ScraperBudget
+
+
+logger = logging.getLogger(__name__)
+
+# spawn: the child does not inherit the parent's threads, sockets or browsers
+_context = multiprocessing.get_context('spawn')
+
+
+def _child_main(module_path: str, class_name: str, run_kwargs: Dict, budget: Optional[Dict], conn):
+    """Process entry point: run the scraper and send back the serialized result."""
+    if hasattr(os, 'setsid'):
+        os.setsid()
+
+    scraper = None
+    try:
+        module = importlib.import_module(module_path)
+        scraper = getattr(module, class_name)()
+        if budget is not None and hasattr(scraper, 'budget'):
+            scraper.budget = ScraperBudget(**budget)
+        payload = {'success': True, 'urls_data': scraper.run(**run_kwargs), 'error': None}
+    except BaseException as e:
+        payload = {'success': False, 'urls_data': [], 'error': f"{type(e).__name__}: {e}"}
+
+    if hasattr(scraper, 'budget'):
+        payload['budget'] = scraper.budget.to_dict()
+    payload['stop_reason'] = getattr(scraper, 'stop_reason', None)
+
+    try:
+        conn.send_bytes(json.dumps(payload, default=str).encode('utf-8'))
+    finally:
+        conn.close()
+
+
+def _group_rss_mb(pgid: int) -> float:
+    """Resident memory of every process in a process group, in MB (Linux /proc)."""
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                # Fields after the parenthesised command: state ppid pgrp ...
+                fields = f.read().rsplit(b')', 1)[1].split()
+            if int(fields[2]) != pgid:
+                continue
+            with open(f'/proc/{entry}/statm', 'rb') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    return total / (1024 * 1024)
+
+
+def _kill_tree(process, grace: float):
+    """Terminate the child's process group, then kill whatever is left."""
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+        process.join(grace)
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        # setsid never ran: the child is not a group leader
+        process.join(grace)
+        if process.is_alive():
+            process.kill()
+        process.join(grace)
+        return
+
+    # Wait for the group to exit (joining reaps the child so it does not linger as a zombie)
+    deadline = time.monotonic() + grace
+    while time.monotonic() < deadline:
+        process.join(0.1)
+        try:
+            os.killpg(process.pid, 0)
+        except ProcessLookupError:
+            return
+
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    process.join(grace)
+
+
+def run_isolated(module_path: str, class_name: str, run_kwargs: Optional[Dict] = None,
+                 timeout_seconds: Optional[float] = None, memory_limit_mb: Optional[int] = None,
+                 budget: Optional[Dict] = None) -> Dict:
+    """
+    Run a scraper's run() in a separate process.
+
+    Args:
+        module_path (str): Scraper module
+        class_name (str): Scraper class (instantiated without arguments)
+        run_kwargs (dict): Keyword arguments for run() (must be picklable)
+        timeout_seconds (float): Wall-clock deadline (default from ISOLATION_CONFIG)
+        memory_limit_mb (int): Resident memory ceiling for the whole process tree
+                               (default from ISOLATION_CONFIG, 0 = none)
+        budget (dict): ScraperBudget limits for the scraper (ScraperBudget.limits())
+
+    Returns:
+        dict: 'success', 'urls_data', 'error', 'budget' (ScraperBudget.to_dict() or
+              None), 'stop_reason' (the scraper's, if it has one), 'timed_out',
+              'exit_code' and 'peak_memory_mb'
+    """
+    timeout_seconds = timeout_seconds or ISOLATION_CONFIG['timeout_seconds']
+    if memory_limit_mb is None:
+        memory_limit_mb = ISOLATION_CONFIG['memory_limit_mb']
+    poll_interval = ISOLATION_CONFIG['poll_interval']
+    measure_memory = memory_limit_mb and os.path.isdir('/proc')
+
+    parent_conn, child_conn = _context.Pipe(duplex=False)
+    process = _context.Process(
+        target=_child_main,
+        args=(module_path, class_name, run_kwargs or {}, budget, child_conn),
+        name=f"scraper:{class_name}",
+    )
+    process.start()
+    child_conn.close()
+
+    result = {
+        'success': False,
+        'urls_data': [],
+        'error': None,
+        'budget': None,
+        'stop_reason': None,
+        'timed_out': False,
+        'exit_code': None,
+        'peak_memory_mb': 0.0,
+    }
+    deadline = time.monotonic() + timeout_seconds
+    received = False
+
+    try:
+        while True:
+            # Readable on a result and on EOF (child exited without sending one)
+            if parent_conn.poll(poll_interval):
+                try:
+                    result.update(json.loads(parent_conn.recv_bytes().decode('utf-8')))
+                    received = True
+                except EOFError:
+                    result['error'] = "Scraper process exited without a result"
+                break
+
+            if time.monotonic() > deadline:
+                result['timed_out'] = True
+                result['error'] = f"Timed out after {timeout_seconds:.0f}s"
+                break
+
+            if measure_memory:
+                rss = _group_rss_mb(process.pid)
+                result['peak_memory_mb'] = max(result['peak_memory_mb'], round(rss, 1))
+                if rss > memory_limit_mb:
+                    result['error'] = f"Memory limit exceeded ({rss:.0f} MB > {memory_limit_mb} MB)"
+                    break
+
+        if received:
+            # Give the scraper a moment to quit its browser and exit cleanly
+            process.join(ISOLATION_CONFIG['kill_grace_seconds'])
+    finally:
+        parent_conn.close()
+        _kill_tree(process, ISOLATION_CONFIG['kill_grace_seconds'])
+
+    result['exit_code'] = process.exitcode
+    if result['error']:
+        logger.error(f"[ISOLATED] {class_name}: {result['error']}")
+    return result
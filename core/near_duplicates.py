@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Breach Detection
+Finds breach records that describe a breach we already have, even when
+the company name is spelled slightly differently or the victim count was
+revised (both change create_breach_hash).
+
+Records are blocked by state and breach-date bucket, company names are
+compared with MinHash signatures over character n-grams, and LSH banding
+keeps the candidate search sub-quadratic.
+"""
+
+import hashlib
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.settings import NEAR_DUPLICATE_CONFIG
+
+
+# Mersenne prime for the universal hash family
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Words that do not distinguish one company from another
+COMPANY_STOPWORDS = {
+    'the', 'inc', 'incorporated', 'llc', 'llp', 'lp', 'ltd', 'limited', 'co', 'corp',
+    'corporation', 'company', 'pc', 'pllc', 'pa', 'plc', 'dba', 'and', 'of',
+}
+
+
+def normalize_company(name: str) -> str:
+    """
+    Reduce a company name to the words that identify it.
+
+    'The Henry Ford Health System, Inc.' -> 'henry ford health system'
+    """
+    words = re.sub(r'[^a-z0-9]+', ' ', (name or '').lower()).split()
+    return ' '.join(word for word in words if word not in COMPANY_STOPWORDS)
+
+
+def parse_record_date(record: Dict) -> Optional[datetime]:
+    """Breach date of a record ('date' is ISO when the scraper could parse it)."""
+    for value in (record.get('date'), record.get('breach_date')):
+        if not value:
+            continue
+        for fmt in ('%Y-%m-%d', '%m/%d/%Y', '%m/%d/%y'):
+            try:
+                return datetime.strptime(str(value).strip()[:10], fmt)
+            except ValueError:
+                continue
+    return None
+
+
+class NearDuplicateIndex:
+    """
+    LSH index of breach records.
+
+    add() indexes a record; find() returns the closest indexed record in the
+    same block (state plus date bucket, neighbouring buckets included) whose
+    company-name Jaccard similarity reaches the threshold.
+    """
+
+    def __init__(self, threshold: float = None, num_perm: int = None, bands: int = None,
+                 shingle_size: int = None, date_bucket_days: int = None):
+        """
+        Args:
+            threshold (float): Minimum Jaccard similarity of company n-grams
+            num_perm (int): MinHash signature length
+            bands (int): LSH bands (num_perm must be a multiple)
+            shingle_size (int): Character n-gram length
+            date_bucket_days (int): Width of the breach-date blocking bucket
+        """
+        self.threshold = threshold or NEAR_DUPLICATE_CONFIG['threshold']
+        self.num_perm = num_perm or NEAR_DUPLICATE_CONFIG['num_perm']
+        self.bands = bands or NEAR_DUPLICATE_CONFIG['bands']
+        self.shingle_size = shingle_size or NEAR_DUPLICATE_CONFIG['shingle_size']
+        self.date_bucket_days = date_bucket_days or NEAR_DUPLICATE_CONFIG['date_bucket_days']
+
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.rows = self.num_perm // self.bands
+
+        # Fixed seeds so signatures are comparable across runs
+        self._perms = [
+            (self._hash(f"a{i}") % (MERSENNE_PRIME - 1) + 1, self._hash(f"b{i}") % MERSENNE_PRIME)
+            for i in range(self.num_perm)
+        ]
+
+        self.records: List[Dict] = []
+        self._shingles: List[frozenset] = []
+        self._buckets: Dict[Tuple, List[int]] = {}
+        
+        # Company names share most of their n-grams, so cache each n-gram's
+        # permuted hashes instead of recomputing them per record
+        self._shingle_values: Dict[str, Tuple[int, ...]] = {}
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), 'little')
+
+    def shingles(self, name: str) -> frozenset:
+        """Character n-grams of a normalized company name."""
+        text = f" {normalize_company(name)} "
+        if len(text.strip()) == 0:
+            return frozenset()
+        n = self.shingle_size
+        return frozenset(text[i:i + n] for i in range(max(1, len(text) - n + 1)))
+
+    def signature(self, shingles: Iterable[str]) -> List[int]:
+        """MinHash signature of a shingle set."""
+        columns = []
+        for shingle in shingles:
+            values = self._shingle_values.get(shingle)
+            if values is None:
+                h = self._hash(shingle)
+                values = tuple((a * h + b) % MERSENNE_PRIME for a, b in self._perms)
+                self._shingle_values[shingle] = values
+            columns.append(values)
+        return [min(values) for values in zip(*columns)]
+
+    def block_keys(self, record: Dict, neighbours: bool = False) -> List[Tuple]:
+        """Blocking keys: (state, date bucket), optionally with the adjacent buckets."""
+        state = (record.get('state') or '').strip().upper()
+        date_obj = parse_record_date(record)
+        if date_obj is None:
+            return [(state, None)]
+
+        bucket = date_obj.toordinal() // self.date_bucket_days
+        offsets = (-1, 0, 1) if neighbours else (0,)
+        return [(state, bucket + offset) for offset in offsets]
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple]:
+        return [
+            (band, hash(tuple(signature[band * self.rows:(band + 1) * self.rows])))
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def jaccard(a: frozenset, b: frozenset) -> float:
+        if not a or not b:
+            return 0.0
+        return len(a & b) / len(a | b)
+
+    def add(self, record: Dict):
+        """Index a record."""
+        shingles = self.shingles(record.get('company', ''))
+        if not shingles:
+            return
+
+        index = len(self.records)
+        self.records.append(record)
+        self._shingles.append(shingles)
+
+        band_keys = self._band_keys(self.signature(shingles))
+        for block in self.block_keys(record):
+            for band_key in band_keys:
+                self._buckets.setdefault((block, band_key), []).append(index)
+
+    def add_many(self, records: Iterable[Dict]):
+        for record in records:
+            self.add(record)
+
+    def find(self, record: Dict) -> Optional[Tuple[Dict, float]]:
+        """
+        Find the indexed record this one most likely duplicates.
+
+        Returns:
+            tuple: (matched record, similarity) or None
+        """
+        shingles = self.shingles(record.get('company', ''))
+        if not shingles:
+            return None
+
+        candidates = set()
+        band_keys = self._band_keys(self.signature(shingles))
+        for block in self.block_keys(record, neighbours=True):
+            for band_key in band_keys:
+                candidates.update(self._buckets.get((block, band_key), ()))
+
+        best = None
+        for index in candidates:
+            candidate = self.records[index]
+            if candidate.get('breach_hash') and candidate.get('breach_hash') == record.get('breach_hash'):
+                continue
+            similarity = self.jaccard(shingles, self._shingles[index])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (candidate, similarity)
+        return best
+
+
+def split_updates(new_records: List[Dict], known_records: Iterable[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Separate genuinely new breaches from updates of ones already known.
+
+    Each update gets 'update_of' (the matched breach_hash), 'similarity' and
+    'previous' (the matched record's company and people_affected). Records in
+    new_records are also matched against earlier entries of the same list.
+
+    Args:
+        new_records: Breaches not seen before by exact hash
+        known_records: Breaches already reported (e.g. BreachStore records)
+
+    Returns:
+        tuple: (new breaches, updates)
+    """
+    index = NearDuplicateIndex()
+    index.add_many(known_records)
+
+    new, updates = [], []
+    for record in new_records:
+        match = index.find(record)
+        if match:
+            previous, similarity = match
+            record['update_of'] = previous.get('breach_hash')
+            record['similarity'] = round(similarity, 3)
+            record['previous'] = {
+                'company': previous.get('company', ''),
+                'people_affected': previous.get('people_affected', ''),
+            }
+            updates.append(record)
+        else:
+            new.append(record)
+        index.add(record)
+
+    return new, updates
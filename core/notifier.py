@@ -22,9 +22,17 @@ class EmailNotifier:
     Enhanced security and validation.
     """
     
-    def __init__(self):
-        """Initialize email notifier with configuration"""
+    def __init__(self, keep_alive: bool = False):
+        """
+        Initialize email notifier with configuration.
+        
+        Args:
+            keep_alive (bool): Reuse one SMTP connection for every email until
+                               close() (for processes that send several digests)
+        """
         self.logger = logging.getLogger(__name__)
+        self.keep_alive = keep_alive
+        self._server = None
         
         # Load email configuration
         self.smtp_server = EMAIL_CONFIG.get('smtp_server', '')
@@ -67,13 +75,11 @@ class EmailNotifier:
             msg.attach(html_part)
             
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30) as server:
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-                
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
+            if self.keep_alive:
+                self._send_persistent(msg)
+            else:
+                with self._connect() as server:
+                    server.send_message(msg)
             
             self.logger.info("Daily digest email sent successfully")
             return True
@@ -82,6 +88,42 @@ class EmailNotifier:
             self.logger.error(f"❌ Failed to send digest email: {e}")
             return False
 
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate an SMTP connection"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+        try:
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _send_persistent(self, msg):
+        """Send over the kept-alive connection, reconnecting once if the server dropped it"""
+        for attempt in range(2):
+            if self._server is None:
+                self._server = self._connect()
+            try:
+                self._server.send_message(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                self._server = None
+                if attempt:
+                    raise
+    
+    def close(self):
+        """Close the kept-alive SMTP connection (if any)"""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                self._server.close()
+            self._server = None
+    
     def _is_valid_email(self, email: str) -> bool:
         """
         Validate email format.
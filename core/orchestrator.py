@@ -13,12 +13,20 @@ from core.batch_processor import BatchProcessor
 
 import importlib
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from config.settings import SCRAPER_REGISTRY, get_scraper_info, get_all_enabled_scrapers
+from config.settings import (
+    SCRAPER_REGISTRY, ORCHESTRATOR_CONFIG, ISOLATION_CONFIG, BUDGET_CONFIG, get_scraper_info, get_all_enabled_scrapers
+)
 from core.batch_processor import BatchProcessor
+from core.isolated_runner import run_isolated
+from core.notifier import EmailNotifier
+from core.scraper_budget import ScraperBudget
+from utils.url_utils import get_domain
 
 
 class ScraperOrchestrator:
@@ -50,7 +58,8 @@ class ScraperOrchestrator:
         
     #     self.logger.info(f"Scraper orchestrator initialized (Digest Mode: {digest_mode})")
     
-    def __init__(self, digest_mode: bool = True, scraper_registry: dict = None, email_subject: str = None):
+    def __init__(self, digest_mode: bool = True, scraper_registry: dict = None, email_subject: str = None,
+                 max_workers: int = None, batch_processor: BatchProcessor = None, notifier: EmailNotifier = None):
         """
         Initialize the orchestrator.
         
@@ -61,10 +70,19 @@ class ScraperOrchestrator:
                                     If None, uses the default SCRAPER_REGISTRY.
             email_subject (str): Custom email subject line (optional).
                             If None, uses "Daily Mass Arbitration Links".
+            max_workers (int): Scrapers run concurrently (default from ORCHESTRATOR_CONFIG).
+                            1 runs them one after another.
+            batch_processor (BatchProcessor): Already-loaded dedupe state to share
+                            with other orchestrators (optional).
+            notifier (EmailNotifier): Notifier to send the digest with, e.g. one
+                            keeping its SMTP connection open (optional).
         """
         self.logger = logging.getLogger(__name__)
-        self.batch_processor = BatchProcessor()
+        self.batch_processor = batch_processor or BatchProcessor()
+        self.notifier = notifier
         self.digest_mode = digest_mode
+        self.max_workers = max(1, max_workers or ORCHESTRATOR_CONFIG['max_workers'])
+        self.per_domain_limit = max(1, ORCHESTRATOR_CONFIG['per_domain_limit'])
         
         # Allow custom scraper registry (for running different sets of scrapers)
         self.scraper_registry = scraper_registry if scraper_registry is not None else SCRAPER_REGISTRY
@@ -77,6 +95,9 @@ class ScraperOrchestrator:
         self.start_time = None
         self.end_time = None
         
+        # Monotonic time by which run_all_scrapers must be done (None = no window)
+        self.window_deadline = None
+        
         # Digest collection (all URLs from all scrapers)
         self.digest_urls = []  # All URLs collected
         self.digest_by_scraper = {}  # Organized by scraper
@@ -137,6 +158,22 @@ class ScraperOrchestrator:
         """
         Execute a single scraper.
         
+        Args:
+            scraper_key (str): Scraper key
+            scraper_info (dict): Scraper configuration
+            
+        Returns:
+            dict: Execution results
+        """
+        result = self._run_scraper(scraper_key, scraper_info)
+        self._collect_result(result)
+        return result
+    
+    def _run_scraper(self, scraper_key: str, scraper_info: Dict) -> Dict:
+        """
+        Import and run a scraper (no shared state is touched, so this is
+        safe to call from worker threads).
+        
         Args:
             scraper_key (str): Scraper key
             scraper_info (dict): Scraper configuration
@@ -157,26 +194,87 @@ class ScraperOrchestrator:
             'urls_found': 0,
             'urls_data': [],
             'error': None,
+            'budget': None,
             'start_time': datetime.now(),
             'end_time': None,
             'duration': 0
         }
         
+        budget = self._scraper_budget(scraper_info)
+        
         try:
+            if scraper_info.get('isolated') and ISOLATION_CONFIG['enabled']:
+                # Own process group with a deadline and memory ceiling
+                timeout_seconds = scraper_info.get('timeout_seconds') or ISOLATION_CONFIG['timeout_seconds']
+                if budget.max_seconds:
+                    # Killed only once it ignores its time budget
+                    timeout_seconds = min(timeout_seconds, budget.max_seconds + BUDGET_CONFIG['overrun_seconds'])
+                
+                outcome = run_isolated(
+                    module_path, class_name,
+                    timeout_seconds=timeout_seconds,
+                    memory_limit_mb=scraper_info.get('memory_limit_mb'),
+                    budget=budget.limits(),
+                )
+                result['urls_data'] = outcome['urls_data']
+                result['urls_found'] = len(outcome['urls_data'])
+                result['success'] = outcome['success']
+                result['error'] = outcome['error']
+                result['budget'] = outcome['budget']
+                return result
+            
             # Import scraper class
             scraper_class = self._import_scraper(module_path, class_name)
             if not scraper_class:
                 result['error'] = "Failed to import scraper class"
                 return result
             
-            # Instantiate and run scraper
+            # Instantiate and run scraper (scrapers without budget support run unlimited)
             scraper = scraper_class()
+            if hasattr(scraper, 'budget'):
+                scraper.budget = budget
             scraped_data = scraper.run()
             
             result['urls_found'] = len(scraped_data)
             result['urls_data'] = scraped_data
             result['success'] = True
+            if hasattr(scraper, 'budget'):
+                result['budget'] = scraper.budget.to_dict()
             
+        except Exception as e:
+            self.logger.error(f"Error in {scraper_name}: {e}", exc_info=True)
+            result['error'] = str(e)
+        
+        finally:
+            result['end_time'] = datetime.now()
+            result['duration'] = (result['end_time'] - result['start_time']).total_seconds()
+        
+        return result
+    
+    def _scraper_budget(self, scraper_info: Dict) -> ScraperBudget:
+        """Budget for a scraper starting now, capped by what is left of the run window."""
+        window_left = None
+        if self.window_deadline is not None:
+            window_left = self.window_deadline - time.monotonic()
+        return ScraperBudget.from_registry(scraper_info, max_seconds_cap=window_left)
+    
+    def _collect_result(self, result: Dict):
+        """
+        Dedupe a scraper's URLs and add them to the digest (or send them in
+        non-digest mode). Always called from the main thread, in registry
+        order, so the digest is the same whatever order scrapers finish in.
+        
+        Args:
+            result (dict): Result from _run_scraper
+        """
+        scraper_key = result['scraper_key']
+        scraper_name = result['scraper_name']
+        scraped_data = result['urls_data']
+        
+        if not result['success']:
+            return
+        
+        try:
             # In digest mode, collect URLs instead of sending immediately
             # if self.digest_mode and scraped_data:
             #     self.logger.info(f"Collecting {len(scraped_data)} URLs for digest")
@@ -219,12 +317,6 @@ class ScraperOrchestrator:
         except Exception as e:
             self.logger.error(f"Error in {scraper_name}: {e}", exc_info=True)
             result['error'] = str(e)
-        
-        finally:
-            result['end_time'] = datetime.now()
-            result['duration'] = (result['end_time'] - result['start_time']).total_seconds()
-        
-        return result
     
     # def send_daily_digest(self):
     #     """
@@ -307,8 +399,7 @@ class ScraperOrchestrator:
         email_body = self._build_digest_email_body()
         
         # Send using notifier
-        from core.notifier import EmailNotifier
-        notifier = EmailNotifier()
+        notifier = self.notifier or EmailNotifier()
         
         success = notifier.send_digest_email(
             subject=subject,
@@ -580,9 +671,11 @@ class ScraperOrchestrator:
         self.digest_urls = []
         self.digest_by_scraper = {}
         
-        total_scrapers = 0
+        run_window = BUDGET_CONFIG['run_window_seconds']
+        self.window_deadline = time.monotonic() + run_window if run_window else None
         
-        # Iterate through all categories and scrapers
+        # Enabled scrapers in registry order
+        jobs = []
         for category, scrapers in self.scraper_registry.items():
             self.logger.info(f"Processing category: {category}")
             
@@ -592,31 +685,90 @@ class ScraperOrchestrator:
                     self.logger.info(f"Skipping disabled scraper: {scraper_info['name']}")
                     continue
                 
-                total_scrapers += 1
-                
-                # Execute scraper
+                jobs.append((scraper_key, scraper_info))
+        
+        total_scrapers = len(jobs)
+        
+        if self.max_workers > 1 and total_scrapers > 1:
+            self._run_concurrently(jobs)
+        else:
+            for scraper_key, scraper_info in jobs:
                 result = self._execute_scraper(scraper_key, scraper_info)
                 self.results[scraper_key] = result
-                
-                # Log result
-                if result['success']:
-                    self.logger.info(
-                        f"✅ {result['scraper_name']}: {result['urls_found']} URLs "
-                        f"in {result['duration']:.2f}s"
-                    )
-                else:
-                    self.logger.error(
-                        f"❌ {result['scraper_name']}: {result['error']}"
-                    )
+                self._log_result(result)
         
         self.end_time = datetime.now()
         self.logger.info(f"Completed execution of {total_scrapers} scrapers")  
         
+        # Commit every URL seen this run in one dedupe-store transaction
+        self.batch_processor.flush_dedupe_store()
+        
         # Send daily digest if in digest mode
         if self.digest_mode:
             self.logger.info("Preparing to send daily digest email...")
             self.send_daily_digest()
     
+    def _run_concurrently(self, jobs: List):
+        """
+        Run scrapers on a thread pool and collect their results in job order.
+        
+        Scraping (network wait) overlaps; deduplication and digest building
+        stay on this thread and follow registry order, so the digest is the
+        same as a serial run. At most per_domain_limit scrapers hit the same
+        domain at once.
+        
+        Args:
+            jobs (list): (scraper_key, scraper_info) pairs in registry order
+        """
+        domain_locks = {}
+        for scraper_key, scraper_info in jobs:
+            domain = self._scraper_domain(scraper_key, scraper_info)
+            if domain not in domain_locks:
+                domain_locks[domain] = threading.BoundedSemaphore(self.per_domain_limit)
+        
+        def run(scraper_key, scraper_info):
+            with domain_locks[self._scraper_domain(scraper_key, scraper_info)]:
+                return self._run_scraper(scraper_key, scraper_info)
+        
+        workers = min(self.max_workers, len(jobs))
+        self.logger.info(f"Running {len(jobs)} scrapers with {workers} workers "
+                         f"(max {self.per_domain_limit} per domain)")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scraper') as executor:
+            futures = [executor.submit(run, scraper_key, scraper_info) for scraper_key, scraper_info in jobs]
+            
+            for (scraper_key, scraper_info), future in zip(jobs, futures):
+                result = future.result()
+                self._collect_result(result)
+                self.results[scraper_key] = result
+                self._log_result(result)
+    
+    @staticmethod
+    def _scraper_domain(scraper_key: str, scraper_info: Dict) -> str:
+        """Domain a scraper fetches from (its key when the registry has no URL)."""
+        domain = get_domain(scraper_info.get('url', ''))
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain or scraper_key
+    
+    def _log_result(self, result: Dict):
+        """Log one scraper's outcome"""
+        budget = result.get('budget') or {}
+        if result['success'] and budget.get('exceeded'):
+            self.logger.warning(
+                f"⏱️ {result['scraper_name']}: {result['urls_found']} URLs "
+                f"in {result['duration']:.2f}s (stopped early: {budget['exceeded']} budget spent)"
+            )
+        elif result['success']:
+            self.logger.info(
+                f"✅ {result['scraper_name']}: {result['urls_found']} URLs "
+                f"in {result['duration']:.2f}s"
+            )
+        else:
+            self.logger.error(
+                f"❌ {result['scraper_name']}: {result['error']}"
+            )
+    
     def get_statistics(self) -> Dict:
         """
         Get execution statistics.
@@ -660,6 +812,8 @@ class ScraperOrchestrator:
             status = "✅" if result['success'] else "❌"
             print(f"  {status} {result['scraper_name']}")
             print(f"     URLs: {result['urls_found']}, Duration: {result['duration']:.2f}s")
+            if (result.get('budget') or {}).get('exceeded'):
+                print(f"     Budget: {result['budget']['exceeded']} reached, partial results")
             if result['error']:
                 print(f"     Error: {result['error']}")
         
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Partitioned Scraped Data Store
+Appends only new items to per-scraper, per-month gzip JSON Lines files,
+instead of writing a full timestamped JSON file on every run.
+
+Layout:
+    data/partitions/index.json                 scraper -> month -> item count
+    data/partitions/<scraper>/<YYYY-MM>.jsonl.gz
+    data/partitions/<scraper>/keys.bin         DigestSet of stored URL keys
+    data/partitions/<scraper>/contents.bin     DigestSet of stored item contents
+"""
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from config.settings import SCRAPED_STORAGE_CONFIG
+from utils.digest_set import DigestSet, url_digest
+from utils.file_utils import file_lock, load_json, update_json
+from utils.url_utils import canonical_key
+
+
+def item_url(item: Dict) -> Optional[str]:
+    """URL of a scraped item (url/link/href)."""
+    return item.get('url') or item.get('link') or item.get('href')
+
+
+# Fields that differ on every scrape without the item itself changing
+VOLATILE_FIELDS = ('scraped_at',)
+
+
+def item_content_digest(item: Dict, key: str) -> int:
+    """
+    Digest of an item's URL key and content (volatile fields left out), so
+    an item with no URL, or a known URL with changed content, is still stored.
+    """
+    content = {
+        field: value for field, value in item.items()
+        if field not in VOLATILE_FIELDS and field not in ('url', 'link', 'href')
+    }
+    return url_digest(f"{key}|{json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)}")
+
+
+def item_month(item: Dict, default: str) -> str:
+    """Partition month of an item from its 'scraped_at' timestamp."""
+    scraped_at = str(item.get('scraped_at') or '')
+    try:
+        return datetime.fromisoformat(scraped_at[:19]).strftime('%Y-%m')
+    except ValueError:
+        return default
+
+
+class PartitionedStore:
+    """
+    Per-scraper, per-month compressed JSONL store with a small index.
+
+    Items are deduplicated per scraper by canonical URL key plus content: an
+    item is skipped only when the same content was stored under the same key
+    (items without a URL are keyed by content alone). Each append adds one
+    gzip member to the month's file, so nothing is ever rewritten.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Initialize the store.
+
+        Args:
+            root (Path): Store directory (default from SCRAPED_STORAGE_CONFIG)
+        """
+        self.root = Path(root or SCRAPED_STORAGE_CONFIG['partitions_dir'])
+        self.index_file = self.root / 'index.json'
+
+    def scraper_dir(self, scraper_key: str) -> Path:
+        return self.root / scraper_key
+
+    def load_keys(self, scraper_key: str) -> DigestSet:
+        """URL key digests already stored for a scraper."""
+        return self._load_digests(scraper_key, 'keys.bin', self.rebuild_keys)
+
+    def load_contents(self, scraper_key: str) -> DigestSet:
+        """Content digests already stored for a scraper."""
+        return self._load_digests(scraper_key, 'contents.bin', self.rebuild_contents)
+
+    def _load_digests(self, scraper_key: str, name: str, rebuild) -> DigestSet:
+        """Load a scraper's digest file, rebuilding it from the partitions if missing or unreadable."""
+        digest_file = self.scraper_dir(scraper_key) / name
+        if digest_file.exists():
+            try:
+                return DigestSet.load(digest_file)
+            except ValueError as e:
+                print(f"[PARTITIONS] Rebuilding {name} for {scraper_key}: {e}")
+        return rebuild(scraper_key)
+
+    def rebuild_keys(self, scraper_key: str) -> DigestSet:
+        """Recompute a scraper's key digests from its partitions."""
+        keys = DigestSet()
+        for item in self.iter_items(scraper_key):
+            key = canonical_key(item_url(item) or '')
+            if key:
+                keys.add(key)
+        return keys
+
+    def rebuild_contents(self, scraper_key: str) -> DigestSet:
+        """Recompute a scraper's content digests from its partitions."""
+        contents = DigestSet()
+        for item in self.iter_items(scraper_key):
+            contents.add_digest(item_content_digest(item, canonical_key(item_url(item) or '')))
+        return contents
+
+    def append(self, scraper_key: str, items: List[Dict], default_month: Optional[str] = None) -> Dict[str, int]:
+        """
+        Append the items not stored yet: new URLs, known URLs whose content
+        changed, and items without a URL whose content is new.
+
+        Args:
+            scraper_key (str): Scraper the items belong to
+            items: Scraped item dictionaries
+            default_month (str): 'YYYY-MM' for items without 'scraped_at' (default: current month)
+
+        Returns:
+            dict: Number of new items written per month
+        """
+        default_month = default_month or datetime.now().strftime('%Y-%m')
+        scraper_dir = self.scraper_dir(scraper_key)
+        scraper_dir.mkdir(parents=True, exist_ok=True)
+        keys_file = scraper_dir / 'keys.bin'
+        contents_file = scraper_dir / 'contents.bin'
+        counts = {'new': 0, 'updated': 0, 'keyless': 0, 'unchanged': 0, 'invalid': 0}
+
+        with file_lock(keys_file):
+            keys = self.load_keys(scraper_key)
+            contents = self.load_contents(scraper_key)
+
+            by_month: Dict[str, List[Dict]] = {}
+            for item in items:
+                if not isinstance(item, dict):
+                    counts['invalid'] += 1
+                    continue
+
+                url = item_url(item)
+                key = canonical_key(url) if url else ''
+                digest = item_content_digest(item, key)
+                if contents.contains_digest(digest):
+                    counts['unchanged'] += 1
+                    continue
+
+                if not key:
+                    counts['keyless'] += 1
+                elif key in keys:
+                    counts['updated'] += 1
+                else:
+                    counts['new'] += 1
+                    keys.add(key)
+                contents.add_digest(digest)
+                by_month.setdefault(item_month(item, default_month), []).append(item)
+
+            for month, month_items in by_month.items():
+                lines = ''.join(json.dumps(item, ensure_ascii=False) + '\n' for item in month_items)
+                with gzip.open(scraper_dir / f"{month}.jsonl.gz", 'at', encoding='utf-8') as f:
+                    f.write(lines)
+
+            if by_month:
+                keys.save(keys_file)
+                contents.save(contents_file)
+            keys.close()
+            contents.close()
+
+        if counts['updated'] or counts['keyless'] or counts['invalid']:
+            print(
+                f"[PARTITIONS] {scraper_key}: {counts['new']} new, {counts['updated']} updated, "
+                f"{counts['keyless']} without URL, {counts['unchanged']} unchanged skipped, "
+                f"{counts['invalid']} non-object items skipped"
+            )
+
+        if by_month:
+            self._update_index(scraper_key, {month: len(month_items) for month, month_items in by_month.items()})
+
+        return {month: len(month_items) for month, month_items in by_month.items()}
+
+    def _update_index(self, scraper_key: str, added: Dict[str, int]):
+        def merge(index):
+            index = index or {}
+            months = index.setdefault(scraper_key, {})
+            for month, count in added.items():
+                entry = months.setdefault(month, {'file': f"{scraper_key}/{month}.jsonl.gz", 'items': 0})
+                entry['items'] += count
+                entry['updated_at'] = datetime.now().isoformat()
+            return index
+
+        update_json(self.index_file, merge, default={})
+
+    def get_index(self) -> Dict:
+        """scraper -> month -> {'file', 'items', 'updated_at'}"""
+        return load_json(self.index_file, default={}) or {}
+
+    def iter_items(self, scraper_key: Optional[str] = None, month: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Stream stored items, oldest partition first.
+
+        Args:
+            scraper_key (str): Only this scraper (default: all)
+            month (str): Only this 'YYYY-MM' partition (default: all)
+        """
+        scraper_dirs = [self.scraper_dir(scraper_key)] if scraper_key else sorted(
+            path for path in self.root.glob('*') if path.is_dir()
+        )
+        for scraper_dir in scraper_dirs:
+            pattern = f"{month}.jsonl.gz" if month else '*.jsonl.gz'
+            for partition in sorted(scraper_dir.glob(pattern)):
+                with gzip.open(partition, 'rt', encoding='utf-8') as f:
+                    try:
+                        for line in f:
+                            if line.strip():
+                                yield json.loads(line)
+                    except EOFError:
+                        # A crash mid-append can leave a truncated last gzip member
+                        print(f"[PARTITIONS] {partition} ends in a truncated write")
+
+    def iter_key_digests(self) -> Iterator[DigestSet]:
+        """Key digest set of every scraper (for duplicate checks)."""
+        for keys_file in sorted(self.root.glob('*/keys.bin')):
+            try:
+                yield DigestSet.load(keys_file)
+            except ValueError as e:
+                print(f"[PARTITIONS] Skipping {keys_file}: {e}")
+
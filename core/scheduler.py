@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Multi-Registry Scheduler
+Runs several scraper registries one after another in a single process.
+Settings, dedupe state, the HTTP connection pool, the browser pool and one SMTP
+connection are set up once and shared; every registry still gets its own
+digest email. Scrapers run isolated (registry 'isolated': True) are the
+exception: each gets a fresh process with its own browsers and connections.
+"""
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from config.settings import SCHEDULER_CONFIG
+from core.batch_processor import BatchProcessor
+from core.driver_pool import shutdown_driver_pools
+from core.http_session import close_http_pool
+from core.notifier import EmailNotifier
+from core.orchestrator import ScraperOrchestrator
+
+
+class Scheduler:
+    """
+    Ordered list of jobs sharing one process.
+
+    Registry jobs run through a ScraperOrchestrator that reuses the
+    scheduler's BatchProcessor and notifier; custom jobs (such as the USA
+    Today run) are callables that accept notifier=.
+    """
+
+    def __init__(self, max_workers: int = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers (int): Concurrent scrapers per registry (default from ORCHESTRATOR_CONFIG)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
+
+        # Loaded once for every registry
+        self.batch_processor = BatchProcessor()
+        self.notifier = EmailNotifier(keep_alive=True)
+
+        self.jobs: List = []
+        self.results: Dict[str, Dict] = {}
+
+    def add_registry(self, name: str, registry: Optional[Dict] = None, email_subject: str = None,
+                     digest_mode: bool = True):
+        """
+        Queue a scraper registry.
+
+        Args:
+            name (str): Job name (a SCHEDULER_CONFIG['registries'] key when registry is omitted)
+            registry (dict): Scraper registry (default: SCHEDULER_CONFIG entry for name)
+            email_subject (str): Digest subject (default: SCHEDULER_CONFIG entry for name)
+            digest_mode (bool): One digest email instead of per-scraper emails
+        """
+        if registry is None:
+            if name not in SCHEDULER_CONFIG['registries']:
+                raise KeyError(f"Unknown registry '{name}'")
+            entry = SCHEDULER_CONFIG['registries'][name]
+            registry = entry['registry']
+            email_subject = email_subject or entry.get('email_subject')
+
+        def run_registry():
+            orchestrator = ScraperOrchestrator(
+                digest_mode=digest_mode,
+                scraper_registry=registry,
+                email_subject=email_subject,
+                max_workers=self.max_workers,
+                batch_processor=self.batch_processor,
+                notifier=self.notifier,
+            )
+            orchestrator.run_all_scrapers()
+            orchestrator.print_summary()
+            return orchestrator.get_statistics()
+
+        self.jobs.append((name, run_registry))
+
+    def add_job(self, name: str, func: Callable):
+        """
+        Queue a custom job.
+
+        Args:
+            name (str): Job name
+            func (callable): Called as func(notifier=...); its return value is the job's result
+        """
+        self.jobs.append((name, lambda: func(notifier=self.notifier)))
+
+    def run(self) -> Dict[str, Dict]:
+        """
+        Run every queued job in order. A failing job is logged and the
+        next one still runs.
+
+        Returns:
+            dict: Job name -> {'success', 'duration', 'result', 'error'}
+        """
+        self.results = {}
+        try:
+            for name, job in self.jobs:
+                self.logger.info(f"[SCHEDULER] Running {name}")
+                start = time.monotonic()
+                outcome = {'success': False, 'duration': 0, 'result': None, 'error': None}
+                try:
+                    outcome['result'] = job()
+                    outcome['success'] = True
+                except Exception as e:
+                    self.logger.error(f"[SCHEDULER] {name} failed: {e}", exc_info=True)
+                    outcome['error'] = str(e)
+                outcome['duration'] = time.monotonic() - start
+                self.results[name] = outcome
+        finally:
+            self.close()
+
+        return self.results
+
+    def close(self):
+        """Release the shared SMTP connection, browsers and HTTP connections."""
+        self.notifier.close()
+        self.batch_processor.flush_dedupe_store()
+        shutdown_driver_pools()
+        close_http_pool()
+
+    def print_summary(self):
+        """Print one line per job"""
+        print("\n" + "="*70)
+        print("  SCHEDULER SUMMARY")
+        print("="*70)
+        for name, outcome in self.results.items():
+            status = "✅" if outcome['success'] else "❌"
+            print(f"  {status} {name}: {outcome['duration']:.2f}s")
+            if outcome['error']:
+                print(f"     Error: {outcome['error']}")
+        print("="*70 + "\n")
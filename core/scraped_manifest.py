@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Scraped Data Manifest
+Remembers, per scraped data file, its size and mtime, with the digests of
+the URLs it contains kept in a binary DigestSet file, so BatchProcessor only
+parses files that are new or changed. The union of all digests is kept next
+to it as a memory-mappable DigestSet.
+
+With the SQLite dedupe backend the store's imported_files table is the
+manifest: pass store= and refresh()/rebuild() import into the store instead.
+"""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from config.settings import BATCH_CONFIG, SCRAPED_DIR, SCRAPED_STORAGE_CONFIG
+from utils.digest_set import DigestSet, url_digest
+from utils.file_utils import atomic_write_json
+from utils.json_stream import iter_json_keys
+from utils.url_utils import canonical_key
+
+
+# v2: 64-bit blake2b digests (hex) instead of md5
+# v3: digests of canonical URL keys
+# v4: per-file digests in binary DigestSet files instead of hex lists
+MANIFEST_VERSION = 4
+
+
+class ScrapedManifest:
+    """
+    Persistent index of the scraped data directory.
+
+    Each entry maps a file name to {'size', 'mtime', 'count'}; the file's
+    digests live in digest_dir/<name>.bin. refresh() re-parses only files
+    whose size or mtime changed and drops entries for files that no longer
+    exist. Every change restamps 'generation', which is stamped into the
+    union digest file so a stale one is never loaded. When files were only
+    added or changed, the saved union is extended instead of rebuilt.
+    """
+
+    def __init__(self, manifest_file=None, scraped_dir=None, digest_file=None, digest_dir=None,
+                 store=None, source: str = 'url_seen'):
+        """
+        Initialize the manifest.
+
+        Args:
+            manifest_file: Manifest path (default from BATCH_CONFIG)
+            scraped_dir: Directory of scraped JSON files (default SCRAPED_DIR)
+            digest_file: Union DigestSet file (default from BATCH_CONFIG)
+            digest_dir: Directory of per-file DigestSet files (default from BATCH_CONFIG)
+            store: DedupeStore to import into instead of keeping digest files (optional)
+            source: Dedupe store source for scraped URLs (with store=)
+        """
+        self.manifest_file = Path(manifest_file or BATCH_CONFIG['manifest_file'])
+        self.scraped_dir = Path(scraped_dir or SCRAPED_DIR)
+        self.digest_file = Path(digest_file or BATCH_CONFIG['digest_file'])
+        self.digest_dir = Path(digest_dir or BATCH_CONFIG['file_digest_dir'])
+        self.store = store
+        self.source = source
+        self.files: Dict[str, Dict] = {}
+        self.generation = 0
+
+        # Set by refresh(): digests of new or changed files and the generation
+        # they extend (None when files were removed and the union must be rebuilt)
+        self._added: Set[int] = set()
+        self._base_generation: Optional[int] = None
+
+        if self.store is None:
+            self.load()
+
+    def load(self):
+        """Load the manifest from disk (an unreadable or outdated one starts empty)."""
+        self.files = {}
+        self.generation = 0
+        if not self.manifest_file.exists():
+            return
+
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[MANIFEST] Could not read {self.manifest_file.name}, rebuilding: {e}")
+            return
+
+        if data.get('version') == MANIFEST_VERSION:
+            self.files = data.get('files', {})
+            self.generation = data.get('generation', 0)
+
+    def save(self):
+        """Write the manifest atomically."""
+        atomic_write_json({
+            'version': MANIFEST_VERSION,
+            'generation': self.generation,
+            'updated_at': datetime.now().isoformat(),
+            'files': self.files
+        }, self.manifest_file, indent=None)
+
+    @staticmethod
+    def parse_file(file_path: Path) -> Set[int]:
+        """Stream one scraped JSON file into canonical URL key digests."""
+        keys = (canonical_key(url) for url in iter_json_keys(file_path))
+        return {url_digest(key) for key in keys if key}
+
+    def file_digest_path(self, name: str) -> Path:
+        """DigestSet file holding one scraped file's digests."""
+        return self.digest_dir / f"{name}.bin"
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the manifest in line with the scraped directory.
+
+        Returns:
+            dict: Counts of 'parsed', 'unchanged' and 'removed' files
+        """
+        if self.store is not None:
+            return self._refresh_store(force=False)
+
+        stats = {'parsed': 0, 'unchanged': 0, 'removed': 0}
+        present = set()
+        added = set()
+
+        for file_path in self.scraped_dir.glob("*.json"):
+            name = file_path.name
+            present.add(name)
+            stat = file_path.stat()
+
+            entry = self.files.get(name)
+            if (entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime
+                    and self.file_digest_path(name).exists()):
+                stats['unchanged'] += 1
+                continue
+
+            try:
+                digests = self.parse_file(file_path)
+            except json.JSONDecodeError as e:
+                print(f"[WARNING] Could not parse {name}: {e}")
+                digests = set()
+            except Exception as e:
+                print(f"[WARNING] Error loading {name}: {e}")
+                continue
+
+            DigestSet(digests).save(self.file_digest_path(name))
+            added.update(digests)
+            self.files[name] = {
+                'size': stat.st_size,
+                'mtime': stat.st_mtime,
+                'count': len(digests)
+            }
+            stats['parsed'] += 1
+
+        for name in list(self.files):
+            if name not in present:
+                del self.files[name]
+                self.file_digest_path(name).unlink(missing_ok=True)
+                stats['removed'] += 1
+
+        base_generation = self.generation
+        if stats['parsed'] or stats['removed'] or not self.manifest_file.exists():
+            self.generation = time.time_ns()
+            self.save()
+
+        self._added = added
+        self._base_generation = None if stats['removed'] else base_generation
+        return stats
+
+    def rebuild(self) -> Dict[str, int]:
+        """Discard the manifest and re-parse every scraped file."""
+        if self.store is not None:
+            return self._refresh_store(force=True)
+
+        self.files = {}
+        stats = self.refresh()
+        self._base_generation = None
+        return stats
+
+    def _refresh_store(self, force: bool) -> Dict[str, int]:
+        """
+        Import new or changed scraped files and partitions into the dedupe store.
+
+        Entries for files that no longer exist are dropped from the store's
+        import list; the URLs they contributed stay seen.
+        """
+        stats = {'parsed': 0, 'unchanged': 0, 'removed': 0}
+        data_files = list(self.scraped_dir.glob("*.json"))
+        data_files += SCRAPED_STORAGE_CONFIG['partitions_dir'].glob("*/*.jsonl.gz")
+
+        for file_path in data_files:
+            if not force and not self.store.needs_import(self.source, file_path):
+                stats['unchanged'] += 1
+                continue
+            self.store.import_file(self.source, file_path, force=True, key_func=canonical_key)
+            stats['parsed'] += 1
+
+        stats['removed'] = self.store.prune_imported_files(self.source)
+        return stats
+
+    def digests(self) -> DigestSet:
+        """Union of the per-file digest sets."""
+        union = DigestSet()
+        for name in self.files:
+            try:
+                file_set = DigestSet.load(self.file_digest_path(name))
+            except (OSError, ValueError) as e:
+                print(f"[MANIFEST] Skipping digests of {name}: {e}")
+                continue
+            union.update_digests(file_set)
+            file_set.close()
+        union.compact()
+        return union
+
+    def digest_set(self) -> DigestSet:
+        """
+        Digest set for the current manifest.
+
+        Memory-maps the saved digest file when it matches this generation,
+        extends it when refresh() only added or changed files (URLs a changed
+        file dropped stay until the next rebuild), and otherwise rebuilds it
+        from the per-file digest sets. The result is saved.
+        """
+        if self.digest_file.exists():
+            try:
+                digest_set = DigestSet.load(self.digest_file)
+                if digest_set.generation == self.generation:
+                    return digest_set
+                if self._base_generation is not None and digest_set.generation == self._base_generation:
+                    digest_set.update_digests(self._added)
+                    digest_set.save(self.digest_file, generation=self.generation)
+                    return digest_set
+                digest_set.close()
+            except ValueError as e:
+                print(f"[MANIFEST] Ignoring {self.digest_file.name}: {e}")
+
+        digest_set = self.digests()
+        digest_set.save(self.digest_file, generation=self.generation)
+        return digest_set
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Scraper Budgets
+Wall-time, request and byte limits for a single scraper run. Scrapers
+check their budget between requests and stop with what they have
+scraped so far once it is spent, so one misbehaving source cannot eat
+the whole cron window.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from config.settings import BUDGET_CONFIG
+
+
+class BudgetExceeded(Exception):
+    """Raised by ScraperBudget.check() once any limit is reached."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class ScraperBudget:
+    """
+    Limits for one scraper run (None or 0 = unlimited).
+
+    The clock starts on creation (or start()); usage is recorded with
+    record_request() / record_bytes() and compared with check() or
+    exceeded() before each new request. Recording is thread-safe, so
+    one budget can cover several worker threads.
+    """
+
+    def __init__(self, max_seconds: Optional[float] = None, max_requests: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Initialize the budget.
+
+        Args:
+            max_seconds (float): Wall-clock seconds for the run
+            max_requests (int): HTTP requests (page loads for browser scrapers)
+            max_bytes (int): Response bytes received
+        """
+        self.max_seconds = max_seconds or None
+        self.max_requests = max_requests or None
+        self.max_bytes = max_bytes or None
+
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes = 0
+        self.exceeded_reason = None
+        self.start()
+
+    @classmethod
+    def from_registry(cls, scraper_info: Optional[Dict], max_seconds_cap: Optional[float] = None) -> 'ScraperBudget':
+        """
+        Build a budget from BUDGET_CONFIG['defaults'], overridden by the
+        registry entry's 'budget' dict. Every scraper is limited, including
+        entries without a 'budget' dict; set a limit to 0 to lift it.
+
+        Args:
+            scraper_info (dict): Registry entry (optional)
+            max_seconds_cap (float): Upper bound on max_seconds, e.g. the time left
+                                     in the run window
+
+        Returns:
+            ScraperBudget: New budget
+        """
+        limits = dict(BUDGET_CONFIG['defaults'])
+        limits.update((scraper_info or {}).get('budget') or {})
+
+        max_seconds = limits.get('max_seconds') or None
+        if max_seconds_cap is not None:
+            # At least a second, so an exhausted window still stops the scraper at once
+            max_seconds = max(min(max_seconds or max_seconds_cap, max_seconds_cap), 1.0)
+
+        return cls(
+            max_seconds=max_seconds,
+            max_requests=limits.get('max_requests'),
+            max_bytes=limits.get('max_bytes'),
+        )
+
+    def start(self):
+        """Restart the clock and clear recorded usage."""
+        self._started = time.monotonic()
+        self.requests = 0
+        self.bytes = 0
+        self.exceeded_reason = None
+
+    # ========================================================================
+    # USAGE
+    # ========================================================================
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_bytes(self, nbytes: int):
+        with self._lock:
+            self.bytes += nbytes
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def remaining_seconds(self) -> Optional[float]:
+        """Seconds left (None when there is no time limit)."""
+        if self.max_seconds is None:
+            return None
+        return max(self.max_seconds - self.elapsed(), 0.0)
+
+    def request_timeout(self, timeout: float) -> float:
+        """A request timeout that does not run past the time limit."""
+        remaining = self.remaining_seconds()
+        if remaining is None:
+            return timeout
+        return max(min(timeout, remaining), 1.0)
+
+    # ========================================================================
+    # CHECKS
+    # ========================================================================
+
+    def exceeded(self) -> Optional[str]:
+        """
+        Check whether another request would go over budget.
+
+        Returns:
+            str: 'max_seconds', 'max_requests' or 'max_bytes', or None
+        """
+        if self.max_seconds is not None and self.elapsed() >= self.max_seconds:
+            self.exceeded_reason = 'max_seconds'
+        elif self.max_requests is not None and self.requests >= self.max_requests:
+            self.exceeded_reason = 'max_requests'
+        elif self.max_bytes is not None and self.bytes >= self.max_bytes:
+            self.exceeded_reason = 'max_bytes'
+        return self.exceeded_reason
+
+    def check(self):
+        """
+        Raises:
+            BudgetExceeded: If any limit has been reached
+        """
+        reason = self.exceeded()
+        if reason:
+            raise BudgetExceeded(reason)
+
+    def limits(self) -> Dict:
+        """Constructor arguments (picklable, for passing to another process)."""
+        return {'max_seconds': self.max_seconds, 'max_requests': self.max_requests, 'max_bytes': self.max_bytes}
+
+    def to_dict(self) -> Dict:
+        return {
+            **self.limits(),
+            'elapsed_seconds': round(self.elapsed(), 2),
+            'requests': self.requests,
+            'bytes': self.bytes,
+            'exceeded': self.exceeded_reason,
+        }
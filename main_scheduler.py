@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Run Several Scraper Registries In One Process
+Replaces one cron entry per main_*.py: settings, dedupe state, the HTTP
+connection pool, browsers and the SMTP connection are set up once, and each
+registry still sends its own digest email. Isolated scrapers (registry
+'isolated': True) still start a fresh process and browser per run.
+
+    python main_scheduler.py                      # SCHEDULER_CONFIG['default_registries']
+    python main_scheduler.py mass_arb usatoday    # only these, in this order
+    python main_scheduler.py --list
+"""
+
+import argparse
+import sys
+
+from config.settings import SCHEDULER_CONFIG
+from core.scheduler import Scheduler
+from main_usatoday_breaches import run_usatoday_breaches
+
+
+# Registries with their own run function instead of a ScraperOrchestrator
+CUSTOM_JOBS = {
+    'usatoday': run_usatoday_breaches,
+}
+
+
+def available_registries():
+    return list(SCHEDULER_CONFIG['registries']) + list(CUSTOM_JOBS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run several scraper registries in one process')
+    parser.add_argument('registries', nargs='*', help='Registries to run, in order (default from SCHEDULER_CONFIG)')
+    parser.add_argument('--workers', type=int, help='Concurrent scrapers per registry')
+    parser.add_argument('--list', action='store_true', help='List available registries')
+    args = parser.parse_args()
+
+    if args.list:
+        for name in available_registries():
+            print(name)
+        return 0
+
+    names = args.registries or SCHEDULER_CONFIG['default_registries']
+    unknown = [name for name in names if name not in available_registries()]
+    if unknown:
+        parser.error(f"Unknown registries: {', '.join(unknown)} (available: {', '.join(available_registries())})")
+
+    scheduler = Scheduler(max_workers=args.workers)
+    for name in names:
+        if name in CUSTOM_JOBS:
+            scheduler.add_job(name, CUSTOM_JOBS[name])
+        else:
+            scheduler.add_registry(name)
+
+    results = scheduler.run()
+    scheduler.print_summary()
+
+    return 0 if all(outcome['success'] for outcome in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,34 +5,108 @@ Company names link to USA Today search results
 """
 
 import json
+import os
 from datetime import datetime
-from pathlib import Path
-from config.settings import USATODAY_REGISTRY
+from config.settings import USATODAY_REGISTRY, USATODAY_CONFIG, SCRAPED_DIR, NEAR_DUPLICATE_CONFIG, ISOLATION_CONFIG
+from core.breach_store import BreachStore
+from core.change_feed import ChangeFeed, COMPLETE_STOP_REASONS
+from core.dedupe_store import get_dedupe_store, is_sqlite_backend
+from core.isolated_runner import run_isolated
+from core.scraper_budget import ScraperBudget
+from core.near_duplicates import split_updates
+from utils.file_utils import atomic_write_json, file_lock
 from core.notifier import EmailNotifier
 
 
 class USATodayTracker:
-    """Track sent USA Today breaches"""
+    """
+    Track sent USA Today breaches.
+    
+    Identifiers live in a JSON snapshot plus an append-only journal of the
+    ones sent since. Saving only appends the new identifiers; the journal is
+    folded into the snapshot once it grows past compact_every entries.
+    
+    Appends and compaction hold a file lock, and compaction merges in
+    whatever other runners wrote, so parallel entry points can share the
+    tracker.
+    
+    With the SQLite dedupe backend the identifiers live in the shared store
+    instead, and sent_urls is a set-like view over it.
+    """
+    
+    dedupe_source = 'usatoday'
     
     def __init__(self):
-        self.tracking_file = Path('data/scraped/usatoday_sent_urls.json')
+        self.tracking_file = SCRAPED_DIR / 'usatoday_sent_urls.json'
+        self.journal_file = self.tracking_file.with_suffix('.journal')
+        self.compact_every = USATODAY_CONFIG['tracker_compact_every']
+        self.journal_entries = 0
+        self.dedupe_store = get_dedupe_store() if is_sqlite_backend() else None
         self.sent_urls = self.load_sent_urls()
     
     def load_sent_urls(self):
+        if self.dedupe_store is not None:
+            sent_urls = self.dedupe_store.view(self.dedupe_source)
+            print(f"[TRACKER] {len(sent_urls)} previously sent breaches in dedupe store")
+            return sent_urls
+        
+        sent_urls, self.journal_entries = self.read_tracking_files()
+        print(f"[TRACKER] Loaded {len(sent_urls)} previously sent breaches ({self.journal_entries} from journal)")
+        return sent_urls
+    
+    def read_tracking_files(self):
+        """
+        Read the snapshot and journal as currently on disk.
+        
+        Returns:
+            tuple: (set of identifiers, number of journal entries)
+        """
+        sent_urls = set()
+        journal_entries = 0
+        
         if self.tracking_file.exists():
             try:
                 with open(self.tracking_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    print(f"[TRACKER] Loaded {len(data)} previously sent breaches")
-                    return set(data)
-            except:
-                pass
-        return set()
+                    sent_urls.update(json.load(f))
+            except Exception as e:
+                print(f"[TRACKER] Could not read snapshot {self.tracking_file.name}: {e}")
+        
+        if self.journal_file.exists():
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # A crash mid-append can leave an unterminated last line
+                    if line.endswith('\n') and line.strip():
+                        sent_urls.add(line.strip())
+                        journal_entries += 1
+        
+        return sent_urls, journal_entries
+    
+    def append_to_journal(self, identifiers):
+        """Append identifiers to the journal and flush them to disk"""
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.tracking_file):
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                f.write(''.join(f"{identifier}\n" for identifier in identifiers))
+                f.flush()
+                os.fsync(f.fileno())
+        self.journal_entries += len(identifiers)
     
     def save_sent_urls(self):
-        self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.tracking_file, 'w', encoding='utf-8') as f:
-            json.dump(list(self.sent_urls), f, indent=2)
+        """Fold the journal into a fresh snapshot (atomic) and empty the journal"""
+        if self.dedupe_store is not None:
+            self.dedupe_store.flush()
+            return
+        
+        with file_lock(self.tracking_file):
+            # Pick up identifiers other runners sent since we loaded
+            on_disk, _ = self.read_tracking_files()
+            self.sent_urls.update(on_disk)
+            atomic_write_json(list(self.sent_urls), self.tracking_file)
+            
+            # The snapshot now holds everything in the journal
+            with open(self.journal_file, 'w', encoding='utf-8'):
+                pass
+        self.journal_entries = 0
         print(f"[TRACKER] Saved {len(self.sent_urls)} breach identifiers to tracking file")
     
     def filter_new_urls(self, urls):
@@ -53,15 +127,45 @@ class USATodayTracker:
     
     def mark_as_sent(self, urls):
         """Mark using breach_hash if available, fallback to URL"""
-        for url_dict in urls:
-            identifier = url_dict.get('breach_hash', url_dict.get('url', ''))
-            if identifier:
+        self.mark_identifiers_sent([url_dict.get('breach_hash', url_dict.get('url', '')) for url_dict in urls])
+    
+    def mark_identifiers_sent(self, identifiers):
+        """Mark raw identifiers (breach hashes, revision keys) as sent"""
+        if not identifiers:
+            return
+        
+        if self.dedupe_store is not None:
+            added = self.dedupe_store.add_many(self.dedupe_source, identifiers)
+            print(f"[TRACKER] Stored {added} new breach identifiers")
+            return
+        
+        new_identifiers = []
+        for identifier in identifiers:
+            if identifier and identifier not in self.sent_urls:
                 self.sent_urls.add(identifier)
-        self.save_sent_urls()
+                new_identifiers.append(identifier)
+        
+        if new_identifiers:
+            self.append_to_journal(new_identifiers)
+            print(f"[TRACKER] Journaled {len(new_identifiers)} new breach identifiers")
+        
+        if self.journal_entries >= self.compact_every:
+            self.save_sent_urls()
 
 
-def create_table_email(breaches):
-    """Create HTML email with table and clickable company links"""
+def create_table_email(breaches, updates=None, changes=None, removed=None):
+    """
+    Create HTML email with table and clickable company links.
+    
+    Args:
+        breaches: New breaches
+        updates: Breaches matched to an already-reported one (see core.near_duplicates)
+        changes: Known breaches whose details USA Today revised (see core.change_feed)
+        removed: Known breaches no longer listed (see core.change_feed)
+    """
+    updates = updates or []
+    changes = changes or []
+    removed = removed or []
     body = f"""
     <html>
     <head>
@@ -162,10 +266,94 @@ def create_table_email(breaches):
             </tr>
         """
     
-    body += f"""
+    body += """
             </tbody>
         </table>
+    """
+    
+    if updates:
+        body += f"""
+        <h3>Updated breaches ({len(updates)})</h3>
+        <p>These match breaches already reported; the name or the number of people affected changed.</p>
+        
+        <table class="breach-table">
+            <thead>
+                <tr>
+                    <th>Company</th>
+                    <th>Previously Reported As</th>
+                    <th>State</th>
+                    <th>Date</th>
+                    <th>People Affected</th>
+                    <th>Previously</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
         
+        for breach in updates:
+            previous = breach.get('previous', {})
+            body += f"""
+                <tr>
+                    <td>{breach.get('company', '')}</td>
+                    <td>{previous.get('company', '')}</td>
+                    <td>{breach.get('state', '')}</td>
+                    <td>{breach.get('breach_date', breach.get('date', ''))}</td>
+                    <td>{breach.get('people_affected', '')}</td>
+                    <td>{previous.get('people_affected', '')}</td>
+                </tr>
+            """
+        
+        body += """
+            </tbody>
+        </table>
+        """
+    
+    if changes:
+        body += f"""
+        <h3>Revised breaches ({len(changes)})</h3>
+        <p>USA Today changed these entries since they were last reported.</p>
+        
+        <table class="breach-table">
+            <thead>
+                <tr>
+                    <th>Company</th>
+                    <th>State</th>
+                    <th>Date</th>
+                    <th>Changes</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+        
+        for breach in changes:
+            deltas = '<br>'.join(
+                f"{field.replace('_', ' ').title()}: {delta['old'] or '-'} &rarr; {delta['new'] or '-'}"
+                for field, delta in breach.get('changes', {}).items()
+            )
+            body += f"""
+                <tr>
+                    <td>{breach.get('company', '')}</td>
+                    <td>{breach.get('state', '')}</td>
+                    <td>{breach.get('breach_date', breach.get('date', ''))}</td>
+                    <td>{deltas}</td>
+                </tr>
+            """
+        
+        body += """
+            </tbody>
+        </table>
+        """
+    
+    if removed:
+        body += f"""
+        <h3>Removed from the database ({len(removed)})</h3>
+        <ul>
+        """
+        for breach in removed:
+            body += f"<li>{breach.get('company', '')} ({breach.get('state', '')}, {breach.get('breach_date', '')})</li>\n"
+        body += "</ul>\n"
+    
+    body += f"""
         <div class="footer">
             <p><em>Sent: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</em></p>
             <p><em>Source: USA Today Healthcare Data Breaches Database</em></p>
@@ -178,37 +366,64 @@ def create_table_email(breaches):
     return body
 
 
-def main():
-    print("""
-    ╔══════════════════════════════════════════════════════════════╗
-    ║  Daily Data Breach Links | Health Care (USA Today)           ║
-    ║                                                              ║
-    ║  Scraping: USA Today Healthcare Breaches (10 pages)          ║
-    ╚══════════════════════════════════════════════════════════════╝
-    """)
+def run_usatoday_breaches(notifier=None):
+    """
+    Scrape USA Today, diff and dedupe the breaches and send the USA Today email.
+    
+    Args:
+        notifier: EmailNotifier to send with (e.g. the scheduler's shared one);
+                  a new one is created when omitted
     
+    Returns:
+        dict: Counts of scraped, new, updated, revised and removed breaches
+    """
     tracker = USATodayTracker()
-    notifier = EmailNotifier()
+    breach_store = BreachStore()
+    change_feed = ChangeFeed() if USATODAY_CONFIG['change_feed_enabled'] else None
+    notifier = notifier or EmailNotifier()
     
     print("\n" + "="*70)
     print("RUNNING USA TODAY SCRAPER")
     print("="*70 + "\n")
     
     all_breaches = []
+    # Why each scraper stopped; a scraper that failed has no entry
+    stop_reasons = {}
     
     for category, scrapers in USATODAY_REGISTRY.items():
         for scraper_key, scraper_info in scrapers.items():
             if not scraper_info.get('enabled', True):
                 continue
             
+            stop_reasons[scraper_key] = None
             print(f"[{scraper_info['name']}] Starting...")
             
             try:
-                import importlib
-                module = importlib.import_module(scraper_info['module'])
-                scraper_class = getattr(module, scraper_info['class'])
-                scraper_instance = scraper_class()
-                breaches = scraper_instance.run()
+                if scraper_info.get('isolated') and ISOLATION_CONFIG['enabled']:
+                    # A hung Chrome is killed at the deadline instead of stalling the email
+                    outcome = run_isolated(
+                        scraper_info['module'], scraper_info['class'],
+                        run_kwargs={'known_hashes': set(tracker.sent_urls)},
+                        timeout_seconds=scraper_info.get('timeout_seconds'),
+                        memory_limit_mb=scraper_info.get('memory_limit_mb'),
+                        budget=ScraperBudget.from_registry(scraper_info).limits(),
+                    )
+                    if not outcome['success']:
+                        raise RuntimeError(outcome['error'])
+                    breaches = outcome['urls_data']
+                    budget = outcome['budget'] or {}
+                    stop_reasons[scraper_key] = outcome['stop_reason']
+                else:
+                    import importlib
+                    module = importlib.import_module(scraper_info['module'])
+                    scraper_class = getattr(module, scraper_info['class'])
+                    scraper_instance = scraper_class()
+                    breaches = scraper_instance.run(known_hashes=tracker.sent_urls)
+                    budget = scraper_instance.budget.to_dict() if hasattr(scraper_instance, 'budget') else {}
+                    stop_reasons[scraper_key] = getattr(scraper_instance, 'stop_reason', None)
+                
+                if budget.get('exceeded'):
+                    print(f"[{scraper_info['name']}] Budget exceeded ({budget['exceeded']}), partial results")
                 print(f"[{scraper_info['name']}] Returned {len(breaches)} breaches")
                 all_breaches.extend(breaches)
             except Exception as e:
@@ -220,10 +435,35 @@ def main():
     print(f"TOTAL BREACHES SCRAPED: {len(all_breaches)}")
     print("="*70 + "\n")
     
+    # Diff against the last-known records: only deltas go further
+    changes, removed = [], []
+    candidates = all_breaches
+    if change_feed is not None:
+        # Removals can only be told apart from unread pages when every scraper read the whole table
+        complete = bool(stop_reasons) and all(reason in COMPLETE_STOP_REASONS for reason in stop_reasons.values())
+        delta = change_feed.diff(all_breaches, complete=complete)
+        candidates = delta['added']
+        removed = delta['removed']
+        # A revision already emailed (e.g. the run died before saving the feed) is not resent.
+        # Revisions are tracked by identity + content, since most (type, source) leave
+        # breach_hash unchanged
+        changes = [breach for breach in delta['changed'] if breach['revision_key'] not in tracker.sent_urls]
+        print(f"[CHANGE FEED] {len(delta['added'])} added, {len(delta['changed'])} changed, "
+              f"{len(removed)} removed, {delta['unchanged']} unchanged")
+        if not complete:
+            print(f"[CHANGE FEED] Partial run ({', '.join(str(reason) for reason in stop_reasons.values())}), "
+                  f"removals not checked")
+    
     # Filter duplicates
-    new_breaches = tracker.filter_new_urls(all_breaches)
+    new_breaches = tracker.filter_new_urls(candidates)
+    
+    # Report revised/respelled versions of known breaches as updates
+    updates = []
+    if new_breaches and NEAR_DUPLICATE_CONFIG['enabled']:
+        new_breaches, updates = split_updates(new_breaches, breach_store.iter_records())
+        print(f"[NEAR DUPLICATES] {len(updates)} of {len(new_breaches) + len(updates)} breaches are updates of ones already reported")
     
-    if not new_breaches:
+    if not new_breaches and not updates and not changes and not removed:
         print("\n" + "="*70)
         print("NO NEW BREACHES - Sending notification")
         print("="*70 + "\n")
@@ -250,28 +490,62 @@ def main():
         print(" 'No new breaches' email sent\n")
     else:
         print("\n" + "="*70)
-        print(f"SENDING EMAIL WITH {len(new_breaches)} NEW BREACHES")
+        print(f"SENDING EMAIL WITH {len(new_breaches)} NEW BREACHES, {len(updates)} UPDATES, "
+              f"{len(changes)} REVISIONS, {len(removed)} REMOVALS")
         print("="*70 + "\n")
         
-        email_body = create_table_email(new_breaches)
+        email_body = create_table_email(new_breaches, updates, changes, removed)
+        
+        digest_data = {'USA Today': new_breaches}
+        if updates:
+            digest_data['USA Today (updates)'] = updates
+        if changes:
+            digest_data['USA Today (revisions)'] = changes
         
         notifier.send_digest_email(
             subject="Daily Data Breach Links Health Care (USA Today)",
             body=email_body,
-            digest_data={'USA Today': new_breaches},
-            total_urls=len(new_breaches)
+            digest_data=digest_data,
+            total_urls=len(new_breaches) + len(updates) + len(changes)
         )
         
         print(" Email sent with clickable links\n")
-        tracker.mark_as_sent(new_breaches)
+        tracker.mark_as_sent(new_breaches + updates + changes)
+        tracker.mark_identifiers_sent([breach['revision_key'] for breach in changes])
+        breach_store.add_many(new_breaches + updates + changes)
+    
+    if change_feed is not None:
+        change_feed.apply(all_breaches, removed)
     
     print("\n" + "="*70)
     print("EXECUTION COMPLETED")
     print("="*70)
     print(f"Total breaches scraped: {len(all_breaches)}")
     print(f"New breaches sent: {len(new_breaches)}")
-    print(f"Duplicates filtered: {len(all_breaches) - len(new_breaches)}")
+    print(f"Updates sent: {len(updates)}")
+    print(f"Revisions sent: {len(changes)}")
+    print(f"Duplicates filtered: {len(all_breaches) - len(new_breaches) - len(updates) - len(changes)}")
     print("="*70 + "\n")
+    
+    return {
+        'scraped': len(all_breaches),
+        'new': len(new_breaches),
+        'updates': len(updates),
+        'revisions': len(changes),
+        'removed': len(removed),
+    }
+
+
+def main():
+    print("""
+    ╔══════════════════════════════════════════════════════════════╗
+    ║  Daily Data Breach Links | Health Care (USA Today)           ║
+    ║                                                              ║
+    ║  Scraping: USA Today Healthcare Breaches (10 pages)          ║
+    ╚══════════════════════════════════════════════════════════════╝
+    """)
+    
+    run_usatoday_breaches()
 
 
 if __name__ == "__main__":
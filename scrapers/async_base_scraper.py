@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Async Base Scraper - Overlapping Page Fetches
+Async variant of BaseScraper for listing crawls that spend most of their
+time waiting on the network. Requests run on worker threads through the
+scraper's requests.Session (asyncio.to_thread), so no extra HTTP client is
+needed, and in-flight requests are capped overall and per host.
+
+Moving a scraper over:
+    1. Inherit from AsyncBaseScraper instead of BaseScraper
+    2. Rename scrape() to `async def scrape_async()`
+    3. `await self.fetch_page(url)` (or `await self.fetch_pages(urls)`)
+    4. Drop add_delay() calls - fetch_page spaces requests per host itself
+
+Everything else (extract_title, extract_date_from_page, create_case_data,
+should_include_url, save_data, run) is inherited unchanged.
+"""
+
+import asyncio
+from abc import abstractmethod
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from config.settings import SCRAPER_CONFIG
+from core.http_session import new_http_session
+from scrapers.base_scraper import BaseScraper
+
+
+class AsyncBaseScraper(BaseScraper):
+    """
+    Base class for scrapers that fetch pages concurrently.
+    Subclasses implement scrape_async() instead of scrape().
+    """
+
+    def __init__(self, name: str, base_url: str, scraper_key: str = None):
+        """
+        Initialize the async scraper.
+
+        Args:
+            name (str): Human-readable scraper name
+            base_url (str): Base URL to scrape
+            scraper_key (str): Unique scraper key for tracking (optional)
+        """
+        super().__init__(name, base_url, scraper_key)
+
+        self.max_concurrent_requests = max(1, SCRAPER_CONFIG['max_concurrent_requests'])
+        self.per_host_concurrency = max(1, SCRAPER_CONFIG['per_host_concurrency'])
+
+        # A private pool gets one connection per in-flight request (the
+        # shared pool is sized by SCRAPER_CONFIG['pool_maxsize'] instead)
+        if not SCRAPER_CONFIG['share_pool']:
+            self.session.close()
+            self.session = new_http_session(pool_maxsize=self.max_concurrent_requests)
+
+        # Created inside the running event loop (see scrape())
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    # ========================================================================
+    # ABSTRACT METHODS (Must be implemented by subclasses)
+    # ========================================================================
+
+    @abstractmethod
+    async def scrape_async(self):
+        """
+        Main scraping logic.
+        Must be implemented by each async scraper.
+        """
+        pass
+
+    def scrape(self):
+        """Run scrape_async() in a fresh event loop (called by run())."""
+        asyncio.run(self._scrape())
+
+    async def _scrape(self):
+        self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        self._host_slots = {}
+        await self.scrape_async()
+
+    # ========================================================================
+    # HTTP REQUEST UTILITIES
+    # ========================================================================
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Per-host request slot for a URL."""
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return self._host_slots[host]
+
+    async def _get(self, url: str) -> requests.Response:
+        async with self._host_slot(url):
+            # The global slot is only held while the request is in flight
+            async with self._request_slots:
+                self.logger.info(f"Fetching: {url}")
+                self.budget.record_request()
+                response = await asyncio.to_thread(
+                    self.session.get, url, timeout=self.budget.request_timeout(self.timeout)
+                )
+                self.budget.record_bytes(len(response.content))
+
+            # Space out requests to the same host without blocking other hosts
+            if self.request_delay > 0:
+                await asyncio.sleep(self.request_delay)
+
+        return response
+
+    async def fetch_page(self, url: str, retry_count: int = 0) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a web page with retry logic.
+        Same retries and backoff as BaseScraper.fetch_page, but the wait
+        does not hold up other requests.
+
+        Args:
+            url (str): URL to fetch
+            retry_count (int): Retry attempts already made
+
+        Returns:
+            BeautifulSoup: Parsed HTML or None if failed
+
+        Raises:
+            BudgetExceeded: If the scraper's budget is spent
+        """
+        for attempt in range(retry_count, self.max_retries + 1):
+            self.budget.check()
+
+            try:
+                response = await self._get(url)
+                response.raise_for_status()
+
+                soup = BeautifulSoup(response.content, 'html.parser')
+                return soup
+
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 403 and attempt < self.max_retries:
+                    self.logger.warning(f"403 Forbidden (attempt {attempt + 1}/{self.max_retries})")
+                else:
+                    self.logger.error(f"HTTP error for {url}: {e}")
+                    return None
+
+            except requests.exceptions.RequestException as e:
+                if attempt < self.max_retries:
+                    self.logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
+                else:
+                    self.logger.error(f"Failed to fetch {url} after {self.max_retries} retries: {e}")
+                    return None
+
+            except Exception as e:
+                self.logger.error(f"Unexpected error fetching {url}: {e}")
+                return None
+
+            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
+        return None
+
+    async def fetch_pages(self, urls: List[str]) -> List[Optional[BeautifulSoup]]:
+        """
+        Fetch several pages concurrently.
+
+        Args:
+            urls (list): URLs to fetch
+
+        Returns:
+            list: Parsed HTML (or None) per URL, in the same order
+        """
+        return await asyncio.gather(*(self.fetch_page(url) for url in urls))
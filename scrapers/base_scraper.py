@@ -20,7 +20,9 @@ from config.settings import (
     SCRAPER_CONFIG, 
     DATE_FILTER_CONFIG, 
     SCRAPED_DIR, 
+    SCRAPED_STORAGE_CONFIG,
     LOGS_DIR,
+    get_scraper_info,
     is_date_filtering_enabled
 )
 from utils.date_utils import (
@@ -29,6 +31,10 @@ from utils.date_utils import (
     extract_date_from_html,
     get_common_date_selectors
 )
+from utils.url_utils import canonical_key, canonicalize_url
+from core.http_session import new_http_session
+from core.partitioned_store import PartitionedStore
+from core.scraper_budget import BudgetExceeded, ScraperBudget
 
 
 class BaseScraper(ABC):
@@ -50,11 +56,8 @@ class BaseScraper(ABC):
         self.base_url = base_url
         self.scraper_key = scraper_key or name.lower().replace(' ', '_')
         
-        # Session for connection reuse
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': SCRAPER_CONFIG['user_agent']
-        })
+        # Own session (headers, cookies) on the shared connection pool
+        self.session = new_http_session()
         
         # Configuration from settings
         self.max_pages = SCRAPER_CONFIG['max_pages']
@@ -62,13 +65,16 @@ class BaseScraper(ABC):
         self.max_retries = SCRAPER_CONFIG['max_retries']
         self.timeout = SCRAPER_CONFIG['timeout']
         
+        # Time/request/byte limits (the orchestrator may replace this before run())
+        self.budget = ScraperBudget.from_registry(get_scraper_info(self.scraper_key))
+        
         # Date filtering configuration
         self.enable_date_filtering = is_date_filtering_enabled(self.scraper_key)
         self.hours_threshold = DATE_FILTER_CONFIG['hours_threshold']
         self.include_undated = DATE_FILTER_CONFIG['include_undated']
         
         # Data storage
-        self.visited_urls = set()
+        self.visited_urls = set()  # canonical keys (see mark_visited)
         self.scraped_data = []
         
         # Setup logging
@@ -139,18 +145,40 @@ class BaseScraper(ABC):
             url (str): URL to normalize
             
         Returns:
-            str: Normalized URL or None
+            str: Normalized URL (utils.url_utils.canonicalize_url) or None
         """
         if not url:
             return None
         
-        try:
-            parsed = urlparse(url)
-            normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            return normalized.rstrip('/').lower()
-        except Exception as e:
-            self.logger.warning(f"Could not normalize URL {url}: {e}")
-            return None
+        return canonicalize_url(url) or None
+    
+    def mark_visited(self, url: str):
+        """
+        Record a URL as visited, so should_include_url skips it (and any
+        URL with the same canonical key) from now on.
+        
+        Args:
+            url (str): URL that was scraped
+        """
+        key = canonical_key(url)
+        if key:
+            self.visited_urls.add(key)
+    
+    def is_visited(self, url: str) -> bool:
+        """
+        Check if a URL was already visited.
+        
+        Args:
+            url (str): URL to check
+            
+        Returns:
+            bool: True if mark_visited saw it (or a scraper added its
+                  normalize_url form to visited_urls directly)
+        """
+        key = canonical_key(url)
+        if not key:
+            return False
+        return key in self.visited_urls or self.normalize_url(url) in self.visited_urls
     
     def is_same_domain(self, url: str) -> bool:
         """
@@ -197,10 +225,18 @@ class BaseScraper(ABC):
             
         Returns:
             BeautifulSoup: Parsed HTML or None if failed
+            
+        Raises:
+            BudgetExceeded: If the scraper's budget is spent (run() keeps
+                            what was scraped so far)
         """
+        self.budget.check()
+        
         try:
             self.logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=self.timeout)
+            self.budget.record_request()
+            response = self.session.get(url, timeout=self.budget.request_timeout(self.timeout))
+            self.budget.record_bytes(len(response.content))
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -313,8 +349,7 @@ class BaseScraper(ABC):
             return False
         
         # Check if already visited
-        normalized = self.normalize_url(url)
-        if normalized and normalized in self.visited_urls:
+        if self.is_visited(url):
             return False
         
         # Check date filtering (if enabled and soup provided)
@@ -422,14 +457,29 @@ class BaseScraper(ABC):
     
     def save_data(self, filename: str = None) -> Path:
         """
-        Save scraped data to JSON file.
+        Save scraped data.
+        
+        With the partitioned storage format (default), only items that are new
+        or whose content changed are appended to this scraper's monthly
+        .jsonl.gz partitions.
+        Otherwise, or when a filename is given, the data is written to a JSON
+        file in data/scraped.
         
         Args:
             filename (str): Optional filename (auto-generated if None)
             
         Returns:
-            Path: Path to saved file
-        """
+            Path: Path to saved file (the scraper's partition directory when partitioned)
+        """
+        if not filename and SCRAPED_STORAGE_CONFIG['format'] == 'partitioned':
+            store = PartitionedStore()
+            added = store.append(self.scraper_key, self.scraped_data)
+            self.logger.info(
+                f"Appended {sum(added.values())} new or changed of {len(self.scraped_data)} items "
+                f"to {store.scraper_dir(self.scraper_key)}"
+            )
+            return store.scraper_dir(self.scraper_key)
+        
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{self.scraper_key}_data_{timestamp}.json"
@@ -464,9 +514,16 @@ class BaseScraper(ABC):
         self.logger.info(f"Starting {self.name} scraper...")
         start_time = time.time()
         
+        self.budget.start()
+        
         try:
             # Run the scraping logic (implemented by subclass)
-            self.scrape()
+            try:
+                self.scrape()
+            except BudgetExceeded as e:
+                self.logger.warning(
+                    f"Budget exceeded ({e.reason}), keeping the {len(self.scraped_data)} items scraped so far"
+                )
             
             # Save data
             if self.scraped_data:
@@ -500,5 +557,6 @@ class BaseScraper(ABC):
             'total_scraped': len(self.scraped_data),
             'total_visited': len(self.visited_urls),
             'date_filtering_enabled': self.enable_date_filtering,
-            'hours_threshold': self.hours_threshold if self.enable_date_filtering else None
+            'hours_threshold': self.hours_threshold if self.enable_date_filtering else None,
+            'budget': self.budget.to_dict()
         }
\ No newline at end of file
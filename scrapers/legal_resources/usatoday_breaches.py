@@ -3,14 +3,89 @@ USA Today Healthcare Data Breaches Scraper - WITH DEDUPLICATION
 Scrapes ALL pages and returns unique breaches only
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import json
+import re
 import time
 import hashlib
 
+from lxml import html as lxml_html
+
+from config.settings import USATODAY_CONFIG, USATODAY_REGISTRY, DRIVER_POOL_CONFIG, SNAPSHOT_CONFIG
+from scrapers.legal_resources.usatoday_feed import USATodayFeedBackend
+from utils.driver_utils import create_chrome_driver, NetworkStats
+from core.driver_pool import get_driver_pool
+from core.breach_store import BreachStore
+from core.scraper_budget import BudgetExceeded, ScraperBudget
+from utils.file_utils import atomic_write_json, load_json
+from utils.snapshot_utils import SnapshotRecorder, latest_snapshot_dir, iter_snapshots
+
+
+# Pulls every breach row as an array of cell texts in a single WebDriver call
+ROWS_SCRIPT = """
+const rows = document.querySelectorAll('table tbody tr');
+return JSON.stringify(Array.from(rows, function (row) {
+    return Array.from(row.querySelectorAll('td'), function (cell) {
+        return (cell.innerText || '').trim();
+    });
+}));
+"""
+
+# Elements that start a new line in innerText, and ones it never renders
+BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr',
+    'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul',
+])
+UNRENDERED_TAGS = frozenset(['script', 'style', 'template', 'noscript'])
+HIDDEN_STYLE = re.compile(r'display\s*:\s*none|visibility\s*:\s*hidden', re.IGNORECASE)
+
+# Snapshot of what identifies the current page: indicator text, first row, row count
+PAGE_STATE_SCRIPT = """
+const selectors = arguments[0];
+let indicator = '';
+for (const selector of selectors) {
+    const el = document.querySelector(selector);
+    if (el && el.innerText) { indicator = el.innerText.trim(); break; }
+}
+const rows = document.querySelectorAll('table tbody tr');
+const first = rows.length ? (rows[0].innerText || '').trim() : '';
+return [indicator, first, rows.length];
+"""
+
+# Highest page number shown in the pagination controls
+MAX_PAGE_LINK_SCRIPT = """
+let maxPage = 0;
+document.querySelectorAll('.pagination a, .pagination button, nav a, nav button').forEach(function (el) {
+    const text = (el.innerText || '').trim().replace(/,/g, '');
+    if (/^\\d+$/.test(text)) { maxPage = Math.max(maxPage, parseInt(text, 10)); }
+});
+return maxPage;
+"""
+
+
+# breach_hash values (md5 hex digests)
+BREACH_HASH_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+# Selectors for the table's 'Next' control, tried in order
+NEXT_BUTTON_SELECTORS = [
+    "button[aria-label='Next page']",
+    "a[aria-label='Next page']",
+    ".pagination .next",
+    "button.next-page",
+    ".pagination a:last-child"
+]
+
+
+class PageChangeTimeout(Exception):
+    """Raised when 'Next' was clicked but the table did not move to the next page in time"""
+
 
 class USATodayBreachesScraper:
     """Scraper for USA Today Healthcare Data Breaches with deduplication"""
@@ -18,27 +93,75 @@ class USATodayBreachesScraper:
     def __init__(self):
         self.base_url = "https://data.usatoday.com/health-care-data-breaches/"
         self.source_name = "USA Today Healthcare Breaches"
+        self.scraper_key = "usatoday_breaches"
         self.category = "legal_resources"
+        self.extraction_mode = USATODAY_CONFIG['extraction_mode']
+        
+        # Wait settings (seconds) and the measured duration of every wait
+        self.load_timeout = USATODAY_CONFIG['load_timeout']
+        self.page_change_timeout = USATODAY_CONFIG['page_change_timeout']
+        self.settle_timeout = USATODAY_CONFIG['settle_timeout']
+        self.poll_interval = USATODAY_CONFIG['poll_interval']
+        self.page_indicator_selectors = USATODAY_CONFIG['page_indicator_selectors']
+        self.wait_timings = []
+        
+        # Incremental mode: stop paging once a page holds nothing new
+        self.incremental = USATODAY_CONFIG['incremental']
+        self.stop_reason = None
+        
+        # Data source: 'feed' reads the backing dataset over HTTP, 'selenium'
+        # renders the table in Chrome, 'auto' tries the feed first
+        self.backend = USATODAY_CONFIG['backend']
+        self.backend_used = None
+        
+        # Driver profile ('lean' or 'full') and per-run network usage
+        self.driver_profile = USATODAY_CONFIG['driver_profile']
+        self.network_stats = NetworkStats()
+        
+        # Borrow warm browsers from the shared pool instead of launching one per run
+        self.use_driver_pool = DRIVER_POOL_CONFIG['enabled']
+        
+        # Sharded mode: split the page range across several browsers
+        self.shard_workers = USATODAY_CONFIG['shard_workers']
+        self.page_url_template = USATODAY_CONFIG['page_url_template']
+        
+        # Snapshot mode: 'record' saves every page_source, 'replay' parses saved pages
+        self.snapshot_mode = SNAPSHOT_CONFIG['mode']
+        self.recorder = None
+        
+        # Time/page/byte limits for the page loop (the caller may replace this)
+        registry_entry = next(
+            (scrapers[self.scraper_key] for scrapers in USATODAY_REGISTRY.values() if self.scraper_key in scrapers),
+            None
+        )
+        self.budget = ScraperBudget.from_registry(registry_entry)
         
     def setup_driver(self):
         """Setup Chrome driver with headless options"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        
-        driver = webdriver.Chrome(options=chrome_options)
-        return driver
+        return create_chrome_driver(profile=self.driver_profile)
+    
+    def acquire_driver(self):
+        """Get a driver from the shared pool, or start a private one"""
+        if self.use_driver_pool:
+            return get_driver_pool(self.driver_profile).acquire()
+        return self.setup_driver()
+    
+    def release_driver(self, driver, healthy=True):
+        """Hand a driver back to the pool, or quit a private one"""
+        if not driver:
+            return
+        if self.use_driver_pool:
+            get_driver_pool(self.driver_profile).release(driver, healthy)
+        else:
+            driver.quit()
     
     def parse_date(self, date_str):
         """Parse date string into datetime object"""
         if not date_str:
             return None
         
-        date_str = date_str.strip()
+        # AP style abbreviates September as 'Sept.', which %b does not accept
+        date_str = date_str.strip().replace('Sept.', 'Sep.')
         
         formats = [
             '%b. %d, %Y',
@@ -76,54 +199,793 @@ class USATodayBreachesScraper:
         unique_string = f"{company}|{state}|{breach_date}|{people_affected}".lower()
         return hashlib.md5(unique_string.encode()).hexdigest()
     
-    def click_next_page(self, driver):
-        """Try to click the 'Next' button to go to next page"""
+    def extract_rows(self, driver):
+        """
+        Read all breach rows on the current page.
+        
+        'lxml' (default) takes page_source once and parses it with lxml,
+        'script' pulls the grid with one in-browser script call. Both fall
+        back to per-cell WebElement reads if they fail or find no rows.
+        
+        Returns:
+            list: One list of normalized cell texts per table row (see normalize_cell_text)
+        """
+        extractors = {
+            'lxml': self._extract_rows_lxml,
+            'script': self._extract_rows_script,
+        }
+        extractor = extractors.get(self.extraction_mode)
+        
+        if extractor:
+            try:
+                rows = extractor(driver)
+                if rows:
+                    return rows
+            except Exception as e:
+                print(f"[{self.source_name}] {self.extraction_mode} extraction failed, using elements: {e}")
+        
+        return self._extract_rows_elements(driver)
+    
+    def _extract_rows_lxml(self, driver):
+        """Parse the table out of a single page_source transfer"""
+        return self.parse_rows_from_html(driver.page_source)
+    
+    def _extract_rows_script(self, driver):
+        """Fetch the whole table grid as a JSON array of row arrays"""
+        payload = driver.execute_script(ROWS_SCRIPT)
+        rows = json.loads(payload) if payload else []
+        return [[self.normalize_cell_text(str(cell)) for cell in row] for row in rows]
+    
+    def _extract_rows_elements(self, driver):
+        """Read every cell through its WebElement (one round-trip per cell)"""
+        rows = []
+        for element in driver.find_elements(By.CSS_SELECTOR, "table tbody tr"):
+            try:
+                cells = element.find_elements(By.TAG_NAME, 'td')
+                rows.append([self.normalize_cell_text(cell.text) for cell in cells[:7]])
+            except Exception:
+                continue
+        return rows
+    
+    def parse_rows_from_html(self, html):
+        """
+        Read breach rows from saved page HTML (no browser needed).
+        
+        Returns:
+            list: One list of normalized cell texts per table row (see normalize_cell_text)
+        """
+        if not html:
+            return []
+        
+        tree = lxml_html.fromstring(html)
+        rows = []
+        for row in tree.xpath('//table//tbody//tr'):
+            cells = row.xpath('.//td')
+            rows.append([self.normalize_cell_text(self.inner_text(cell)) for cell in cells[:7]])
+        return rows
+    
+    @staticmethod
+    def inner_text(element):
+        """
+        Approximate the browser's innerText for a parsed element: <br> and
+        block elements break lines, and hidden or unrendered nodes (hidden
+        attribute, inline display:none / visibility:hidden, scripts) are skipped.
+        """
+        parts = []
+        
+        def walk(node):
+            if not isinstance(node.tag, str):
+                return  # comment or processing instruction (its tail is added by the parent)
+            tag = node.tag.lower()
+            if (tag in UNRENDERED_TAGS or node.get('hidden') is not None
+                    or HIDDEN_STYLE.search(node.get('style', ''))):
+                return
+            if tag == 'br':
+                parts.append('\n')
+                return
+            
+            block = tag in BLOCK_TAGS
+            if block:
+                parts.append('\n')
+            if node.text:
+                parts.append(node.text)
+            for child in node:
+                walk(child)
+                if child.tail:
+                    parts.append(child.tail)
+            if block:
+                parts.append('\n')
+        
+        walk(element)
+        return ''.join(parts)
+    
+    @staticmethod
+    def normalize_cell_text(text):
+        """
+        Normalize cell text the same way for every extractor: whitespace runs
+        collapse to one space within a line, and blank lines are dropped.
+        
+        'Acme<br>Health' -> 'Acme\nHealth'
+        """
+        lines = (' '.join(line.split()) for line in (text or '').splitlines())
+        return '\n'.join(line for line in lines if line)
+    
+    def record_page(self, driver, page_number, rows):
+        """Save the current page_source when recording snapshots"""
+        if not self.recorder:
+            return
         try:
-            next_button_selectors = [
-                "button[aria-label='Next page']",
-                "a[aria-label='Next page']",
-                ".pagination .next",
-                "button.next-page",
-                ".pagination a:last-child"
-            ]
+            self.recorder.record(page_number, driver.page_source, driver.current_url, row_count=len(rows))
+        except Exception as e:
+            print(f"[{self.source_name}] Could not record snapshot of page {page_number}: {e}")
+    
+    def build_breach_info(self, cells, breach_hash, date_obj):
+        """
+        Build the breach dictionary for one table row.
+        
+        Args:
+            cells: Cell texts in table column order
+            breach_hash: Hash from create_breach_hash
+            date_obj: Parsed breach date (or None)
             
-            for selector in next_button_selectors:
-                try:
-                    next_button = driver.find_element(By.CSS_SELECTOR, selector)
-                    if next_button and next_button.is_displayed() and next_button.is_enabled():
-                        next_button.click()
-                        time.sleep(3)
-                        return True
-                except:
-                    continue
+        Returns:
+            dict: Breach information
+        """
+        cells = list(cells) + [""] * (7 - len(cells))
+        company, state, company_type, breach_date, people_affected, breach_type, breach_source = cells[:7]
+        
+        # Create unique identifier using hash
+        breach_id = breach_hash[:12]
+        
+        title = f"{company} - {state} - {people_affected} people affected"
+        
+        description = (
+            f"Company Type: {company_type} | "
+            f"State: {state} | "
+            f"Breach Date: {breach_date} | "
+            f"People Affected: {people_affected} | "
+            f"Breach Type: {breach_type} | "
+            f"Breach Source: {breach_source}"
+        )
+        
+        return {
+            'title': title,
+            'url': f"{self.base_url}#{breach_id}",
+            'description': description,
+            'date': date_obj.strftime('%Y-%m-%d') if date_obj else breach_date,
+            'source': self.source_name,
+            'breach_hash': breach_hash,
+            # Detailed fields for table format
+            'company': company,
+            'state': state,
+            'company_type': company_type,
+            'breach_date': breach_date,
+            'people_affected': people_affected,
+            'breach_type': breach_type,
+            'breach_source': breach_source,
+            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    # ========================================================================
+    # WAITS
+    # ========================================================================
+    
+    def timed_wait(self, driver, name, condition, timeout):
+        """
+        Wait for a condition and record how long it actually took.
+        
+        Args:
+            driver: WebDriver instance
+            name: Label for the wait (used in wait_timings)
+            condition: Callable taking the driver, truthy when done
+            timeout: Maximum seconds to wait
             
-            # Try finding by text
+        Returns:
+            bool: True if the condition was met before the timeout
+        """
+        start = time.perf_counter()
+        met = True
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(condition)
+        except TimeoutException:
+            met = False
+        
+        self.wait_timings.append({
+            'wait': name,
+            'seconds': round(time.perf_counter() - start, 3),
+            'timed_out': not met
+        })
+        return met
+    
+    def get_page_state(self, driver):
+        """Return (indicator text, first row text, row count) for the current page"""
+        try:
+            return tuple(driver.execute_script(PAGE_STATE_SCRIPT, self.page_indicator_selectors))
+        except Exception:
+            return ('', '', 0)
+    
+    def wait_for_table(self, driver):
+        """Wait until the breach table has rendered at least one row"""
+        loaded = self.timed_wait(
+            driver, 'table_load',
+            EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")),
+            self.load_timeout
+        )
+        if loaded:
+            self.wait_for_rows_settled(driver)
+        return loaded
+    
+    def wait_for_page_change(self, driver, old_first_row, old_state):
+        """
+        Wait until the table shows a different page after clicking 'Next'.
+        
+        The page counts as changed when the old first row goes stale, the
+        page indicator changes, or the first row's text changes.
+        """
+        def page_changed(d):
+            if old_first_row is not None and EC.staleness_of(old_first_row)(d):
+                return True
+            indicator, first_text, row_count = self.get_page_state(d)
+            if not row_count:
+                return False
+            return (indicator and indicator != old_state[0]) or first_text != old_state[1]
+        
+        changed = self.timed_wait(driver, 'page_change', page_changed, self.page_change_timeout)
+        if changed:
+            self.wait_for_rows_settled(driver)
+        return changed
+    
+    def wait_for_rows_settled(self, driver):
+        """Wait until the row count stops changing between two polls"""
+        last_count = [-1]
+        
+        def rows_settled(d):
+            row_count = self.get_page_state(d)[2]
+            settled = row_count > 0 and row_count == last_count[0]
+            last_count[0] = row_count
+            return settled
+        
+        return self.timed_wait(driver, 'rows_settle', rows_settled, self.settle_timeout)
+    
+    def print_wait_summary(self):
+        """Print total and per-type wait durations"""
+        if not self.wait_timings:
+            return
+        
+        totals = {}
+        for timing in self.wait_timings:
+            totals.setdefault(timing['wait'], []).append(timing['seconds'])
+        
+        total = sum(timing['seconds'] for timing in self.wait_timings)
+        timeouts = sum(1 for timing in self.wait_timings if timing['timed_out'])
+        print(f"[{self.source_name}] Waited {total:.2f}s over {len(self.wait_timings)} waits ({timeouts} timed out)")
+        for name, durations in totals.items():
+            print(f"[{self.source_name}]   {name}: {sum(durations):.2f}s total, max {max(durations):.2f}s")
+    
+    # ========================================================================
+    # PAGINATION
+    # ========================================================================
+    
+    @staticmethod
+    def is_clickable(element):
+        """True if a pagination control is shown and not disabled"""
+        return (
+            element.is_displayed()
+            and element.is_enabled()
+            and element.get_attribute('aria-disabled') != 'true'
+        )
+    
+    def find_next_button(self, driver):
+        """Return the clickable 'Next' control, or None on the last page"""
+        for selector in NEXT_BUTTON_SELECTORS:
             try:
-                next_links = driver.find_elements(By.LINK_TEXT, "Next")
-                if not next_links:
-                    next_links = driver.find_elements(By.PARTIAL_LINK_TEXT, "Next")
-                
-                for link in next_links:
-                    if link.is_displayed() and link.is_enabled():
-                        link.click()
-                        time.sleep(3)
-                        return True
+                next_button = driver.find_element(By.CSS_SELECTOR, selector)
+                if next_button and self.is_clickable(next_button):
+                    return next_button
             except:
-                pass
+                continue
+        
+        # Try finding by text
+        try:
+            next_links = driver.find_elements(By.LINK_TEXT, "Next")
+            if not next_links:
+                next_links = driver.find_elements(By.PARTIAL_LINK_TEXT, "Next")
             
-            return False
+            for link in next_links:
+                if self.is_clickable(link):
+                    return link
+        except:
+            pass
+        
+        return None
+    
+    def click_next_page(self, driver, raise_on_timeout=False):
+        """
+        Try to click the 'Next' button and wait for the next page to render.
+        
+        Args:
+            raise_on_timeout: Raise instead of returning False when the click
+                              fails or the page does not change in time, so the
+                              caller can tell a slow page from the last page
+        
+        Returns:
+            bool: True on the next page, False if there is no enabled 'Next'
+                  control (or it failed and raise_on_timeout is off)
+        
+        Raises:
+            PageChangeTimeout: If raise_on_timeout and the page did not change
+        """
+        try:
+            old_state = self.get_page_state(driver)
+            old_rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+            old_first_row = old_rows[0] if old_rows else None
+            
+            next_button = self.find_next_button(driver)
+            if next_button is None:
+                return False
+            next_button.click()
             
         except Exception as e:
+            if raise_on_timeout:
+                raise
             print(f"[{self.source_name}] Could not click next page: {e}")
             return False
+        
+        if self.wait_for_page_change(driver, old_first_row, old_state):
+            return True
+        if raise_on_timeout:
+            raise PageChangeTimeout(f"Page did not change within {self.page_change_timeout}s of clicking 'Next'")
+        return False
+    
+    def process_rows(self, rows, seen_hashes, results, days_back=30, known_hashes=None):
+        """
+        Turn one page of table rows into breach dictionaries.
+        
+        Args:
+            rows: Cell text lists from extract_rows
+            seen_hashes: Hashes already seen this run (updated in place)
+            results: List that recent breaches are appended to
+            days_back: Number of days to look back (None keeps every row)
+            known_hashes: Hashes already sent in earlier runs (optional)
+            
+        Returns:
+            dict: Page counters (rows, unique, duplicates, known, older, new).
+                  'known' rows are also counted as unique or older; 'new' counts
+                  rows that are recent and neither repeated nor already sent.
+        """
+        known_hashes = known_hashes or set()
+        stats = {'rows': 0, 'unique': 0, 'duplicates': 0, 'known': 0, 'older': 0, 'new': 0}
+        
+        for cells in rows:
+            try:
+                if len(cells) < 4:
+                    continue
+                
+                company = cells[0]
+                state = cells[1]
+                breach_date = cells[3]
+                people_affected = cells[4] if len(cells) > 4 else ""
+                
+                if not company:
+                    continue
+                
+                stats['rows'] += 1
+                
+                # Create unique hash to detect duplicates
+                breach_hash = self.create_breach_hash(company, state, breach_date, people_affected)
+                
+                # Skip if we've already seen this exact breach
+                if breach_hash in seen_hashes:
+                    stats['duplicates'] += 1
+                    continue
+                
+                seen_hashes.add(breach_hash)
+                
+                known = breach_hash in known_hashes
+                if known:
+                    stats['known'] += 1
+                
+                # Parse date
+                date_obj = self.parse_date(breach_date)
+                
+                # Filter by date
+                if days_back is None or self.is_recent(date_obj, days=days_back):
+                    results.append(self.build_breach_info(cells, breach_hash, date_obj))
+                    stats['unique'] += 1
+                    if not known:
+                        stats['new'] += 1
+                else:
+                    stats['older'] += 1
+            
+            except Exception as e:
+                continue
+        
+        return stats
+    
+    def incremental_stop_reason(self, stats):
+        """
+        Decide whether an incremental run can stop after this page.
+        
+        A page with nothing new (every row already sent, repeated, or older
+        than the cutoff) means the pages behind it are not worth loading.
+        
+        Returns:
+            str: Stop reason, or None to keep paging
+        """
+        if not stats['rows'] or stats['new']:
+            return None
+        
+        if stats['older'] == 0:
+            return 'all_known'
+        if stats['known'] + stats['duplicates'] == 0:
+            return 'all_older'
+        return 'known_or_older'
+    
+    def scrape(self, days_back=30, max_pages=10, known_hashes=None, incremental=None):
+        """
+        Scrape healthcare data breaches from the configured backend.
+        
+        The data feed is tried first unless the backend is 'selenium'; if it
+        fails for any reason the Selenium table scraper runs instead.
+        
+        Args:
+            days_back: Number of days to look back (default: 30)
+            max_pages: Maximum number of pages to scrape (default: 10)
+            known_hashes: breach_hash values already sent (used by incremental mode)
+            incremental: Stop paging once a page has nothing new
+            
+        Returns:
+            list: List of dictionaries with unique breach information
+        """
+        self.backend_used = None
+        
+        if self.snapshot_mode == 'replay':
+            return self.scrape_replay(days_back, max_pages, known_hashes, incremental)
+        
+        if self.snapshot_mode == 'record':
+            self.recorder = SnapshotRecorder(self.scraper_key)
+            print(f"[{self.source_name}] Recording page snapshots to {self.recorder.run_dir}")
+        
+        if self.backend in ('auto', 'feed'):
+            results = self.scrape_feed(days_back=days_back, known_hashes=known_hashes)
+            if results is not None:
+                return results
+            print(f"[{self.source_name}] Falling back to Selenium")
+        
+        if self.shard_workers > 1:
+            return self.scrape_sharded(days_back, max_pages, known_hashes)
+        
+        return self.scrape_browser(days_back, max_pages, known_hashes, incremental)
+    
+    def scrape_feed(self, days_back=30, known_hashes=None):
+        """
+        Scrape breaches straight from the backing data feed.
+        
+        Returns:
+            list: Breach dictionaries, or None if the feed could not be used
+        """
+        backend = USATodayFeedBackend(self.base_url, self.source_name, budget=self.budget)
+        start = time.perf_counter()
+        
+        try:
+            rows = backend.fetch_rows()
+        except BudgetExceeded as e:
+            # Falling back to Selenium would only spend more of a spent budget
+            self.backend_used = 'feed'
+            self.stop_reason = 'budget'
+            print(f"[{self.source_name}] Budget exceeded ({e.reason}) while reading the data feed, stopping")
+            return []
+        except Exception as e:
+            print(f"[{self.source_name}] Data feed unavailable: {e}")
+            return None
+        finally:
+            backend.close()
+        
+        match = self.feed_hash_match(rows, known_hashes)
+        if match is not None and match < USATODAY_CONFIG['feed_min_hash_match']:
+            print(
+                f"[{self.source_name}] Data feed refused: only {match:.0%} of already-seen "
+                f"breaches hash the same as in the table"
+            )
+            return None
+        
+        results = []
+        stats = self.process_rows(rows, set(), results, days_back, known_hashes)
+        
+        self.backend_used = 'feed'
+        self.stop_reason = 'feed_complete'
+        print(
+            f"[{self.source_name}] Feed: {stats['rows']} rows, {stats['unique']} recent, "
+            f"{stats['duplicates']} duplicates in {time.perf_counter() - start:.2f}s"
+        )
+        return results
+    
+    def feed_hash_match(self, rows, known_hashes=None):
+        """
+        Share of breaches already seen from the table that the feed rows
+        reproduce with the same breach_hash.
+        
+        A feed whose values are formatted differently from the table (dates,
+        counts) hashes every breach differently, which would re-send them all.
+        
+        Args:
+            rows: Table rows built from the feed
+            known_hashes: breach_hash values already sent (default: the breach store)
+            
+        Returns:
+            float: Matching share, or None when nothing has been seen yet
+        """
+        # The tracker also holds revision keys and URLs; only compare breach hashes
+        reference = {key for key in known_hashes or () if BREACH_HASH_PATTERN.fullmatch(key)}
+        reference = reference or BreachStore().hashes
+        if not reference:
+            return None
+        
+        feed_hashes = {
+            self.create_breach_hash(cells[0], cells[1], cells[3], cells[4])
+            for cells in rows
+        }
+        return len(reference & feed_hashes) / len(reference)
+    
+    # ========================================================================
+    # SNAPSHOT REPLAY
+    # ========================================================================
+    
+    def scrape_replay(self, days_back=30, max_pages=10, known_hashes=None, incremental=None, snapshot_dir=None):
+        """
+        Run recorded page snapshots through the normal parsing path.
+        
+        No browser or network is used, which makes runs deterministic for
+        regression tests and benchmarks.
+        
+        Args:
+            snapshot_dir: Recording run directory (default: SNAPSHOT_REPLAY_DIR,
+                          then the latest recording)
+            
+        Returns:
+            list: List of dictionaries with unique breach information
+        """
+        results = []
+        seen_hashes = set()
+        self.stop_reason = None
+        self.backend_used = 'replay'
+        
+        if incremental is None:
+            incremental = self.incremental
+        
+        snapshot_dir = snapshot_dir or SNAPSHOT_CONFIG['replay_dir'] or latest_snapshot_dir(self.scraper_key)
+        if not snapshot_dir or not Path(snapshot_dir).exists():
+            print(f"[{self.source_name}] No snapshots to replay")
+            self.stop_reason = 'no_snapshots'
+            return results
+        
+        print(f"[{self.source_name}] Replaying snapshots from {snapshot_dir}")
+        start = time.perf_counter()
+        pages_read = 0
+        
+        for page, html in iter_snapshots(Path(snapshot_dir)):
+            if max_pages and pages_read >= max_pages:
+                self.stop_reason = 'max_pages'
+                break
+            
+            rows = self.parse_rows_from_html(html)
+            pages_read += 1
+            if not rows:
+                self.stop_reason = 'no_rows'
+                break
+            
+            stats = self.process_rows(rows, seen_hashes, results, days_back, known_hashes)
+            
+            if incremental:
+                self.stop_reason = self.incremental_stop_reason(stats)
+                if self.stop_reason:
+                    break
+        
+        self.stop_reason = self.stop_reason or 'no_more_snapshots'
+        print(
+            f"[{self.source_name}] Replay: {len(results)} unique breaches from {pages_read} page(s) "
+            f"in {time.perf_counter() - start:.3f}s ({self.stop_reason})"
+        )
+        return results
+    
+    # ========================================================================
+    # SHARDED SCRAPING
+    # ========================================================================
+    
+    def get_total_pages(self, driver):
+        """
+        Work out how many pages the table has.
+        
+        Reads 'Page 1 of N' style indicators first, then the highest numbered
+        pagination link.
+        
+        Returns:
+            int: Total page count, or None if it cannot be determined
+        """
+        indicator = self.get_page_state(driver)[0]
+        match = re.search(r'of\s+([\d,]+)', indicator or '')
+        if match:
+            return int(match.group(1).replace(',', ''))
+        
+        try:
+            max_page = int(driver.execute_script(MAX_PAGE_LINK_SCRIPT) or 0)
+        except Exception:
+            max_page = 0
+        return max_page or None
+    
+    def goto_page(self, driver, page_number):
+        """
+        Show the given page (1-based) in a freshly loaded driver.
+        
+        Uses page_url_template when the site keeps the page in the URL,
+        otherwise loads page 1 and clicks 'Next' until it gets there.
+        
+        Returns:
+            bool: True if the page is showing
+        """
+        if self.page_url_template:
+            driver.get(self.page_url_template.format(base_url=self.base_url, page=page_number))
+            return self.wait_for_table(driver)
+        
+        driver.get(self.base_url)
+        if not self.wait_for_table(driver):
+            return False
+        
+        for _ in range(page_number - 1):
+            if not self.click_next_page(driver):
+                return False
+        return True
+    
+    def split_pages(self, total_pages, workers):
+        """Split pages 1..total_pages into contiguous (first, last) ranges"""
+        workers = max(1, min(workers, total_pages))
+        size, extra = divmod(total_pages, workers)
+        
+        ranges = []
+        first = 1
+        for index in range(workers):
+            last = first + size - 1 + (1 if index < extra else 0)
+            ranges.append((first, last))
+            first = last + 1
+        return ranges
+    
+    def scrape_shard(self, first_page, last_page):
+        """
+        Read the raw rows of a contiguous page range with its own driver.
+        
+        Returns:
+            tuple: ({page_number: rows}, NetworkStats)
+        """
+        pages = {}
+        network_stats = NetworkStats()
+        driver = None
+        healthy = True
+        
+        try:
+            # The shards share one budget; a shard that starts after it is spent reads nothing
+            if self.budget.exceeded():
+                return pages, network_stats
+            
+            driver = self.acquire_driver()
+            if not self.goto_page(driver, first_page):
+                print(f"[{self.source_name}] Shard {first_page}-{last_page}: could not reach page {first_page}")
+                return pages, network_stats
+            
+            for page_number in range(first_page, last_page + 1):
+                rows = self.extract_rows(driver)
+                bytes_before = network_stats.bytes_received
+                network_stats.collect(driver)
+                self.budget.record_request()
+                self.budget.record_bytes(network_stats.bytes_received - bytes_before)
+                if not rows:
+                    break
+                self.record_page(driver, page_number, rows)
+                pages[page_number] = rows
+                
+                if self.budget.exceeded():
+                    print(
+                        f"[{self.source_name}] Shard {first_page}-{last_page}: budget exceeded "
+                        f"({self.budget.exceeded_reason}) after page {page_number}, stopping"
+                    )
+                    break
+                
+                if page_number < last_page and not self.click_next_page(driver):
+                    break
+            
+            print(f"[{self.source_name}] Shard {first_page}-{last_page}: read {len(pages)} page(s)")
+        
+        except Exception as e:
+            print(f"[{self.source_name}] Shard {first_page}-{last_page} ERROR: {e}")
+            healthy = False
+        
+        finally:
+            self.release_driver(driver, healthy)
+        
+        return pages, network_stats
+    
+    def scrape_sharded(self, days_back=30, max_pages=10, known_hashes=None):
+        """
+        Scrape the table with several browsers working on page ranges.
+        
+        Rows are merged in page order through process_rows, so seen_hashes
+        dedupe gives the same result as a sequential run.
+        
+        Returns:
+            list: List of dictionaries with unique breach information
+        """
+        results = []
+        seen_hashes = set()
+        self.wait_timings = []
+        self.stop_reason = None
+        self.backend_used = 'selenium_sharded'
+        self.network_stats = NetworkStats()
+        driver = None
+        
+        try:
+            driver = self.acquire_driver()
+            print(f"[{self.source_name}] Loading {self.base_url}...")
+            driver.get(self.base_url)
+            self.budget.record_request()
+            self.wait_for_table(driver)
+            total_pages = self.get_total_pages(driver)
+        except Exception as e:
+            print(f"[{self.source_name}] ERROR: {e}")
+            total_pages = None
+        finally:
+            self.release_driver(driver)
+        
+        if not total_pages:
+            print(f"[{self.source_name}] Could not determine page count, scraping sequentially")
+            return self.scrape_browser(days_back, max_pages, known_hashes, incremental=False)
+        
+        pages_to_read = min(total_pages, max_pages) if max_pages else total_pages
+        ranges = self.split_pages(pages_to_read, self.shard_workers)
+        print(f"[{self.source_name}] {total_pages} pages, reading {pages_to_read} with {len(ranges)} shard(s): {ranges}")
+        
+        pages = {}
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(self.scrape_shard, first, last) for first, last in ranges]
+            for future in futures:
+                shard_pages, shard_stats = future.result()
+                pages.update(shard_pages)
+                self.network_stats.add(shard_stats)
+        
+        total_duplicates = 0
+        for page_number in sorted(pages):
+            stats = self.process_rows(pages[page_number], seen_hashes, results, days_back, known_hashes)
+            total_duplicates += stats['duplicates']
+        
+        missing = [page for page in range(1, pages_to_read + 1) if page not in pages]
+        if missing and self.budget.exceeded_reason:
+            self.stop_reason = 'budget'
+        elif missing:
+            self.stop_reason = 'incomplete_shards'
+        else:
+            self.stop_reason = 'no_more_pages' if pages_to_read >= total_pages else 'max_pages'
+        
+        print(f"[{self.source_name}] Total: {len(results)} unique breaches from {len(pages)} page(s)")
+        print(f"[{self.source_name}] Filtered out {total_duplicates} duplicate entries")
+        if missing:
+            print(f"[{self.source_name}] Missing pages: {missing[:20]}{'...' if len(missing) > 20 else ''}")
+        self.print_wait_summary()
+        print(f"[{self.source_name}] Network ({self.driver_profile} profile): {self.network_stats.summary()}")
+        
+        return results
     
-    def scrape(self, days_back=30, max_pages=10):
+    # ========================================================================
+    # SEQUENTIAL SCRAPING
+    # ========================================================================
+    
+    def scrape_browser(self, days_back=30, max_pages=10, known_hashes=None, incremental=None):
         """
         Scrape healthcare data breaches with pagination and deduplication
         
         Args:
             days_back: Number of days to look back (default: 30)
             max_pages: Maximum number of pages to scrape (default: 10)
+            known_hashes: breach_hash values already sent (used by incremental mode)
+            incremental: Stop paging once a page has nothing new
+                         (default: USATODAY_CONFIG['incremental'])
             
         Returns:
             list: List of dictionaries with unique breach information
@@ -132,133 +994,228 @@ class USATodayBreachesScraper:
         results = []
         seen_hashes = set()  # Track unique breaches by hash
         total_duplicates = 0
+        self.wait_timings = []
+        self.stop_reason = None
+        self.backend_used = 'selenium'
+        self.network_stats = NetworkStats()
+        
+        if incremental is None:
+            incremental = self.incremental
         
         try:
-            driver = self.setup_driver()
+            driver = self.acquire_driver()
             print(f"[{self.source_name}] Loading {self.base_url}...")
             
             driver.get(self.base_url)
-            time.sleep(5)
+            if not self.wait_for_table(driver):
+                print(f"[{self.source_name}] Table did not settle within {self.load_timeout}s, reading what is there")
             
             page_number = 1
             
             while page_number <= max_pages:
                 print(f"[{self.source_name}] Scraping page {page_number}...")
                 
-                # Find table rows
-                breach_elements = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+                # Read the whole table in one go
+                rows = self.extract_rows(driver)
                 
-                if not breach_elements:
+                if not rows:
                     print(f"[{self.source_name}] No breach items found on page {page_number}")
+                    self.stop_reason = 'no_rows'
                     break
                 
-                print(f"[{self.source_name}] Found {len(breach_elements)} rows on page {page_number}")
+                print(f"[{self.source_name}] Found {len(rows)} rows on page {page_number}")
+                bytes_before = self.network_stats.bytes_received
+                self.network_stats.collect(driver)
+                self.budget.record_request()
+                self.budget.record_bytes(self.network_stats.bytes_received - bytes_before)
+                self.record_page(driver, page_number, rows)
                 
-                page_results = 0
-                page_duplicates = 0
+                stats = self.process_rows(rows, seen_hashes, results, days_back, known_hashes)
                 
-                # Process each breach item
-                for idx, element in enumerate(breach_elements):
-                    try:
-                        cells = element.find_elements(By.TAG_NAME, 'td')
-                        
-                        if len(cells) < 4:
-                            continue
-                        
-                        # Extract all columns
-                        company = cells[0].text.strip() if len(cells) > 0 else ""
-                        state = cells[1].text.strip() if len(cells) > 1 else ""
-                        company_type = cells[2].text.strip() if len(cells) > 2 else ""
-                        breach_date = cells[3].text.strip() if len(cells) > 3 else ""
-                        people_affected = cells[4].text.strip() if len(cells) > 4 else ""
-                        breach_type = cells[5].text.strip() if len(cells) > 5 else ""
-                        breach_source = cells[6].text.strip() if len(cells) > 6 else ""
-                        
-                        if not company:
-                            continue
-                        
-                        # Create unique hash to detect duplicates
-                        breach_hash = self.create_breach_hash(company, state, breach_date, people_affected)
-                        
-                        # Skip if we've already seen this exact breach
-                        if breach_hash in seen_hashes:
-                            page_duplicates += 1
-                            continue
-                        
-                        seen_hashes.add(breach_hash)
-                        
-                        # Parse date
-                        date_obj = self.parse_date(breach_date)
-                        
-                        # Filter by date
-                        if self.is_recent(date_obj, days=days_back):
-                            # Create unique identifier using hash
-                            breach_id = breach_hash[:12]
-                            
-                            title = f"{company} - {state} - {people_affected} people affected"
-                            
-                            description = (
-                                f"Company Type: {company_type} | "
-                                f"State: {state} | "
-                                f"Breach Date: {breach_date} | "
-                                f"People Affected: {people_affected} | "
-                                f"Breach Type: {breach_type} | "
-                                f"Breach Source: {breach_source}"
-                            )
-                            
-                            breach_info = {
-                                'title': title,
-                                'url': f"{self.base_url}#{breach_id}",
-                                'description': description,
-                                'date': date_obj.strftime('%Y-%m-%d') if date_obj else breach_date,
-                                'source': self.source_name,
-                                'breach_hash': breach_hash,
-                                # Detailed fields for table format
-                                'company': company,
-                                'state': state,
-                                'company_type': company_type,
-                                'breach_date': breach_date,
-                                'people_affected': people_affected,
-                                'breach_type': breach_type,
-                                'breach_source': breach_source,
-                                'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            }
-                            results.append(breach_info)
-                            page_results += 1
-                    
-                    except Exception as e:
-                        continue
+                total_duplicates += stats['duplicates']
+                print(
+                    f"[{self.source_name}] Page {page_number}: {stats['unique']} unique, "
+                    f"{stats['duplicates']} duplicates, {stats['known']} already sent, {stats['older']} too old"
+                )
                 
-                total_duplicates += page_duplicates
-                print(f"[{self.source_name}] Page {page_number}: {page_results} unique, {page_duplicates} duplicates")
+                if incremental:
+                    self.stop_reason = self.incremental_stop_reason(stats)
+                    if self.stop_reason:
+                        print(f"[{self.source_name}] Nothing new on page {page_number}, stopping ({self.stop_reason})")
+                        break
+                
+                # Out of time/pages/bytes: keep the pages read so far
+                if self.budget.exceeded():
+                    self.stop_reason = 'budget'
+                    print(f"[{self.source_name}] Budget exceeded ({self.budget.exceeded_reason}) after page {page_number}, stopping")
+                    break
                 
-                # Try to go to next page
+                # Try to go to next page ('no_more_pages' means the whole table
+                # was read, so a page that fails to load must not end up there)
                 if page_number < max_pages:
-                    if not self.click_next_page(driver):
-                        print(f"[{self.source_name}] No more pages available")
+                    try:
+                        if not self.click_next_page(driver, raise_on_timeout=True):
+                            print(f"[{self.source_name}] No more pages available")
+                            self.stop_reason = 'no_more_pages'
+                            break
+                    except Exception as e:
+                        print(f"[{self.source_name}] Could not open page {page_number + 1}: {e}")
+                        self.stop_reason = 'page_timeout'
                         break
                     page_number += 1
                 else:
                     print(f"[{self.source_name}] Reached max pages ({max_pages})")
+                    self.stop_reason = 'max_pages'
                     break
             
             print(f"[{self.source_name}] Total: {len(results)} unique breaches from {page_number} page(s)")
             print(f"[{self.source_name}] Filtered out {total_duplicates} duplicate entries")
+            print(f"[{self.source_name}] Stop reason: {self.stop_reason}")
+            self.print_wait_summary()
+            
+            self.network_stats.collect(driver)
+            print(f"[{self.source_name}] Network ({self.driver_profile} profile): {self.network_stats.summary()}")
             
         except Exception as e:
             print(f"[{self.source_name}] ERROR: {e}")
+            self.stop_reason = 'error'
             import traceback
             traceback.print_exc()
         
         finally:
-            if driver:
-                driver.quit()
+            self.release_driver(driver, healthy=self.stop_reason != 'error')
         
         return results
     
-    def run(self):
-        """Run method for orchestrator compatibility"""
-        results = self.scrape(days_back=30, max_pages=10)
+    # ========================================================================
+    # FULL-HISTORY BACKFILL
+    # ========================================================================
+    
+    def load_backfill_checkpoint(self, checkpoint_file):
+        """Load the backfill cursor, or a fresh one if none exists"""
+        checkpoint = load_json(checkpoint_file, default=None) if checkpoint_file else None
+        if not isinstance(checkpoint, dict):
+            checkpoint = {
+                'last_completed_page': 0,
+                'hashes': [],
+                'records_stored': 0,
+                'completed': False,
+                'started_at': datetime.now().isoformat(),
+            }
+        return checkpoint
+    
+    def save_backfill_checkpoint(self, checkpoint_file, checkpoint, seen_hashes):
+        """Write the backfill cursor atomically"""
+        checkpoint['hashes'] = sorted(seen_hashes)
+        checkpoint['updated_at'] = datetime.now().isoformat()
+        atomic_write_json(checkpoint, checkpoint_file, indent=None)
+    
+    def backfill(self, checkpoint_file=None, store=None, max_pages=None, restart=False):
+        """
+        Walk every page of the table into the local breach store.
+        
+        The last completed page and the accumulated hashes are checkpointed
+        after each page, so a crash or timeout resumes where it stopped. If the
+        browser dies mid-run, a fresh driver picks up from the checkpoint.
+        
+        Args:
+            checkpoint_file: Cursor file (default from USATODAY_CONFIG)
+            store: BreachStore to write to (default store file)
+            max_pages: Stop after this page number (None walks every page)
+            restart: Ignore an existing checkpoint and start from page 1
+            
+        Returns:
+            dict: Final checkpoint
+        """
+        checkpoint_file = Path(checkpoint_file or USATODAY_CONFIG['backfill_checkpoint_file'])
+        store = store if store is not None else BreachStore()
+        
+        checkpoint = None if restart else self.load_backfill_checkpoint(checkpoint_file)
+        if checkpoint is None or checkpoint.get('completed'):
+            checkpoint = self.load_backfill_checkpoint(None)
+        
+        seen_hashes = set(checkpoint.get('hashes', []))
+        self.network_stats = NetworkStats()
+        # Failures allowed in a row; every completed page refills the allowance
+        retries_left = USATODAY_CONFIG['backfill_max_retries']
+        
+        print(f"[{self.source_name}] Backfill starting after page {checkpoint['last_completed_page']}")
+        
+        while not checkpoint['completed']:
+            page_number = checkpoint['last_completed_page'] + 1
+            if max_pages and page_number > max_pages:
+                break
+            
+            driver = None
+            healthy = True
+            try:
+                driver = self.acquire_driver()
+                if not self.goto_page(driver, page_number):
+                    raise RuntimeError(f"Could not reach page {page_number}")
+                
+                while True:
+                    rows = self.extract_rows(driver)
+                    # Drain the performance log every page so it does not pile up in the driver
+                    self.network_stats.collect(driver)
+                    if not rows:
+                        checkpoint['completed'] = True
+                        break
+                    
+                    page_results = []
+                    stats = self.process_rows(rows, seen_hashes, page_results, days_back=None)
+                    stored = store.add_many(page_results)
+                    
+                    checkpoint['last_completed_page'] = page_number
+                    checkpoint['records_stored'] = checkpoint.get('records_stored', 0) + stored
+                    self.save_backfill_checkpoint(checkpoint_file, checkpoint, seen_hashes)
+                    retries_left = USATODAY_CONFIG['backfill_max_retries']
+                    print(
+                        f"[{self.source_name}] Backfill page {page_number}: {stats['rows']} rows, "
+                        f"{stored} new records ({len(store)} in store)"
+                    )
+                    
+                    if max_pages and page_number >= max_pages:
+                        break
+                    # Only a missing or disabled 'Next' ends the backfill; a
+                    # page that fails to load raises and resumes from the checkpoint
+                    if not self.click_next_page(driver, raise_on_timeout=True):
+                        checkpoint['completed'] = True
+                        break
+                    page_number += 1
+                
+                if max_pages and checkpoint['last_completed_page'] >= max_pages:
+                    break
+            
+            except Exception as e:
+                healthy = False
+                if retries_left <= 0:
+                    print(f"[{self.source_name}] Backfill stopped at page {checkpoint['last_completed_page']}: {e}")
+                    raise
+                retries_left -= 1
+                print(f"[{self.source_name}] Backfill error on page {page_number}, resuming from checkpoint: {e}")
+            
+            finally:
+                self.release_driver(driver, healthy)
+        
+        self.save_backfill_checkpoint(checkpoint_file, checkpoint, seen_hashes)
+        status = "complete" if checkpoint['completed'] else "paused"
+        print(
+            f"[{self.source_name}] Backfill {status}: {checkpoint['last_completed_page']} page(s), "
+            f"{len(store)} records in {store.store_file}"
+        )
+        print(f"[{self.source_name}] Network ({self.driver_profile} profile): {self.network_stats.summary()}")
+        return checkpoint
+    
+    def run(self, known_hashes=None):
+        """
+        Run method for orchestrator compatibility
+        
+        Args:
+            known_hashes: breach_hash values already sent, lets incremental
+                          mode stop paging early (optional)
+        """
+        self.budget.start()
+        results = self.scrape(days_back=30, max_pages=10, known_hashes=known_hashes)
         
         urls = []
         for item in results:
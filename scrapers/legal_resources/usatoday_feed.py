@@ -0,0 +1,265 @@
+"""
+USA Today Healthcare Data Breaches - Direct Data Feed Backend
+Fetches the JSON/CSV dataset behind data.usatoday.com with requests
+and turns it into table rows, so no browser is needed.
+"""
+
+import csv
+import io
+import json
+import re
+import time
+from datetime import datetime
+from urllib.parse import urljoin
+
+import requests
+
+from config.settings import SCRAPER_CONFIG, USATODAY_CONFIG
+from core.http_session import new_http_session
+
+
+# Table columns in display order, with the dataset field names seen for each
+FEED_COLUMNS = [
+    ('company', ['company', 'entity', 'covered_entity', 'name_of_covered_entity']),
+    ('state', ['state']),
+    ('company_type', ['company_type', 'entity_type', 'covered_entity_type']),
+    ('breach_date', ['breach_date', 'submission_date', 'breach_submission_date']),
+    ('people_affected', ['people_affected', 'individuals_affected']),
+    ('breach_type', ['breach_type', 'type_of_breach']),
+    ('breach_source', ['breach_source', 'location_of_breached_information']),
+]
+
+# AP-style month abbreviations used by the table ("Jan. 5, 2026", "March 5, 2026")
+AP_MONTHS = ['Jan.', 'Feb.', 'March', 'April', 'May', 'June',
+             'July', 'Aug.', 'Sept.', 'Oct.', 'Nov.', 'Dec.']
+
+# Data files referenced from the page markup or its scripts
+FEED_URL_PATTERN = re.compile(r'["\']([^"\'\s]+\.(?:json|csv)(?:\?[^"\'\s]*)?)["\']', re.IGNORECASE)
+
+
+class FeedError(Exception):
+    """Raised when the data feed cannot be fetched or parsed"""
+
+
+class USATodayFeedBackend:
+    """Reads the breach dataset directly over HTTP"""
+
+    def __init__(self, base_url, source_name, feed_url=None, session=None, budget=None):
+        """
+        Args:
+            base_url: Page that renders the breach table
+            source_name: Name used in log lines
+            feed_url: Dataset URL (discovered from base_url when empty)
+            session: requests.Session to reuse (optional, left open by close();
+                     default: a new session on the shared connection pool)
+            budget: ScraperBudget charged for every request (optional)
+        """
+        self.base_url = base_url
+        self.source_name = source_name
+        self.feed_url = feed_url or USATODAY_CONFIG['feed_url']
+        self.timeout = USATODAY_CONFIG['feed_timeout']
+        self.max_retries = SCRAPER_CONFIG['max_retries']
+        self.date_format = USATODAY_CONFIG['feed_date_format']
+        self.budget = budget
+
+        self._owns_session = session is None
+        self.session = session or new_http_session()
+
+    def get(self, url):
+        """
+        GET with the same retry/backoff and budget checks as BaseScraper.fetch_page
+
+        Raises:
+            FeedError: If the request keeps failing
+            BudgetExceeded: If the budget is spent
+        """
+        for attempt in range(self.max_retries + 1):
+            timeout = self.timeout
+            if self.budget is not None:
+                self.budget.check()
+                self.budget.record_request()
+                timeout = self.budget.request_timeout(timeout)
+            try:
+                response = self.session.get(url, timeout=timeout)
+                if self.budget is not None:
+                    self.budget.record_bytes(len(response.content))
+                response.raise_for_status()
+                return response
+            except requests.exceptions.RequestException as e:
+                if attempt >= self.max_retries:
+                    raise FeedError(f"Failed to fetch {url}: {e}")
+                time.sleep(2 ** attempt)
+
+    def discover_feed_urls(self):
+        """
+        Look for JSON/CSV data files referenced by the table page.
+
+        Returns:
+            list: Absolute candidate feed URLs in page order
+        """
+        html = self.get(self.base_url).text
+        candidates = []
+        for match in FEED_URL_PATTERN.finditer(html):
+            candidate = match.group(1).replace('\\/', '/')
+            if 'manifest' in candidate.lower():
+                continue
+            candidate = urljoin(self.base_url, candidate)
+            if candidate not in candidates:
+                candidates.append(candidate)
+        return candidates
+
+    def fetch_rows(self):
+        """
+        Fetch the dataset and return it as table rows.
+
+        Returns:
+            list: One list of 7 cell strings per breach (table column order)
+
+        Raises:
+            FeedError: If no feed is available or none has the breach columns
+        """
+        candidates = [self.feed_url] if self.feed_url else self.discover_feed_urls()
+        if not candidates:
+            raise FeedError("No data feed URL configured or found on the page")
+
+        error = None
+        for feed_url in candidates:
+            try:
+                rows = self.fetch_feed(feed_url)
+            except FeedError as e:
+                print(f"[{self.source_name}] Skipping {feed_url}: {e}")
+                error = e
+                continue
+
+            # Remember what worked so the next run skips discovery
+            self.feed_url = feed_url
+            return rows
+
+        raise error
+
+    def fetch_feed(self, feed_url):
+        """Fetch and parse one candidate feed into table rows"""
+        print(f"[{self.source_name}] Fetching data feed {feed_url}...")
+        response = self.get(feed_url)
+
+        content_type = response.headers.get('Content-Type', '').lower()
+        if 'csv' in content_type or feed_url.lower().split('?')[0].endswith('.csv'):
+            records = self.parse_csv(response.text)
+        else:
+            records = self.parse_json(response.text)
+
+        if not records:
+            raise FeedError("Data feed returned no breach records")
+
+        keys = {self.normalize_key(key) for key in records[0]}
+        missing = [column for column, _ in FEED_COLUMNS if column not in self.column_index(keys)]
+        if missing:
+            raise FeedError(f"Data feed is missing columns: {', '.join(missing)}")
+
+        rows = [self.record_to_row(record) for record in records]
+        rows = [row for row in rows if row[0]]
+        if not rows:
+            raise FeedError("Data feed returned no breach records")
+        return rows
+
+    def parse_json(self, text):
+        """Parse a JSON payload into a list of dict records"""
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise FeedError(f"Data feed is not valid JSON: {e}")
+
+        if isinstance(data, dict):
+            for key in ('data', 'rows', 'records', 'results', 'items'):
+                if isinstance(data.get(key), list):
+                    data = data[key]
+                    break
+
+        if not isinstance(data, list):
+            raise FeedError("Data feed JSON does not contain a list of records")
+
+        # A list of lists needs a header row; bare positional rows cannot be
+        # checked against the table columns
+        if data and isinstance(data[0], list):
+            if not all(isinstance(cell, str) for cell in data[0]):
+                raise FeedError("Data feed rows have no header")
+            header = [self.normalize_key(cell) for cell in data[0]]
+            return [dict(zip(header, row)) for row in data[1:] if isinstance(row, list)]
+
+        if not all(isinstance(record, dict) for record in data):
+            raise FeedError("Data feed JSON records are not objects")
+        return data
+
+    def parse_csv(self, text):
+        """Parse a CSV payload into a list of dicts"""
+        return list(csv.DictReader(io.StringIO(text)))
+
+    @staticmethod
+    def normalize_key(key):
+        """'Name of Covered Entity' -> 'name_of_covered_entity'"""
+        return re.sub(r'[^a-z0-9]+', '_', str(key).strip().lower()).strip('_')
+
+    @staticmethod
+    def column_index(keys):
+        """Map each table column to the first matching dataset key"""
+        keys = set(keys)
+        index = {}
+        for column, aliases in FEED_COLUMNS:
+            for alias in aliases:
+                if alias in keys:
+                    index[column] = alias
+                    break
+        return index
+
+    def record_to_row(self, record):
+        """Convert one dataset record into the 7 table cell strings"""
+        normalized = {self.normalize_key(key): value for key, value in record.items()}
+        index = self.column_index(normalized.keys())
+        row = []
+        for column, _ in FEED_COLUMNS:
+            value = normalized.get(index.get(column), "")
+            if column == 'breach_date':
+                value = self.format_date(value)
+            elif column == 'people_affected':
+                value = self.format_count(value)
+            row.append(self.format_value(value))
+        return row
+
+    @staticmethod
+    def format_value(value):
+        """Render a dataset value the way the table shows it"""
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return str(value)
+        if isinstance(value, int):
+            return f"{value:,}"
+        if isinstance(value, float) and value.is_integer():
+            return f"{int(value):,}"
+        return str(value).strip()
+
+    @staticmethod
+    def format_count(value):
+        """Group digits the way the table does ("12345" -> "12,345")"""
+        if isinstance(value, str) and re.fullmatch(r'\d+', value.strip()):
+            return f"{int(value):,}"
+        return value
+
+    def format_date(self, value):
+        """
+        Re-render ISO dates in the table's format (feed_date_format: 'ap' for
+        the table's AP style, a strftime format, or empty to keep the feed's)
+        """
+        if not self.date_format or not isinstance(value, str):
+            return value
+        try:
+            date = datetime.strptime(value.strip()[:10], '%Y-%m-%d')
+        except ValueError:
+            return value
+        if self.date_format == 'ap':
+            return f"{AP_MONTHS[date.month - 1]} {date.day}, {date.year}"
+        return date.strftime(self.date_format)
+
+    def close(self):
+        if self._owns_session:
+            self.session.close()
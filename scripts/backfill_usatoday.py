@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Backfill USA Today Breaches
+Walk every page of the USA Today healthcare breach database into the local
+breach store. Safe to re-run: it resumes from the last completed page.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.legal_resources.usatoday_breaches import USATodayBreachesScraper
+
+
+def main():
+    """Run or resume the full-history backfill"""
+    parser = argparse.ArgumentParser(description="Backfill the USA Today healthcare breach database")
+    parser.add_argument('--restart', action='store_true', help="ignore the checkpoint and start from page 1")
+    parser.add_argument('--max-pages', type=int, default=None, help="stop after this page number")
+    args = parser.parse_args()
+    
+    print("\n" + "="*60)
+    print("USA Today Breaches - Full History Backfill")
+    print("="*60 + "\n")
+    
+    scraper = USATodayBreachesScraper()
+    checkpoint = scraper.backfill(max_pages=args.max_pages, restart=args.restart)
+    
+    print("\n" + "="*60)
+    print(f"Last completed page: {checkpoint['last_completed_page']}")
+    print(f"Records stored this backfill: {checkpoint.get('records_stored', 0)}")
+    print(f"Completed: {'Yes' if checkpoint['completed'] else 'No (re-run to resume)'}")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
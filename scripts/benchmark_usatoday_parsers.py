@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark USA Today Table Parsers
+Time the lxml page_source parser against the per-cell WebElement path on
+recorded page snapshots (record some first with SNAPSHOT_MODE=record).
+
+Without --browser, lxml is compared with BeautifulSoup on the same HTML.
+With --browser, each snapshot is opened in headless Chrome from disk and
+the WebElement, execute_script and page_source+lxml paths are timed.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from scrapers.legal_resources.usatoday_breaches import USATodayBreachesScraper
+from utils.snapshot_utils import iter_snapshots, latest_snapshot_dir
+
+
+def parse_rows_bs4(html):
+    """Reference parser: BeautifulSoup with the stdlib html.parser"""
+    soup = BeautifulSoup(html, 'html.parser')
+    return [
+        [' '.join(cell.get_text(' ').split()) for cell in row.find_all('td')[:7]]
+        for row in soup.select('table tbody tr')
+    ]
+
+
+def time_parser(func, arg, repeat):
+    """Run func(arg) repeat times; return (median seconds, last result)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(arg)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def print_results(totals, row_counts):
+    """Print per-parser totals relative to the fastest"""
+    fastest = min(totals.values()) or 1e-9
+    print(f"\n{'Parser':<22} {'Total (ms)':>12} {'Rows':>8} {'Relative':>10}")
+    print("-" * 56)
+    for name, total in sorted(totals.items(), key=lambda item: item[1]):
+        print(f"{name:<22} {total * 1000:>12.2f} {row_counts[name]:>8} {total / fastest:>9.1f}x")
+
+
+def benchmark_offline(snapshots, scraper, repeat):
+    """lxml vs BeautifulSoup on the saved HTML"""
+    parsers = {
+        'lxml': scraper.parse_rows_from_html,
+        'beautifulsoup': parse_rows_bs4,
+    }
+    totals = {name: 0.0 for name in parsers}
+    row_counts = {name: 0 for name in parsers}
+    
+    for page, html in snapshots:
+        for name, func in parsers.items():
+            seconds, rows = time_parser(func, html, repeat)
+            totals[name] += seconds
+            row_counts[name] += len(rows)
+    
+    print_results(totals, row_counts)
+
+
+def benchmark_browser(snapshots, scraper, repeat, run_dir):
+    """WebElement vs execute_script vs page_source+lxml in a real browser"""
+    driver = scraper.setup_driver()
+    parsers = {
+        'elements': scraper._extract_rows_elements,
+        'script': scraper._extract_rows_script,
+        'page_source+lxml': scraper._extract_rows_lxml,
+    }
+    totals = {name: 0.0 for name in parsers}
+    row_counts = {name: 0 for name in parsers}
+    
+    try:
+        for page, _ in snapshots:
+            driver.get((run_dir / page['file']).resolve().as_uri())
+            for name, func in parsers.items():
+                seconds, rows = time_parser(func, driver, repeat)
+                totals[name] += seconds
+                row_counts[name] += len(rows)
+    finally:
+        driver.quit()
+    
+    print_results(totals, row_counts)
+
+
+def main():
+    """Run the parser benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark USA Today table parsers on recorded pages")
+    parser.add_argument('snapshot_dir', nargs='?', help="recording run directory (default: latest)")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per page (median is used)")
+    parser.add_argument('--browser', action='store_true', help="also time the WebElement path in Chrome")
+    args = parser.parse_args()
+    
+    scraper = USATodayBreachesScraper()
+    run_dir = Path(args.snapshot_dir) if args.snapshot_dir else latest_snapshot_dir(scraper.scraper_key)
+    if not run_dir or not run_dir.exists():
+        print("\n❌ No snapshots found. Record some with SNAPSHOT_MODE=record first.")
+        sys.exit(1)
+    
+    snapshots = list(iter_snapshots(run_dir))
+    print("\n" + "="*60)
+    print(f"Benchmarking {len(snapshots)} page(s) from {run_dir}")
+    print("="*60)
+    
+    if args.browser:
+        benchmark_browser(snapshots, scraper, args.repeat, run_dir)
+    else:
+        benchmark_offline(snapshots, scraper, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Compact Scraped Data
+Fold the legacy timestamped data/scraped/<scraper>_data_<timestamp>.json
+files into the per-scraper, per-month partitioned store.
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.settings import SCRAPED_DIR
+from core.partitioned_store import PartitionedStore
+
+
+# Files written by BaseScraper.save_data before the partitioned store
+LEGACY_FILE_PATTERN = re.compile(r'^(?P<scraper_key>.+)_data_(?P<stamp>\d{8}_\d{6})\.json$')
+
+
+def find_legacy_files():
+    """
+    Group legacy data files by scraper, oldest first.
+    
+    Returns:
+        dict: scraper_key -> list of (timestamp, Path)
+    """
+    files = defaultdict(list)
+    for file_path in SCRAPED_DIR.glob("*_data_*.json"):
+        match = LEGACY_FILE_PATTERN.match(file_path.name)
+        if match:
+            stamp = datetime.strptime(match.group('stamp'), '%Y%m%d_%H%M%S')
+            files[match.group('scraper_key')].append((stamp, file_path))
+    
+    for scraper_files in files.values():
+        scraper_files.sort()
+    return dict(files)
+
+
+def load_items(file_path):
+    """Items of a legacy data file (a list, or a dict with a 'data'/'urls' list)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        # A wrapper with an empty list has no items; only a bare record stands for itself
+        if 'data' in data:
+            data = data['data']
+        elif 'urls' in data:
+            data = data['urls']
+        else:
+            data = [data]
+    return [item for item in data if isinstance(item, dict)]
+
+
+def main():
+    """Compact legacy scraped data files into partitions"""
+    parser = argparse.ArgumentParser(description="Fold legacy data/scraped files into the partitioned store")
+    parser.add_argument('--delete', action='store_true', help="delete each legacy file once its items are stored")
+    parser.add_argument('--dry-run', action='store_true', help="only report what would be compacted")
+    args = parser.parse_args()
+    
+    store = PartitionedStore()
+    legacy_files = find_legacy_files()
+    
+    print("\n" + "="*60)
+    print("Compacting data/scraped into partitions")
+    print("="*60 + "\n")
+    
+    total_files = total_items = total_new = bytes_before = 0
+    
+    for scraper_key, scraper_files in sorted(legacy_files.items()):
+        scraper_items = scraper_new = 0
+        
+        for stamp, file_path in scraper_files:
+            try:
+                items = load_items(file_path)
+            except (OSError, ValueError) as e:
+                print(f"[WARNING] Skipping {file_path.name}: {e}")
+                continue
+            
+            total_files += 1
+            bytes_before += file_path.stat().st_size
+            scraper_items += len(items)
+            
+            if args.dry_run:
+                continue
+            
+            added = store.append(scraper_key, items, default_month=stamp.strftime('%Y-%m'))
+            scraper_new += sum(added.values())
+            
+            if args.delete:
+                file_path.unlink()
+        
+        total_items += scraper_items
+        total_new += scraper_new
+        print(f"  {scraper_key:<30} {len(scraper_files):>4} files, {scraper_items:>6} items, {scraper_new:>5} new")
+    
+    bytes_after = sum(path.stat().st_size for path in store.root.glob('*/*.jsonl.gz'))
+    
+    print("\n" + "-"*60)
+    print(f"Legacy files: {total_files} ({bytes_before / 1024:.0f} KB)")
+    print(f"Items read: {total_items}, stored as new: {total_new}")
+    if not args.dry_run:
+        print(f"Partitions: {len(list(store.root.glob('*/*.jsonl.gz')))} files ({bytes_after / 1024:.0f} KB)")
+        print(f"Legacy files {'deleted' if args.delete else 'kept (re-run with --delete to remove them)'}")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
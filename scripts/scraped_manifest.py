@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Scraped Data Manifest
+Refresh or rebuild the manifest BatchProcessor uses to skip re-parsing
+unchanged files in data/scraped. With the SQLite dedupe backend this
+(re)imports the files into the dedupe store, which tracks them itself.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.batch_processor import SEEN_SOURCE
+from core.dedupe_store import get_dedupe_store, is_sqlite_backend
+from core.scraped_manifest import ScrapedManifest
+
+
+def main():
+    """Refresh or rebuild the scraped data manifest"""
+    parser = argparse.ArgumentParser(description="Maintain the data/scraped manifest")
+    parser.add_argument('command', choices=['refresh', 'rebuild'],
+                        help="refresh = parse new/changed files only, rebuild = re-parse everything")
+    args = parser.parse_args()
+    
+    store = get_dedupe_store() if is_sqlite_backend() else None
+    manifest = ScrapedManifest(store=store, source=SEEN_SOURCE)
+    stats = manifest.rebuild() if args.command == 'rebuild' else manifest.refresh()
+    
+    print("\n" + "="*60)
+    print(f"Manifest: {store.db_path if store else manifest.manifest_file}")
+    print(f"Files parsed: {stats['parsed']}")
+    print(f"Files unchanged: {stats['unchanged']}")
+    print(f"Entries removed: {stats['removed']}")
+    if store:
+        print(f"Stored URLs: {store.count(SEEN_SOURCE)}")
+    else:
+        print(f"Indexed files: {len(manifest.files)}")
+        print(f"URL digests: {len(manifest.digest_set())}")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
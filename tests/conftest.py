@@ -0,0 +1,41 @@
+"""Shared pytest fixtures: repo root on sys.path and a local fixture web server"""
+
+import functools
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Serve fixture files without logging every request"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='session')
+def fixture_server():
+    """
+    Serve tests/fixtures over HTTP on a free local port.
+
+    Yields:
+        str: Base URL ending in '/'
+    """
+    handler = functools.partial(QuietHandler, directory=str(FIXTURES))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
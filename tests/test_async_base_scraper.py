@@ -0,0 +1,119 @@
+"""AsyncBaseScraper against local stand-in servers"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scrapers.async_base_scraper import AsyncBaseScraper
+
+# Server-side time per request (seconds)
+RESPONSE_DELAY = 0.2
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers every path with a small page after RESPONSE_DELAY; /missing is a 404"""
+
+    def do_GET(self):
+        self.server.arrivals.append((self.path, time.monotonic()))
+        time.sleep(RESPONSE_DELAY)
+        if self.path == '/missing':
+            self.send_error(404)
+            return
+        body = f"<html><head><title>{self.path}</title></head><body></body></html>".encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.arrivals = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture(autouse=True)
+def scraper_logs(tmp_path, monkeypatch):
+    """Keep the scraper's log file out of data/logs"""
+    monkeypatch.setattr('scrapers.base_scraper.LOGS_DIR', tmp_path)
+
+
+@pytest.fixture
+def servers():
+    """Two stand-in hosts (different ports count as different hosts)"""
+    started = [start_server(), start_server()]
+    yield started
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def base_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+class PageScraper(AsyncBaseScraper):
+    """Fetches a fixed list of URLs"""
+
+    def __init__(self, urls, request_delay=0.0, max_concurrent_requests=10, per_host_concurrency=2):
+        super().__init__('Async Stand-In', urls[0], scraper_key='async_stand_in')
+        self.urls = urls
+        self.pages = None
+        self.request_delay = request_delay
+        self.max_concurrent_requests = max_concurrent_requests
+        self.per_host_concurrency = per_host_concurrency
+        self.max_retries = 0
+
+    def is_valid_url(self, url):
+        return True
+
+    async def scrape_async(self):
+        self.pages = await self.fetch_pages(self.urls)
+
+
+def arrival(server, path):
+    return next(at for arrived, at in server.arrivals if arrived == path)
+
+
+def test_fetch_pages_keeps_order_and_reports_failures(servers):
+    first, second = servers
+    urls = [base_url(first) + '/a', base_url(second) + '/missing', base_url(first) + '/b']
+    scraper = PageScraper(urls)
+
+    start = time.monotonic()
+    scraper.scrape()
+    elapsed = time.monotonic() - start
+
+    assert [page.title.string if page else None for page in scraper.pages] == ['/a', None, '/b']
+    # All three overlapped instead of running back to back
+    assert elapsed < 3 * RESPONSE_DELAY
+
+
+def test_requests_to_one_host_are_spaced_by_request_delay(servers):
+    server = servers[0]
+    scraper = PageScraper([base_url(server) + '/a', base_url(server) + '/b'],
+                          request_delay=0.3, per_host_concurrency=1)
+
+    scraper.scrape()
+
+    gap = abs(arrival(server, '/b') - arrival(server, '/a'))
+    assert gap >= RESPONSE_DELAY + 0.3
+
+
+def test_per_host_delay_does_not_hold_the_global_slot(servers):
+    first, second = servers
+    # One global slot: the second host can only start once the first request gives it back
+    scraper = PageScraper([base_url(first) + '/a', base_url(second) + '/b'],
+                          request_delay=1.0, max_concurrent_requests=1, per_host_concurrency=1)
+
+    scraper.scrape()
+
+    # Released after the response, not after the 1s per-host delay
+    assert arrival(second, '/b') - arrival(first, '/a') < RESPONSE_DELAY + 0.5
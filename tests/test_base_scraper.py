@@ -0,0 +1,56 @@
+"""BaseScraper visited-URL bookkeeping"""
+
+import pytest
+
+from scrapers.base_scraper import BaseScraper
+
+
+@pytest.fixture(autouse=True)
+def scraper_logs(tmp_path, monkeypatch):
+    """Keep the scraper's log file out of data/logs"""
+    monkeypatch.setattr('scrapers.base_scraper.LOGS_DIR', tmp_path)
+
+
+class ListingScraper(BaseScraper):
+    """Visits every link it is given, like the site scrapers do"""
+
+    def __init__(self):
+        super().__init__('Listing Stand-In', 'https://www.example.com/', scraper_key='listing_stand_in')
+        self.enable_date_filtering = False
+
+    def is_valid_url(self, url):
+        return url.startswith(('http://', 'https://'))
+
+    def scrape(self):
+        pass
+
+    def visit(self, url):
+        if not self.should_include_url(url):
+            return False
+        self.mark_visited(url)
+        return True
+
+
+@pytest.fixture
+def scraper():
+    return ListingScraper()
+
+
+def test_visited_url_is_not_included_again(scraper):
+    assert scraper.visit('https://www.example.com/Case/Foo?id=3')
+
+    assert not scraper.should_include_url('https://www.example.com/Case/Foo?id=3')
+
+
+def test_visited_check_ignores_scheme_www_and_tracking(scraper):
+    scraper.visit('https://www.example.com/Case/Foo?id=3&utm_source=mail')
+
+    assert not scraper.should_include_url('http://example.com/case/foo?id=3')
+    assert scraper.should_include_url('https://www.example.com/Case/Foo?id=4')
+
+
+def test_normalize_url_form_added_directly_still_counts(scraper):
+    url = 'https://www.example.com/Case/Foo?id=3'
+    scraper.visited_urls.add(scraper.normalize_url(url))
+
+    assert not scraper.should_include_url(url)
@@ -0,0 +1,31 @@
+"""Reading legacy data/scraped files for compaction"""
+
+import json
+
+from scripts.compact_scraped_data import load_items
+
+
+def write(tmp_path, payload):
+    path = tmp_path / 'clarkson_data_20260105_060000.json'
+    path.write_text(json.dumps(payload), encoding='utf-8')
+    return path
+
+
+def test_wrapper_with_empty_data_has_no_items(tmp_path):
+    path = write(tmp_path, {'scraper': 'clarkson', 'total_items': 0, 'data': []})
+
+    assert load_items(path) == []
+
+
+def test_wrapper_items_are_returned(tmp_path):
+    item = {'url': 'https://example.com/case', 'title': 'Case'}
+
+    assert load_items(write(tmp_path, {'scraper': 'clarkson', 'data': [item]})) == [item]
+    assert load_items(write(tmp_path, {'urls': [item]})) == [item]
+    assert load_items(write(tmp_path, [item, 'not a record'])) == [item]
+
+
+def test_bare_record_is_one_item(tmp_path):
+    item = {'url': 'https://example.com/case', 'title': 'Case'}
+
+    assert load_items(write(tmp_path, item)) == [item]
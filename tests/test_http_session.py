@@ -0,0 +1,28 @@
+"""Per-scraper sessions on the shared connection pool"""
+
+from core.http_session import get_http_adapter, new_http_session
+
+
+def test_sessions_do_not_share_headers_or_cookies():
+    first = new_http_session()
+    second = new_http_session()
+
+    first.headers['Authorization'] = 'Bearer secret'
+    first.cookies.set('session', 'abc')
+
+    assert 'Authorization' not in second.headers
+    assert not second.cookies
+
+
+def test_sessions_share_one_connection_pool(fixture_server):
+    first = new_http_session()
+    second = new_http_session()
+    assert first.get_adapter(fixture_server) is second.get_adapter(fixture_server) is get_http_adapter()
+
+    first.get(fixture_server + 'usatoday_feed/page.html').raise_for_status()
+    first.close()
+
+    # Closing one scraper's session leaves the pooled connection for the next
+    assert get_http_adapter().poolmanager.pools
+    second.get(fixture_server + 'usatoday_feed/page.html').raise_for_status()
+    second.close()
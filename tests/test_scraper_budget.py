@@ -0,0 +1,33 @@
+"""ScraperBudget limits built from registry entries"""
+
+from config.settings import BUDGET_CONFIG
+from core.scraper_budget import ScraperBudget
+
+
+def test_entry_without_budget_gets_the_defaults():
+    budget = ScraperBudget.from_registry({'name': 'No budget'})
+
+    assert budget.limits() == BUDGET_CONFIG['defaults']
+    assert budget.max_seconds and budget.max_requests and budget.max_bytes
+
+
+def test_zero_lifts_a_default_limit():
+    budget = ScraperBudget.from_registry({'budget': {'max_requests': 0}})
+
+    assert budget.max_requests is None
+    assert budget.max_seconds == BUDGET_CONFIG['defaults']['max_seconds']
+
+
+def test_configured_budget_falls_back_to_defaults():
+    budget = ScraperBudget.from_registry({'budget': {'max_requests': 5}})
+
+    assert budget.max_requests == 5
+    assert budget.max_seconds == BUDGET_CONFIG['defaults']['max_seconds']
+    assert budget.max_bytes == BUDGET_CONFIG['defaults']['max_bytes']
+
+
+def test_run_window_caps_entries_without_budget():
+    budget = ScraperBudget.from_registry({'name': 'No budget'}, max_seconds_cap=30)
+
+    assert budget.max_seconds == 30
+    assert budget.max_requests == BUDGET_CONFIG['defaults']['max_requests']
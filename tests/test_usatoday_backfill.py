@@ -0,0 +1,103 @@
+"""Backfill loop against a stand-in driver (no browser)"""
+
+import json
+
+import pytest
+
+from config.settings import USATODAY_CONFIG
+from core.breach_store import BreachStore
+from scrapers.legal_resources.usatoday_breaches import PageChangeTimeout, USATodayBreachesScraper
+
+TOTAL_PAGES = 6
+PAGE_BYTES = 2048
+
+
+def page_rows(page_number):
+    return [[f'Company {page_number}-{row}', 'CA', 'Healthcare Provider', 'Jan. 5, 2026', str(row + 1),
+             'Hacking/IT Incident', 'Network Server'] for row in range(2)]
+
+
+class StandInDriver:
+    """Shows one table page and logs one finished request per page load"""
+
+    def __init__(self):
+        self.page = None
+        self.log = []
+
+    def show(self, page_number):
+        self.page = page_number
+        self.log.append({'message': json.dumps({'message': {
+            'method': 'Network.loadingFinished', 'params': {'encodedDataLength': PAGE_BYTES}
+        }})})
+
+    def get_log(self, kind):
+        entries, self.log = self.log, []
+        return entries
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    scraper = USATodayBreachesScraper()
+    scraper.driver = StandInDriver()
+    scraper.failures = set()
+
+    def goto_page(driver, page_number):
+        driver.show(page_number)
+        return True
+
+    def click_next_page(driver, raise_on_timeout=False):
+        next_page = driver.page + 1
+        if next_page > TOTAL_PAGES:
+            return False
+        if next_page in scraper.failures:
+            scraper.failures.discard(next_page)
+            raise PageChangeTimeout(f"page {next_page} did not load")
+        driver.show(next_page)
+        return True
+
+    monkeypatch.setattr(scraper, 'acquire_driver', lambda: scraper.driver)
+    monkeypatch.setattr(scraper, 'release_driver', lambda driver, healthy=True: None)
+    monkeypatch.setattr(scraper, 'goto_page', goto_page)
+    monkeypatch.setattr(scraper, 'click_next_page', click_next_page)
+    monkeypatch.setattr(scraper, 'extract_rows', lambda driver: page_rows(driver.page))
+    return scraper
+
+
+def run_backfill(scraper, tmp_path):
+    store = BreachStore(tmp_path / 'breaches.jsonl')
+    checkpoint = scraper.backfill(checkpoint_file=tmp_path / 'checkpoint.json', store=store)
+    return checkpoint, store
+
+
+def test_scattered_failures_do_not_add_up(scraper, tmp_path, monkeypatch):
+    monkeypatch.setitem(USATODAY_CONFIG, 'backfill_max_retries', 1)
+    scraper.failures = {2, 4, 6}
+
+    checkpoint, store = run_backfill(scraper, tmp_path)
+
+    assert checkpoint['completed']
+    assert checkpoint['last_completed_page'] == TOTAL_PAGES
+    assert len(store) == 2 * TOTAL_PAGES
+
+
+def test_failures_in_a_row_still_stop_the_backfill(scraper, tmp_path, monkeypatch):
+    monkeypatch.setitem(USATODAY_CONFIG, 'backfill_max_retries', 1)
+    failures = iter(range(2))
+
+    def extract_rows(driver):
+        if driver.page == 3 and next(failures, None) is not None:
+            raise PageChangeTimeout("page 3 did not settle")
+        return page_rows(driver.page)
+
+    monkeypatch.setattr(scraper, 'extract_rows', extract_rows)
+
+    with pytest.raises(PageChangeTimeout):
+        run_backfill(scraper, tmp_path)
+
+
+def test_performance_log_is_drained_every_page(scraper, tmp_path):
+    run_backfill(scraper, tmp_path)
+
+    assert scraper.driver.log == []
+    assert scraper.network_stats.requests == TOTAL_PAGES
+    assert scraper.network_stats.bytes_received == TOTAL_PAGES * PAGE_BYTES
@@ -0,0 +1,101 @@
+"""USA Today data feed backend against recorded fixtures served over HTTP"""
+
+import pytest
+
+from scrapers.legal_resources.usatoday_breaches import USATodayBreachesScraper
+from core.scraper_budget import ScraperBudget
+from scrapers.legal_resources.usatoday_feed import FeedError, USATodayFeedBackend
+
+# The same breaches as the table renders them
+TABLE_ROWS = [
+    ['Acme Health', 'CA', 'Healthcare Provider', 'Jan. 5, 2026', '12,345',
+     'Hacking/IT Incident', 'Network Server'],
+    ['Blue River Clinic', 'TX', 'Health Plan', 'Sept. 30, 2025', '987',
+     'Unauthorized Access/Disclosure', 'Email'],
+    ['Cedar Labs', 'NY', 'Business Associate', 'March 14, 2025', '1,500,000',
+     'Hacking/IT Incident', 'Network Server'],
+]
+
+
+@pytest.fixture
+def page_url(fixture_server):
+    return fixture_server + 'usatoday_feed/page.html'
+
+
+def make_backend(page_url, feed_url=''):
+    backend = USATodayFeedBackend(page_url, 'test', feed_url=feed_url)
+    backend.max_retries = 0
+    return backend
+
+
+def test_discovery_skips_datasets_without_breach_columns(page_url):
+    backend = make_backend(page_url)
+
+    rows = backend.fetch_rows()
+
+    assert backend.feed_url.endswith('/usatoday_feed/data/breaches.json')
+    assert rows == TABLE_ROWS
+
+
+def test_csv_feed_matches_table_text(page_url, fixture_server):
+    backend = make_backend(page_url, fixture_server + 'usatoday_feed/data/breaches.csv')
+
+    assert backend.fetch_rows() == TABLE_ROWS
+
+
+def test_feed_with_generic_columns_is_refused(page_url, fixture_server):
+    backend = make_backend(page_url, fixture_server + 'usatoday_feed/static/share-counts.json')
+
+    with pytest.raises(FeedError, match='missing columns'):
+        backend.fetch_rows()
+
+
+def test_headerless_rows_are_refused(page_url, fixture_server):
+    backend = make_backend(page_url, fixture_server + 'usatoday_feed/data/headerless.json')
+
+    with pytest.raises(FeedError, match='no header'):
+        backend.fetch_rows()
+
+
+def test_scraper_uses_feed_whose_hashes_match_the_table(page_url):
+    scraper = USATodayBreachesScraper()
+    scraper.base_url = page_url
+    known = {scraper.create_breach_hash(row[0], row[1], row[3], row[4]) for row in TABLE_ROWS}
+
+    results = scraper.scrape_feed(days_back=None, known_hashes=known)
+
+    assert scraper.backend_used == 'feed'
+    assert {breach['breach_hash'] for breach in results} == known
+
+
+def test_scraper_refuses_feed_whose_hashes_differ(page_url):
+    scraper = USATodayBreachesScraper()
+    scraper.base_url = page_url
+    # Hashes of the same breaches with dates and counts formatted differently
+    known = {
+        scraper.create_breach_hash('Acme Health', 'CA', '01/05/2026', '12345'),
+        scraper.create_breach_hash('Blue River Clinic', 'TX', '09/30/2025', '987'),
+    }
+
+    assert scraper.scrape_feed(days_back=None, known_hashes=known) is None
+
+
+def test_feed_requests_are_charged_to_the_budget(page_url):
+    backend = make_backend(page_url)
+    backend.budget = ScraperBudget()
+
+    backend.fetch_rows()
+
+    # The page, the share-counts file it skips, then the breach dataset
+    assert backend.budget.requests == 3
+    assert backend.budget.bytes > 0
+
+
+def test_spent_budget_stops_the_feed_without_falling_back(page_url):
+    scraper = USATodayBreachesScraper()
+    scraper.base_url = page_url
+    scraper.budget = ScraperBudget(max_requests=1)
+
+    assert scraper.scrape_feed(days_back=None) == []
+    assert scraper.stop_reason == 'budget'
+    assert scraper.budget.requests == 1
@@ -0,0 +1,58 @@
+"""Replay mode against a recorded snapshot, with no browser or network"""
+
+from pathlib import Path
+
+import pytest
+
+from scrapers.legal_resources.usatoday_breaches import USATodayBreachesScraper
+
+SNAPSHOT_DIR = Path(__file__).parent / 'fixtures' / 'usatoday_snapshots' / '20261016_204444'
+
+# (company, state, breach date, people affected) in table order, duplicates dropped
+EXPECTED = [
+    ('Acme Health', 'CA', '2026-01-05', '12,345'),
+    ('Blue River Clinic', 'TX', '2025-09-30', '987'),
+    ('Cedar\nLabs', 'NY', '2025-03-14', '1,500,000'),
+]
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    scraper = USATodayBreachesScraper()
+
+    def no_browser(*args, **kwargs):
+        raise AssertionError("replay must not start a browser")
+
+    monkeypatch.setattr(scraper, 'acquire_driver', no_browser)
+    monkeypatch.setattr(scraper, 'setup_driver', no_browser)
+    return scraper
+
+
+def test_replay_parses_recorded_pages(scraper):
+    results = scraper.scrape_replay(days_back=None, max_pages=None, incremental=False, snapshot_dir=SNAPSHOT_DIR)
+
+    assert [
+        (breach['company'], breach['state'], breach['date'], breach['people_affected']) for breach in results
+    ] == EXPECTED
+    assert [breach['breach_hash'] for breach in results] == [
+        scraper.create_breach_hash(company, state, date, people)
+        for company, state, date, people in [
+            ('Acme Health', 'CA', 'Jan. 5, 2026', '12,345'),
+            ('Blue River Clinic', 'TX', 'Sept. 30, 2025', '987'),
+            ('Cedar\nLabs', 'NY', 'March 14, 2025', '1,500,000'),
+        ]
+    ]
+    assert scraper.backend_used == 'replay'
+    assert scraper.stop_reason == 'no_more_snapshots'
+
+
+def test_replay_stops_at_max_pages(scraper):
+    results = scraper.scrape_replay(days_back=None, max_pages=1, incremental=False, snapshot_dir=SNAPSHOT_DIR)
+
+    assert [breach['company'] for breach in results] == ['Acme Health', 'Blue River Clinic']
+    assert scraper.stop_reason == 'max_pages'
+
+
+def test_replay_without_snapshots(scraper, tmp_path):
+    assert scraper.scrape_replay(snapshot_dir=tmp_path / 'missing') == []
+    assert scraper.stop_reason == 'no_snapshots'
@@ -0,0 +1,30 @@
+"""Cell text from the lxml extractor matches what the browser's innerText gives"""
+
+from scrapers.legal_resources.usatoday_breaches import USATodayBreachesScraper
+
+scraper = USATodayBreachesScraper()
+
+
+def parse(cells_html):
+    html = f"<table><tbody><tr>{cells_html}</tr></tbody></table>"
+    return scraper.parse_rows_from_html(html)[0]
+
+
+def test_line_breaks_and_blocks_become_newlines():
+    assert parse("<td>Acme<br>Health</td><td><div>Health</div><div>Plan</div></td>") == [
+        'Acme\nHealth', 'Health\nPlan'
+    ]
+
+
+def test_hidden_and_unrendered_nodes_are_skipped():
+    cells = parse(
+        '<td>CA<span style="display: none">XX</span></td>'
+        '<td><span hidden>9</span>1,000<script>var a = 1;</script></td>'
+    )
+    assert cells == ['CA', '1,000']
+
+
+def test_whitespace_is_normalized_like_the_other_extractors():
+    cells = parse("<td>  Jan.&nbsp;5,\n   2026 </td>")
+    assert cells == [scraper.normalize_cell_text('Jan. 5,\n2026')]
+    assert scraper.normalize_cell_text('  Acme \n\n Health  ') == 'Acme\nHealth'
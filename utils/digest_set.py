@@ -0,0 +1,190 @@
+"""
+Digest Set
+Compact set of 8-byte URL digests for duplicate detection.
+"""
+
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+
+
+# magic, format version, generation, count (24 bytes keeps the digests 8-byte aligned)
+HEADER = struct.Struct('<4sIQQ')
+MAGIC = b'DGST'
+FORMAT_VERSION = 1
+
+
+def url_digest(url):
+    """
+    64-bit blake2b digest of a URL.
+
+    Args:
+        url (str): URL (or any dedupe key)
+
+    Returns:
+        int: Digest as an unsigned 64-bit integer
+    """
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), 'little')
+
+
+class DigestSet:
+    """
+    Set of 64-bit digests stored as a sorted array('Q') plus a small
+    unsorted buffer of recent additions.
+
+    Each entry costs 8 bytes (a Python set of md5 hex strings costs well over
+    100), lookups are a binary search, and a saved set can be memory-mapped
+    back without parsing. The collision probability stays negligible for
+    millions of URLs (about n^2 / 2^65).
+    """
+
+    def __init__(self, digests=None):
+        """
+        Args:
+            digests: Iterable of integer digests to start with (optional)
+        """
+        self._sorted = array('Q', sorted(set(digests or ())))
+        self._pending = set()
+        self._mmap = None
+        self.generation = 0
+
+    def __len__(self):
+        return len(self._sorted) + len(self._pending)
+
+    def __iter__(self):
+        """Iterate over the integer digests"""
+        yield from self._sorted
+        yield from self._pending
+
+    def __contains__(self, url):
+        return self.contains_digest(url_digest(url))
+
+    def contains_digest(self, digest):
+        """Check whether an integer digest is present"""
+        if digest in self._pending:
+            return True
+        index = bisect.bisect_left(self._sorted, digest)
+        return index < len(self._sorted) and self._sorted[index] == digest
+
+    def add(self, url):
+        """Add a URL"""
+        self.add_digest(url_digest(url))
+
+    def add_digest(self, digest):
+        """Add an integer digest"""
+        if not self.contains_digest(digest):
+            self._pending.add(digest)
+
+    def update(self, urls):
+        """Add several URLs"""
+        for url in urls:
+            self.add(url)
+
+    def update_digests(self, digests):
+        """Add several integer digests"""
+        for digest in digests:
+            self.add_digest(digest)
+
+    def compact(self):
+        """Merge buffered additions into the sorted array"""
+        if not self._pending:
+            return
+        merged = array('Q', self._sorted)
+        merged.extend(self._pending)
+        self._sorted = array('Q', sorted(merged))
+        self._pending = set()
+        self._close_mmap()
+
+    def save(self, filepath, generation=None):
+        """
+        Write the set to a binary file atomically.
+
+        Args:
+            filepath: Destination file
+            generation (int): Caller-defined version stamp stored in the header
+        """
+        self.compact()
+        if generation is not None:
+            self.generation = generation
+
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        data = array('Q', self._sorted)
+        if sys.byteorder != 'little':
+            data.byteswap()
+
+        fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, FORMAT_VERSION, self.generation, len(data)))
+                data.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        Memory-map a file written by save().
+
+        Lookups read the mapped file directly, so loading costs the same
+        whatever the number of digests.
+
+        Args:
+            filepath: File written by save()
+
+        Returns:
+            DigestSet: Loaded set
+
+        Raises:
+            ValueError: If the file is not a digest set
+        """
+        digest_set = cls()
+        with open(filepath, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{filepath} is not a digest set file")
+            magic, version, generation, count = HEADER.unpack(header)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{filepath} is not a digest set file")
+            if os.path.getsize(filepath) != HEADER.size + count * 8:
+                raise ValueError(f"{filepath} is truncated")
+
+            digest_set.generation = generation
+            if not count:
+                return digest_set
+
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if sys.byteorder == 'little':
+            digest_set._mmap = mapped
+            digest_set._sorted = memoryview(mapped)[HEADER.size:].cast('Q')
+        else:
+            data = array('Q')
+            data.frombytes(mapped[HEADER.size:])
+            data.byteswap()
+            mapped.close()
+            digest_set._sorted = data
+        return digest_set
+
+    def _close_mmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self):
+        """Release the memory map (the set keeps working from a copy)"""
+        if self._mmap is not None:
+            self._sorted = array('Q', self._sorted)
+            self._close_mmap()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Selenium Driver Utilities
+Builds headless Chrome drivers for browser-based scrapers, with an optional
+lean profile that skips images, fonts, media and ad/analytics requests.
+"""
+
+import json
+import logging
+from typing import Dict, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from config.settings import DRIVER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def build_chrome_options(profile: Optional[str] = None, user_agent: str = DEFAULT_USER_AGENT):
+    """
+    Build Chrome options for a driver profile.
+    
+    Args:
+        profile (str): 'lean' (eager load, heavy resources blocked) or 'full'
+        user_agent (str): User agent string
+        
+    Returns:
+        Options: Chrome options
+    """
+    profile = profile or DRIVER_CONFIG['profile']
+    
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument(f'user-agent={user_agent}')
+    
+    # Performance log carries the Network events used for byte accounting
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    
+    if profile == 'lean':
+        # Return control once the DOM is ready instead of after every subresource
+        chrome_options.page_load_strategy = DRIVER_CONFIG['page_load_strategy']
+        
+        if DRIVER_CONFIG['block_images']:
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+            })
+    
+    return chrome_options
+
+
+def get_blocked_url_patterns() -> List[str]:
+    """
+    Build the URL patterns passed to Network.setBlockedURLs.
+    
+    Domains on the allow-list are never blocked, even when they appear on
+    the blocked domain list.
+    
+    Returns:
+        List[str]: Wildcard URL patterns
+    """
+    allowed = [domain.lower() for domain in DRIVER_CONFIG['allowed_domains']]
+    
+    patterns = list(DRIVER_CONFIG['blocked_resource_patterns'])
+    for domain in DRIVER_CONFIG['blocked_domains']:
+        domain = domain.lower()
+        if any(domain == ok or domain.endswith('.' + ok) for ok in allowed):
+            continue
+        patterns.append(f'*://{domain}/*')
+        patterns.append(f'*://*.{domain}/*')
+    
+    return patterns
+
+
+def apply_resource_blocking(driver) -> bool:
+    """
+    Block heavy and third-party requests through the DevTools protocol.
+    
+    Args:
+        driver: Chrome WebDriver
+        
+    Returns:
+        bool: True if the blocking rules were installed
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': get_blocked_url_patterns()})
+        return True
+    except Exception as e:
+        logger.warning(f"Could not install resource blocking: {e}")
+        return False
+
+
+def create_chrome_driver(profile: Optional[str] = None, user_agent: str = DEFAULT_USER_AGENT):
+    """
+    Create a headless Chrome driver for the given profile.
+    
+    Args:
+        profile (str): 'lean' or 'full' (default from DRIVER_CONFIG)
+        user_agent (str): User agent string
+        
+    Returns:
+        WebDriver: Chrome driver
+    """
+    profile = profile or DRIVER_CONFIG['profile']
+    driver = webdriver.Chrome(options=build_chrome_options(profile, user_agent))
+    
+    if profile == 'lean':
+        apply_resource_blocking(driver)
+    
+    return driver
+
+
+class NetworkStats:
+    """
+    Accumulates network usage for a driver from its performance log.
+    Call collect() after each page; the log is drained on every read.
+    """
+    
+    def __init__(self):
+        self.requests = 0
+        self.bytes_received = 0
+        self.blocked = 0
+    
+    def collect(self, driver):
+        """Read and count the Network events logged since the last call."""
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return
+        
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError, TypeError):
+                continue
+            
+            method = message.get('method')
+            params = message.get('params', {})
+            
+            if method == 'Network.loadingFinished':
+                self.requests += 1
+                self.bytes_received += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                self.blocked += 1
+    
+    def add(self, other: 'NetworkStats'):
+        """Fold another driver's counters into this one."""
+        self.requests += other.requests
+        self.bytes_received += other.bytes_received
+        self.blocked += other.blocked
+    
+    def estimated_bytes_saved(self) -> int:
+        """Blocked requests times the average size of the requests that loaded."""
+        if not self.requests:
+            return 0
+        return int(self.blocked * self.bytes_received / self.requests)
+    
+    def to_dict(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'bytes_received': self.bytes_received,
+            'blocked_requests': self.blocked,
+            'estimated_bytes_saved': self.estimated_bytes_saved(),
+        }
+    
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, {self.bytes_received / 1024:.1f} KB received, "
+            f"{self.blocked} blocked (~{self.estimated_bytes_saved() / 1024:.1f} KB saved)"
+        )
@@ -5,8 +5,17 @@ Helper functions for file operations (JSON, CSV, etc.)
 """
 
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, List, Dict
+from typing import Any, Callable, List, Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 
 def save_json(data: Any, filepath: Path, indent: int = 2):
@@ -22,6 +31,90 @@ def save_json(data: Any, filepath: Path, indent: int = 2):
         json.dump(data, f, indent=indent, ensure_ascii=False)
 
 
+def atomic_write_json(data: Any, filepath: Path, indent: int = 2):
+    """
+    Save data to JSON file without ever leaving a half-written file.
+    
+    Writes to a temporary file in the same directory, flushes it to disk
+    and renames it over the target.
+    
+    Args:
+        data: Data to save
+        filepath (Path): File path
+        indent (int): JSON indentation (None for compact output)
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def file_lock(filepath: Path):
+    """
+    Hold an exclusive inter-process lock for a state file.
+    
+    The lock lives on a '<name>.lock' file next to the target, so the target
+    itself can still be replaced atomically while the lock is held. Blocks
+    until the lock is free.
+    
+    Args:
+        filepath (Path): State file to lock
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = filepath.with_name(filepath.name + '.lock')
+    
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def update_json(filepath: Path, merge: Callable[[Any], Any], default: Any = None, indent: int = 2) -> Any:
+    """
+    Read-modify-write a shared JSON state file safely.
+    
+    Under file_lock, re-reads the current file contents, passes them to
+    merge() and atomically writes the result, so concurrent runners merge
+    their changes instead of the last writer winning.
+    
+    Args:
+        filepath (Path): State file
+        merge (callable): Takes the on-disk data (or default) and returns the data to write
+        default: Value passed to merge() when the file is missing or unreadable
+        indent (int): JSON indentation
+        
+    Returns:
+        The data written
+    """
+    filepath = Path(filepath)
+    with file_lock(filepath):
+        data = merge(load_json(filepath, default=default))
+        atomic_write_json(data, filepath, indent=indent)
+    return data
+
+
 def load_json(filepath: Path, default: Any = None) -> Any:
     """
     Load data from JSON file.
@@ -0,0 +1,171 @@
+"""
+Streaming JSON Key Extraction
+Pulls URL/key fields out of large scraped JSON files one record at a
+time, without loading the whole document.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterator
+
+
+CHUNK_SIZE = 64 * 1024
+
+# Keys of a top-level object that hold the record list
+CONTAINER_KEYS = ('sent_urls', 'data', 'urls')
+
+WHITESPACE = ' \t\n\r'
+
+_decoder = json.JSONDecoder()
+
+
+def record_key(item):
+    """URL of a record: a dict's url/link/href or the string itself."""
+    if isinstance(item, dict):
+        return item.get('url') or item.get('link') or item.get('href')
+    if isinstance(item, str):
+        return item
+    return None
+
+
+class _Reader:
+    """Chunked reader with a sliding buffer that raw_decode can work on."""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Read another chunk; returns False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has been consumed so the buffer stays bounded
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self, skip=WHITESPACE):
+        """Next character after skipping the given characters ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char, skip=WHITESPACE):
+        if self.peek(skip) != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buf, self.pos)
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number at the buffer's end may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(reader) -> Iterator:
+    """Yield the elements of the array starting at the reader's position."""
+    reader.expect('[')
+    if reader.peek() == ']':
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == ']':
+            return
+        if separator != ',':
+            raise json.JSONDecodeError("Expecting ',' or ']'", reader.buf, reader.pos - 1)
+
+
+def iter_json_keys(filepath, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Stream the record keys (URLs) out of a scraped JSON file.
+
+    Handles the shapes the scrapers and trackers have written over time: a
+    top-level list of URLs or records, a dict with a 'sent_urls'/'data'/'urls'
+    list, a single record dict or a tracking dict keyed by URL. Only one record is held in
+    memory at a time, so peak memory does not grow with file size.
+
+    Args:
+        filepath: JSON file
+        chunk_size (int): Characters read per chunk
+
+    Yields:
+        str: Record keys
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(Path(filepath), 'r', encoding='utf-8') as f:
+        reader = _Reader(f, chunk_size)
+        first = reader.peek()
+
+        if first == '[':
+            for item in _iter_array(reader):
+                key = record_key(item)
+                if key:
+                    yield key
+            return
+
+        if first != '{':
+            # Scalars and empty files go through the regular parser (and its errors)
+            reader.value()
+            return
+
+        reader.pos += 1
+        fields = {}
+        tracking_keys = []
+        if reader.peek() == '}':
+            return
+
+        while True:
+            name = reader.value()
+            reader.expect(':')
+
+            if name in CONTAINER_KEYS and reader.peek() == '[':
+                for item in _iter_array(reader):
+                    key = record_key(item)
+                    if key:
+                        yield key
+                return
+
+            value = reader.value()
+            if name in ('url', 'link', 'href'):
+                fields[name] = value
+            elif isinstance(name, str) and name.startswith('http'):
+                tracking_keys.append(name)
+
+            separator = reader.peek()
+            reader.pos += 1
+            if separator == '}':
+                break
+            if separator != ',':
+                raise json.JSONDecodeError("Expecting ',' or '}'", reader.buf, reader.pos - 1)
+
+        key = record_key(fields)
+        if key:
+            yield key
+        else:
+            yield from tracking_keys
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Page Snapshot Utilities
+Record rendered pages from Selenium scrapers to disk and replay them later,
+so the parsing path can run without a browser or network.
+"""
+
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from config.settings import SNAPSHOT_CONFIG
+from utils.file_utils import atomic_write_json, load_json
+
+
+MANIFEST_NAME = 'manifest.json'
+
+
+class SnapshotRecorder:
+    """
+    Writes one HTML file per page plus a manifest with page metadata.
+    Each recording run gets its own timestamped directory.
+    """
+    
+    def __init__(self, source_key: str, run_dir: Optional[Path] = None):
+        """
+        Initialize the recorder.
+        
+        Args:
+            source_key (str): Scraper key, used as the snapshot subdirectory
+            run_dir (Path): Directory for this run (auto-generated if None)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.run_dir = Path(run_dir or Path(SNAPSHOT_CONFIG['dir']) / source_key / timestamp)
+        self.manifest = {
+            'source': source_key,
+            'recorded_at': datetime.now().isoformat(),
+            'pages': [],
+        }
+        self._lock = threading.Lock()
+    
+    def record(self, page_number: int, html: str, url: str = '', **metadata) -> Path:
+        """
+        Save one page's HTML and add it to the manifest.
+        
+        Args:
+            page_number (int): 1-based page number
+            html (str): driver.page_source
+            url (str): URL the page was loaded from
+            **metadata: Extra fields stored with the page (e.g. row_count)
+            
+        Returns:
+            Path: Path to the saved HTML file
+        """
+        filename = f"page_{page_number:04d}.html"
+        encoded = html.encode('utf-8')
+        
+        entry = {
+            'page_number': page_number,
+            'file': filename,
+            'url': url,
+            'captured_at': datetime.now().isoformat(),
+            'bytes': len(encoded),
+            'sha1': hashlib.sha1(encoded).hexdigest(),
+        }
+        entry.update(metadata)
+        
+        # Shards of one run record from several threads
+        with self._lock:
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            (self.run_dir / filename).write_bytes(encoded)
+            
+            self.manifest['pages'] = [p for p in self.manifest['pages'] if p['page_number'] != page_number]
+            self.manifest['pages'].append(entry)
+            self.manifest['pages'].sort(key=lambda p: p['page_number'])
+            atomic_write_json(self.manifest, self.run_dir / MANIFEST_NAME)
+        
+        return self.run_dir / filename
+
+
+def latest_snapshot_dir(source_key: str) -> Optional[Path]:
+    """
+    Find the most recent recording run for a source.
+    
+    Args:
+        source_key (str): Scraper key
+        
+    Returns:
+        Path: Run directory or None if nothing was recorded
+    """
+    source_dir = Path(SNAPSHOT_CONFIG['dir']) / source_key
+    if not source_dir.exists():
+        return None
+    
+    runs = sorted(p for p in source_dir.iterdir() if (p / MANIFEST_NAME).exists())
+    return runs[-1] if runs else None
+
+
+def iter_snapshots(run_dir: Path) -> Iterator[Tuple[Dict, str]]:
+    """
+    Replay recorded pages in page order.
+    
+    Args:
+        run_dir (Path): Recording run directory
+        
+    Yields:
+        tuple: (page metadata, HTML)
+    """
+    run_dir = Path(run_dir)
+    manifest = load_json(run_dir / MANIFEST_NAME, default=None)
+    
+    if manifest is None:
+        # Loose HTML files without a manifest (e.g. a hand-saved page_source)
+        pages = [{'page_number': i, 'file': p.name} for i, p in enumerate(sorted(run_dir.glob('*.html')), 1)]
+    else:
+        pages = sorted(manifest.get('pages', []), key=lambda p: p['page_number'])
+    
+    for page in pages:
+        path = run_dir / page['file']
+        if path.exists():
+            yield page, path.read_text(encoding='utf-8')
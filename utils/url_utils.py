@@ -5,36 +5,128 @@ Helper functions for URL validation, normalization, and manipulation.
 """
 
 import re
-from urllib.parse import urlparse, urljoin, urlunparse
+from urllib.parse import urlparse, urljoin, urlunparse, parse_qsl, urlencode
 
+from config.settings import URL_CANONICAL_CONFIG
 
-def normalize_url(url: str) -> str:
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def _get_domain_rule(host: str) -> dict:
+    """Find the URL_CANONICAL_CONFIG domain rule for a host (subdomains included)."""
+    rules = URL_CANONICAL_CONFIG['domain_rules']
+    host = host[4:] if host.startswith('www.') else host
+    
+    while host:
+        if host in rules:
+            return rules[host]
+        if '.' not in host:
+            break
+        host = host.split('.', 1)[1]
+    return {}
+
+
+def _is_tracking_param(name: str) -> bool:
+    """Check a query parameter name against the configured tracking parameters."""
+    name = name.lower()
+    for pattern in URL_CANONICAL_CONFIG['tracking_params']:
+        if pattern.endswith('*'):
+            if name.startswith(pattern[:-1]):
+                return True
+        elif name == pattern:
+            return True
+    return False
+
+
+def canonicalize_url(url: str) -> str:
     """
-    Normalize URL for consistent comparison.
+    Canonical form of a URL that still points at the same page.
+    
+    Lowercases scheme and host, drops default ports, empty path segments
+    and the trailing slash, removes tracking parameters (or everything but
+    a domain's keep_params), sorts the remaining parameters and drops the
+    fragment unless the domain rule keeps it.
     
     Args:
-        url (str): URL to normalize
+        url (str): URL to canonicalize
         
     Returns:
-        str: Normalized URL
+        str: Canonical URL
     """
     if not url:
         return ""
     
+    url = url.strip()
     try:
         parsed = urlparse(url)
-        # Remove fragment, query params, and trailing slash
-        normalized = urlunparse((
-            parsed.scheme.lower(),
-            parsed.netloc.lower(),
-            parsed.path.rstrip('/'),
-            '',  # params
-            '',  # query
-            ''   # fragment
-        ))
-        return normalized
+        scheme = parsed.scheme.lower()
+        host = (parsed.hostname or '').rstrip('.')
+        if not scheme or not host:
+            return url.rstrip('/')
+        
+        netloc = host
+        if parsed.port and parsed.port != DEFAULT_PORTS.get(scheme):
+            netloc = f"{host}:{parsed.port}"
+        
+        rule = _get_domain_rule(host)
+        keep_params = rule.get('keep_params')
+        
+        query = [
+            (name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if (name in keep_params if keep_params is not None else not _is_tracking_param(name))
+        ]
+        
+        path = re.sub(r'/{2,}', '/', parsed.path).rstrip('/')
+        fragment = parsed.fragment if rule.get('keep_fragment') else ''
+        
+        return urlunparse((scheme, netloc, path, '', urlencode(sorted(query)), fragment))
     except Exception:
-        return url.lower().rstrip('/')
+        return url.rstrip('/')
+
+
+def canonical_key(url: str) -> str:
+    """
+    Dedupe key for a URL.
+    
+    Two URLs with the same key are treated as the same content: on top of
+    canonicalize_url this ignores http vs https, a leading 'www.' and path
+    case.
+    
+    Args:
+        url (str): URL
+        
+    Returns:
+        str: Canonical key (empty string for empty input)
+    """
+    canonical = canonicalize_url(url)
+    if not canonical:
+        return ""
+    
+    parsed = urlparse(canonical)
+    if not parsed.netloc:
+        return canonical.lower()
+    
+    host = parsed.netloc[4:] if parsed.netloc.startswith('www.') else parsed.netloc
+    key = f"{host}{parsed.path.lower()}"
+    if parsed.query:
+        key += f"?{parsed.query}"
+    if parsed.fragment:
+        key += f"#{parsed.fragment}"
+    return key
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize URL for consistent comparison.
+    
+    Args:
+        url (str): URL to normalize
+        
+    Returns:
+        str: Normalized URL (see canonicalize_url; use canonical_key to dedupe)
+    """
+    return canonicalize_url(url)
 
 
 def is_valid_url(url: str) -> bool:
@@ -96,22 +188,14 @@ def clean_url(url: str) -> str:
         url (str): URL to clean
         
     Returns:
-        str: Cleaned URL
+        str: Cleaned URL (canonicalize_url without any query string)
     """
     if not url:
         return ""
     
     try:
-        parsed = urlparse(url)
-        # Keep only essential parts
-        cleaned = urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            '',  # params
-            '',  # query (remove tracking)
-            ''   # fragment
-        ))
-        return cleaned.rstrip('/')
+        parsed = urlparse(url.strip())
+        url = urlunparse((parsed.scheme, parsed.netloc, parsed.path, '', '', ''))
     except Exception:
-        return url
\ No newline at end of file
+        pass
+    return canonicalize_url(url)
\ No newline at end of file